@@ -15,6 +15,8 @@ from services.api_client import (
     AuthenticationError,
     ApiClientError
 )
+from services.accounts_service import accounts_service
+from services.local_ledger import local_ledger
 from config.settings import api_config
 
 
@@ -217,6 +219,13 @@ class AuthenticationComponent:
         try:
             username = st.session_state.get('username', 'usuário')
 
+            # Libera o espelho local e o razão de saldos do usuário
+            if st.session_state.get('username'):
+                accounts_service.release_balance_ledger(
+                    st.session_state['username']
+                )
+                local_ledger.release(st.session_state['username'])
+
             # Remove dados de autenticação
             api_client.logout()
 
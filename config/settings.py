@@ -6,7 +6,7 @@ da aplicação Streamlit integrada com a expenselit-api.
 """
 
 import os
-from typing import Dict
+from typing import Dict, List, Tuple
 # Any
 from pathlib import Path
 from dotenv import load_dotenv
@@ -28,6 +28,78 @@ class ApiConfig:
     API_VERSION: str = "v1"
     API_BASE_PATH: str = f"/api/{API_VERSION}"
 
+    # Pool de conexões HTTP do processo, compartilhado entre as sessões
+    # (POOL_MAXSIZE limita as conexões keep-alive reaproveitadas por host)
+    POOL_CONNECTIONS: int = int(os.getenv("API_POOL_CONNECTIONS", "10"))
+    POOL_MAXSIZE: int = int(os.getenv("API_POOL_MAXSIZE", "100"))
+    POOL_BLOCK: bool = os.getenv("API_POOL_BLOCK", "false") == "true"
+
+    # Timeouts de conexão e leitura em segundos
+    CONNECT_TIMEOUT: float = float(os.getenv("API_CONNECT_TIMEOUT", "3.05"))
+    READ_TIMEOUT: float = float(os.getenv("API_READ_TIMEOUT", "30"))
+
+    # Retentativas (apenas métodos idempotentes) com backoff exponencial
+    MAX_RETRIES: int = int(os.getenv("API_MAX_RETRIES", "3"))
+    RETRY_BACKOFF_FACTOR: float = float(
+        os.getenv("API_RETRY_BACKOFF_FACTOR", "0.5")
+    )
+    RETRY_BACKOFF_JITTER: float = float(
+        os.getenv("API_RETRY_BACKOFF_JITTER", "0.3")
+    )
+    RETRY_STATUS_CODES: List[int] = [429, 502, 503, 504]
+    RETRY_METHODS: List[str] = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+
+    # Número máximo de requisições simultâneas no carregamento paralelo
+    CONCURRENT_WORKERS: int = int(os.getenv("API_CONCURRENT_WORKERS", "8"))
+
+    # Requisições simultâneas do cliente assíncrono (AsyncApiClient)
+    ASYNC_WORKERS: int = int(os.getenv("API_ASYNC_WORKERS", "32"))
+
+    # Threads dedicadas à pré-busca da próxima página de listagens
+    PREFETCH_WORKERS: int = int(os.getenv("API_PREFETCH_WORKERS", "4"))
+
+    # Cache de respostas GET por sessão (tempos em segundos)
+    CACHE_ENABLED: bool = os.getenv("API_CACHE_ENABLED", "true") == "true"
+    CACHE_MAX_ENTRIES: int = int(os.getenv("API_CACHE_MAX_ENTRIES", "128"))
+    CACHE_DEFAULT_TTL: int = int(os.getenv("API_CACHE_DEFAULT_TTL", "30"))
+
+    # Tempo de vida por recurso (primeiro segmento do endpoint)
+    CACHE_RESOURCE_TTLS: Dict[str, int] = {
+        "accounts": 120,
+        "credit-cards": 120,
+        "members": 300,
+        "user": 300
+    }
+
+    # Recursos cujo cache também é invalidado quando outro é alterado
+    # (saldos e limites são recalculados pela API a cada movimentação)
+    CACHE_DEPENDENCIES: Dict[str, List[str]] = {
+        "expenses": ["accounts", "credit-cards"],
+        "revenues": ["accounts"],
+        "transfers": ["accounts"],
+        "loans": ["accounts"]
+    }
+
+    # Espelho local das movimentações (sincronização incremental)
+    LEDGER_ENABLED: bool = os.getenv("API_LEDGER_ENABLED", "true") == "true"
+    LEDGER_SYNC_INTERVAL: int = int(
+        os.getenv("API_LEDGER_SYNC_INTERVAL", "30")
+    )
+    # Sincronização completa periódica, que também remove do espelho os
+    # registros excluídos fora desta aplicação
+    LEDGER_FULL_SYNC_INTERVAL: int = int(
+        os.getenv("API_LEDGER_FULL_SYNC_INTERVAL", "3600")
+    )
+    # Filtro da API para registros alterados desde a última sincronização
+    LEDGER_UPDATED_SINCE_PARAM: str = os.getenv(
+        "API_LEDGER_UPDATED_SINCE_PARAM", "updated_at__gte"
+    )
+    # Intervalo mínimo entre gravações em disco das alterações feitas
+    # pela aplicação (as pendentes são gravadas na sincronização seguinte)
+    LEDGER_PERSIST_INTERVAL: int = int(
+        os.getenv("API_LEDGER_PERSIST_INTERVAL", "10")
+    )
+
     @classmethod
     def get_full_url(cls, endpoint: str = "") -> str:
         """
@@ -67,6 +139,12 @@ class AuthConfig:
     ACCESS_TOKEN_LIFETIME: int = 15
     REFRESH_TOKEN_LIFETIME: int = 60
 
+    # Renovação proativa em segundo plano (em segundos): antecedência em
+    # relação ao vencimento, maior que a janela de 2 minutos usada na
+    # renovação sob demanda, e intervalo de verificação da sessão
+    PROACTIVE_REFRESH_LEAD_SECONDS: int = 180
+    PROACTIVE_REFRESH_POLL_SECONDS: int = 30
+
 
 class AppConfig:
     """
@@ -85,10 +163,36 @@ class AppConfig:
     BASE_DIR: Path = Path(__file__).resolve().parent.parent
     STATIC_DIR: Path = BASE_DIR / "static"
     LIBRARY_DIR: Path = BASE_DIR / "library"
+    LEDGER_DIR: Path = Path(os.getenv("LEDGER_DIR", BASE_DIR / ".ledger"))
 
     # Configurações de sessão
     SESSION_TIMEOUT_MINUTES: int = 30
 
+    # Número de transações recentes exibidas no dashboard
+    DASHBOARD_RECENT_TRANSACTIONS: int = int(
+        os.getenv("DASHBOARD_RECENT_TRANSACTIONS", "10")
+    )
+
+    # Figuras Plotly memorizadas pelo conteúdo dos dados (LRU)
+    FIGURE_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("FIGURE_CACHE_MAX_ENTRIES", "64")
+    )
+
+    # Pontos máximos por série enviados aos gráficos de linha (LTTB)
+    CHART_MAX_POINTS: int = int(os.getenv("CHART_MAX_POINTS", "500"))
+
+    # Registros por página nas listagens (opções e padrão)
+    LIST_PAGE_SIZES: Tuple[int, ...] = (10, 25, 50, 100)
+    LIST_PAGE_SIZE: int = int(os.getenv("LIST_PAGE_SIZE", "25"))
+
+    # Marcações de interface por registro mantidas por página
+    UI_STATE_MAX_ENTRIES: int = int(
+        os.getenv("UI_STATE_MAX_ENTRIES", "50")
+    )
+
+    # Fração mínima dos trigramas da consulta na busca textual
+    SEARCH_MIN_SCORE: float = float(os.getenv("SEARCH_MIN_SCORE", "0.6"))
+
 
 class DatabaseCategories:
     """
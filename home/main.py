@@ -9,6 +9,7 @@ import streamlit as st
 from time import sleep
 from components.auth import auth_component
 from services.permissions_service import PermissionsService
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components
 
 
@@ -158,6 +159,8 @@ class HomePage:
 
         # Renderiza a página selecionada
         selected_class = menu_options[selected_option]
+        # Marcações de interface de outras páginas são descartadas
+        ui_state.activate(getattr(selected_class, 'UI_SCOPE', None))
         page_instance = selected_class()
 
         # Chama o método main_menu da página (padrão CodexDB)
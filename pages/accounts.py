@@ -7,13 +7,18 @@ e layout de 3 colunas para listagem.
 """
 
 import logging
-from datetime import date, datetime
+from datetime import date
 from typing import Dict, List
 
 import streamlit as st
 
 from components.auth import require_auth
+from services.accounts_service import accounts_service
 from services.api_client import api_client, ApiClientError, ValidationError
+from utils.date_utils import format_date_for_display
+from utils.filter_spec import FilterSpec
+from utils.records import Account, parse_date
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components, centered_tabs
 from config.settings import db_categories
 
@@ -25,9 +30,17 @@ class AccountsPage:
     """Página de gerenciamento de contas bancárias,
     com padrão visual padronizado."""
 
+    # Prefixo das chaves da listagem no session_state
+    LIST_KEY = "accounts_list"
+    # Escopo das marcações de interface por registro
+    UI_SCOPE = "accounts"
+    # Valor de is_active de cada opção do filtro de status
+    STATUS_FILTERS = {'Ativas': True, 'Inativas': False}
+
     def __init__(self):
         """Inicializa a página de contas."""
         self.auth = require_auth()
+        self.ui_state = ui_state.scope(self.UI_SCOPE)
 
     def render(self):
         """
@@ -117,87 +130,100 @@ class AccountsPage:
         """
         Renderiza contas no layout padronizado de 3 colunas.
 
+        Apenas a página visível da listagem cria widgets.
+
         Parameters
         ----------
         accounts : List[Dict]
             Lista de contas para exibir
         """
-        for account in accounts:
-            # Container para cada conta
-            with st.container():
-                col1, col2, col3 = st.columns([3, 3, 1])
-
-                with col1:
-                    # Primeira coluna: nome + emoji do tipo
-                    account_type = account.get('account_type', '')
-                    account_type_display = db_categories.ACCOUNT_TYPES.get(
-                        account_type, account_type or 'N/A'
-                    )
-                    emoji = self._get_account_type_emoji(account_type_display)
-
-                    # Banco/Instituição
-                    bank_code = account.get('bank_code', '')
-                    institution_display = db_categories.INSTITUTIONS.get(
-                        bank_code, bank_code or 'N/A'
-                    )
-
-                    st.markdown(f"""
-                    **{emoji} Nome: {account.get('account_name', 'N/A')}**
+        ui_components.render_windowed_list(
+            accounts,
+            key=self.LIST_KEY,
+            render_item=self._render_account_row,
+            state=self.ui_state
+        )
 
-                    🏛️ Instituição: {institution_display}
+    def _render_account_row(self, account: Dict):
+        """
+        Renderiza uma conta no layout de 3 colunas.
 
-                    📂 Tipo: {account_type_display}
-                    """)
+        Parameters
+        ----------
+        account : Dict
+            Dados da conta
+        """
+        # Container para cada conta
+        with st.container():
+            col1, col2, col3 = st.columns([3, 3, 1])
 
-                with col2:
-                    # Segunda coluna (central): dados principais
-                    balance = str(
-                        round(
-                            (
-                                float(
-                                    account.get(
-                                        'current_balance',
-                                        0
-                                    )
-                                )
-                            ),
-                            2
-                        )
-                    )
-                    opening_date = account.get('opening_date', 'N/A')
-                    opening_date_iso = datetime.strptime(
-                        opening_date, '%Y-%m-%d'
-                    )
-                    br_date = opening_date_iso.strftime('%d/%m/%Y')
-                    status = "✅ Ativa" if account.get(
-                        'is_active', True
-                    ) else "⏸️ Inativa"
+            with col1:
+                # Primeira coluna: nome + emoji do tipo
+                account_type = account.get('account_type', '')
+                account_type_display = db_categories.ACCOUNT_TYPES.get(
+                    account_type, account_type or 'N/A'
+                )
+                emoji = self._get_account_type_emoji(account_type_display)
 
-                    st.markdown(f"""
-                    **💰 Saldo: R$ {balance}**
+                # Banco/Instituição
+                bank_code = account.get('bank_code', '')
+                institution_display = db_categories.INSTITUTIONS.get(
+                    bank_code, bank_code or 'N/A'
+                )
 
-                    📅 Abertura: {br_date}
+                st.markdown(f"""
+                **{emoji} Nome: {account.get('account_name', 'N/A')}**
 
-                    {status}
-                    """)
+                🏛️ Instituição: {institution_display}
 
-                with col3:
-                    # Terceira coluna (direita): botão de ações
-                    if st.button(
-                        "⚙️",
-                        key=f"actions_{account['id']}",
-                        help="Opções de ações",
-                        use_container_width=True
-                    ):
-                        st.session_state[
-                            f'show_actions_{account["id"]}'
-                        ] = True
-                        st.rerun()
+                📂 Tipo: {account_type_display}
+                """)
 
-                # Popup de ações para esta conta
-                self._render_account_action_popup(account)
+            with col2:
+                # Segunda coluna (central): dados principais
+                balance = str(
+                    round(
+                        (
+                            float(
+                                account.get(
+                                    'current_balance',
+                                    0
+                                )
+                            )
+                        ),
+                        2
+                    )
+                )
+                br_date = format_date_for_display(
+                    account.get('opening_date')
+                ) or 'N/A'
+                status = "✅ Ativa" if account.get(
+                    'is_active', True
+                ) else "⏸️ Inativa"
+
+                st.markdown(f"""
+                **💰 Saldo: R$ {balance}**
+
+                📅 Abertura: {br_date}
+
+                {status}
+                """)
+
+            with col3:
+                # Terceira coluna (direita): botão de ações
+                if st.button(
+                    "⚙️",
+                    key=f"actions_{account['id']}",
+                    help="Opções de ações",
+                    use_container_width=True
+                ):
+                    self.ui_state.set('actions', account['id'])
+                    ui_components.rerun_fragment()
+
+            # Popup de ações para esta conta
+            self._render_account_action_popup(account)
 
-                st.markdown("---")
+            st.markdown("---")
 
     def _render_account_action_popup(self, account: Dict):
         """
@@ -208,9 +234,7 @@ class AccountsPage:
         account : Dict
             Dados da conta
         """
-        popup_key = f'show_actions_{account["id"]}'
-
-        if st.session_state.get(popup_key, False):
+        if self.ui_state.is_set('actions', account['id']):
             with st.expander(
                 f"⚙️ Ações para: {account.get('account_name', 'N/A')}",
                 expanded=True
@@ -224,11 +248,9 @@ class AccountsPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[
-                            f'edit_account_{account["id"]}'
-                        ] = account
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('edit', account['id'])
+                        self.ui_state.clear('actions', account['id'])
+                        ui_components.rerun_fragment()
 
                 with col2:
                     action_text = "⏸️ Desativar" if account.get(
@@ -241,8 +263,8 @@ class AccountsPage:
                         use_container_width=True
                     ):
                         self._handle_toggle_account_status(account)
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', account['id'])
+                        ui_components.rerun_fragment()
 
                 with col3:
                     if st.button(
@@ -250,8 +272,8 @@ class AccountsPage:
                         key=f"close_{account['id']}",
                         use_container_width=True
                     ):
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', account['id'])
+                        ui_components.rerun_fragment()
 
         # Renderiza modal de edição
         self._render_edit_account_modal(account)
@@ -265,9 +287,7 @@ class AccountsPage:
         account : Dict
             Dados da conta para editar
         """
-        edit_key = f'edit_account_{account["id"]}'
-
-        if st.session_state.get(edit_key):
+        if self.ui_state.is_set('edit', account['id']):
             st.markdown("### ✏️ Editar Conta")
 
             with st.form(f"edit_form_{account['id']}", clear_on_submit=False):
@@ -340,11 +360,9 @@ class AccountsPage:
 
                         opening_date = st.date_input(
                             "📅 Data de Abertura",
-                            value=datetime.fromisoformat(
-                                account.get('opening_date', str(date.today()))
-                            ).date() if account.get(
-                                'opening_date'
-                            ) else date.today()
+                            value=parse_date(
+                                account.get('opening_date')
+                            ) or date.today()
                         )
 
                     with col_opt2:
@@ -387,13 +405,12 @@ class AccountsPage:
                         agency,  # type: ignore
                         opening_date,
                         minimum_balance,
-                        description,  # type: ignore
-                        edit_key
+                        description  # type: ignore
                     )
 
                 if cancelled:
-                    st.session_state.pop(edit_key, None)
-                    st.rerun()
+                    self.ui_state.clear('edit', account['id'])
+                    ui_components.rerun_fragment()
 
     def _render_add_account_form_standardized(self):
         """Renderiza formulário padronizado de adição de conta."""
@@ -520,7 +537,7 @@ class AccountsPage:
 
     def _fetch_user_accounts(
         self, status_filter: str, tipo_filter: str
-    ) -> List[Dict]:
+    ) -> List[Account]:
         """
         Busca contas do usuário com filtros aplicados.
 
@@ -533,52 +550,27 @@ class AccountsPage:
 
         Returns
         -------
-        List[Dict]
+        List[Account]
             Lista de contas filtradas
         """
+        # Converte tipo display para código API
+        type_code = None
+        if tipo_filter != 'Todos':
+            for key, value in db_categories.ACCOUNT_TYPES.items():
+                if value == tipo_filter:
+                    type_code = key
+                    break
+
+        filters = FilterSpec(
+            is_active=self.STATUS_FILTERS.get(status_filter),
+            account_type=type_code
+        )
+
         try:
-            accounts_response = api_client.get("accounts/")
-            accounts = (
-                accounts_response.get('results', accounts_response)
-                if isinstance(accounts_response, dict)
-                else accounts_response
+            return accounts_service.get_all_accounts(
+                active_only=False, filters=filters
             )
 
-            if not accounts:
-                return []
-
-            # Aplica filtros
-            filtered_accounts = accounts
-
-            # Filtro por status
-            if status_filter == 'Ativas':
-                filtered_accounts = [
-                    acc for acc in filtered_accounts
-                    if acc.get('is_active', True)
-                ]
-            elif status_filter == 'Inativas':
-                filtered_accounts = [
-                    acc for acc in filtered_accounts
-                    if not acc.get('is_active', True)
-                ]
-
-            # Filtro por tipo
-            if tipo_filter != 'Todos':
-                # Converte tipo display para código API
-                type_code = None
-                for key, value in db_categories.ACCOUNT_TYPES.items():
-                    if value == tipo_filter:
-                        type_code = key
-                        break
-
-                if type_code:
-                    filtered_accounts = [
-                        acc for acc in filtered_accounts
-                        if acc.get('account_type') == type_code
-                    ]
-
-            return filtered_accounts
-
         except Exception as e:
             logger.error(f"Erro ao buscar contas: {e}")
             raise
@@ -689,8 +681,7 @@ class AccountsPage:
         agency: str,
         opening_date: date,
         minimum_balance: float,
-        description: str,
-        edit_key: str
+        description: str
     ):
         """
         Processa submissão da edição de conta.
@@ -715,8 +706,6 @@ class AccountsPage:
             Novo saldo mínimo
         description : str
             Nova descrição
-        edit_key : str
-            Chave da sessão para limpeza
         """
         if not name or not account_type or not institution:
             st.error("❌ Por favor, preencha todos os campos obrigatórios!")
@@ -757,8 +746,9 @@ class AccountsPage:
 
             if result:
                 st.success("✅ Conta atualizada com sucesso!")
-                st.session_state.pop(edit_key, None)
-                st.rerun()
+                self.ui_state.clear('edit', account_id)
+                ui_components.replace_list_record(self.LIST_KEY, result)
+                ui_components.rerun_fragment()
             else:
                 st.error("❌ Erro ao atualizar conta!")
 
@@ -789,7 +779,8 @@ class AccountsPage:
 
             if result:
                 st.success(f"✅ Conta {status_text} com sucesso!")
-                st.rerun()
+                ui_components.replace_list_record(self.LIST_KEY, result)
+                ui_components.rerun_fragment()
             else:
                 st.error(
                     f"""❌ Erro ao {
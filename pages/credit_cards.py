@@ -16,6 +16,8 @@ import streamlit as st
 from components.auth import require_auth
 from services.credit_cards_service import credit_cards_service
 from services.api_client import api_client, ApiClientError, ValidationError
+from utils.filter_spec import FilterSpec
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components, centered_tabs
 from utils.date_utils import format_currency_br
 from config.settings import db_categories
@@ -27,9 +29,15 @@ logger = logging.getLogger(__name__)
 class CreditCardsPage:
     """Página de gerenciamento de cartões de crédito."""
 
+    # Escopo das marcações de interface por registro
+    UI_SCOPE = "credit_cards"
+    # Valor de is_active de cada opção do filtro de status
+    STATUS_FILTERS = {'Ativos': True, 'Inativos': False}
+
     def __init__(self):
         """Inicializa a página de cartões de crédito."""
         self.auth = require_auth()
+        self.ui_state = ui_state.scope(self.UI_SCOPE)
 
     def main_menu(
             self,
@@ -117,6 +125,9 @@ class CreditCardsPage:
                 credit_cards = self._fetch_user_credit_cards(
                     status_filter, flag_filter)
 
+            # Descarta marcações de cartões que deixaram a listagem
+            self.ui_state.retain(card['id'] for card in credit_cards)
+
             if not credit_cards:
                 st.info("📋 Você ainda não possui cartões cadastrados.")
                 return
@@ -151,26 +162,18 @@ class CreditCardsPage:
         List[Dict[str, Any]]
             Lista de cartões filtrados
         """
-        credit_cards = credit_cards_service.list_credit_cards()
-
-        # Aplica filtro de status
-        if status_filter == 'Ativos':
-            credit_cards = [c for c in credit_cards if c.get('is_active')]
-        elif status_filter == 'Inativos':
-            credit_cards = [c for c in credit_cards if not c.get('is_active')]
-
-        # Aplica filtro de bandeira
+        bandeira_key = None
         if flag_filter != 'Todas':
             bandeira_key = db_categories.TRANSLATED_CARD_FLAGS.get(
                 flag_filter
             )
-            if bandeira_key:
-                credit_cards = [
-                    c for c in credit_cards
-                    if c.get('flag') == bandeira_key
-                ]
 
-        return credit_cards
+        return credit_cards_service.list_credit_cards(
+            filters=FilterSpec(
+                is_active=self.STATUS_FILTERS.get(status_filter),
+                flag=bandeira_key
+            )
+        )
 
     def _render_credit_card_item_standardized(self, card: Dict[str, Any]):
         """
@@ -265,7 +268,7 @@ class CreditCardsPage:
         card : Dict[str, Any]
             Dados do cartão
         """
-        st.session_state[f'show_actions_{card["id"]}'] = True
+        self.ui_state.set('actions', card['id'])
 
     def _render_credit_card_action_popup(self, card: Dict[str, Any]):
         """
@@ -276,8 +279,7 @@ class CreditCardsPage:
         card : Dict[str, Any]
             Dados do cartão
         """
-        popup_key = f'show_actions_{card["id"]}'
-        if st.session_state.get(popup_key, False):
+        if self.ui_state.is_set('actions', card['id']):
             with st.expander(
                 f"⚙️ Ações para: {card.get('name', 'N/A')}",
                 expanded=True
@@ -291,8 +293,8 @@ class CreditCardsPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[f'edit_card_{card["id"]}'] = card
-                        st.session_state[popup_key] = False
+                        self.ui_state.set('edit', card['id'])
+                        self.ui_state.clear('actions', card['id'])
                         st.rerun()
 
                 with col2:
@@ -306,7 +308,7 @@ class CreditCardsPage:
                         use_container_width=True
                     ):
                         self._handle_toggle_card_status(card)
-                        st.session_state[popup_key] = False
+                        self.ui_state.clear('actions', card['id'])
                         st.rerun()
 
                 with col3:
@@ -315,7 +317,7 @@ class CreditCardsPage:
                         key=f"close_{card['id']}",
                         use_container_width=True
                     ):
-                        st.session_state[popup_key] = False
+                        self.ui_state.clear('actions', card['id'])
                         st.rerun()
 
         # Renderiza modal de edição
@@ -359,9 +361,7 @@ class CreditCardsPage:
         card : Dict[str, Any]
             Dados do cartão para editar
         """
-        edit_key = f'edit_card_{card["id"]}'
-
-        if st.session_state.get(edit_key):
+        if self.ui_state.is_set('edit', card['id']):
             st.markdown("### ✏️ Editar Cartão")
 
             with st.form(f"edit_form_{card['id']}", clear_on_submit=False):
@@ -440,11 +440,11 @@ class CreditCardsPage:
                         credit_limit=credit_limit,
                         is_active=is_active
                     )
-                    st.session_state[edit_key] = None
+                    self.ui_state.clear('edit', card['id'])
                     st.rerun()
 
                 if canceled:
-                    st.session_state[edit_key] = None
+                    self.ui_state.clear('edit', card['id'])
                     st.rerun()
 
     def _process_card_edit(
@@ -7,7 +7,8 @@ incluindo resumos, gráficos e indicadores principais.
 
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 from utils.date_utils import (
     format_date_for_display,
     format_date_for_api,
@@ -20,11 +21,30 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from pages.router import BasePage
-from services.api_client import api_client, ApiClientError, AuthenticationError
+from services.api_client import (
+    api_client, ApiClientError, AuthenticationError
+)
 from services.accounts_service import accounts_service
+from services.concurrent_loader import concurrent_loader
 from services.expenses_service import expenses_service
+from services.loans_service import loans_service
 from services.revenues_service import revenues_service
-from config.settings import db_categories
+from services.local_ledger import local_ledger
+from config.settings import app_config, db_categories
+from utils.aggregations import (
+    build_loans_frame,
+    cents_to_decimal,
+    cumulative_balance,
+    daily_net_flow,
+    downsample_series,
+    label_totals,
+    outstanding_loans_total,
+    top_recent_transactions
+)
+from utils.chart_cache import figure_cache
+from utils.records import Record
+from utils.rollup_cube import RollupCube
+from utils.transaction_batch import TransactionBatch
 from utils.ui_utils import ui_components
 
 
@@ -65,34 +85,117 @@ class DashboardPage(BasePage):
         - Cards com métricas principais
         - Gráficos de gastos e receitas
         - Lista de transações recentes
-        - Alertas e notificações
+        - Resumo das contas
+
+        Os painéis são fragmentos do Streamlit: interações em um painel
+        reexecutam apenas ele, e a mudança do período reexecuta apenas
+        os painéis que dependem do período.
         """
+        self._render_period_panels()
+        self._render_accounts_panel()
+
+    @st.fragment
+    def _render_period_panels(self) -> None:
+        """Renderiza os filtros e os painéis que dependem do período."""
         try:
             # Filtros de período
             self._render_period_filters()
 
             # Carrega dados
             with st.spinner("📊 Carregando dados do dashboard..."):
-                dashboard_data = self._load_dashboard_data()
+                st.session_state['dashboard_data'] = (
+                    self._load_dashboard_data()
+                )
+
+            self._render_load_errors(st.session_state['dashboard_data'])
 
             # Renderiza métricas principais
-            self._render_main_metrics(dashboard_data)
+            self._render_metrics_panel()
 
             # Duas colunas para gráficos
             col1, col2 = st.columns(2)
 
             with col1:
-                self._render_expenses_chart(dashboard_data)
-                self._render_category_chart(dashboard_data)
+                self._render_expenses_panel()
+                self._render_revenues_panel()
 
             with col2:
-                self._render_balance_evolution(dashboard_data)
-                self._render_accounts_summary(dashboard_data)
+                self._render_balance_panel()
 
             # Transações recentes
-            self._render_recent_transactions(dashboard_data)
+            self._render_recent_transactions_panel()
+
+        except Exception as e:
+            self._render_error(e, 'period')
+
+    @st.fragment
+    def _render_metrics_panel(self) -> None:
+        """Painel de métricas principais."""
+        self._run_panel(self._render_main_metrics)
+
+    @st.fragment
+    def _render_expenses_panel(self) -> None:
+        """Painel de despesas por categoria."""
+        self._run_panel(self._render_expenses_chart)
+
+    @st.fragment
+    def _render_revenues_panel(self) -> None:
+        """Painel de receitas por categoria."""
+        self._run_panel(self._render_category_chart)
+
+    @st.fragment
+    def _render_balance_panel(self) -> None:
+        """Painel de evolução do saldo."""
+        self._run_panel(self._render_balance_evolution)
+
+    @st.fragment
+    def _render_recent_transactions_panel(self) -> None:
+        """Painel de transações recentes."""
+        self._run_panel(self._render_recent_transactions)
+
+    @st.fragment
+    def _render_accounts_panel(self) -> None:
+        """
+        Painel de resumo das contas.
+
+        Não depende do período nem das movimentações e, por isso, não é
+        reexecutado quando os filtros mudam.
+        """
+        try:
+            with st.spinner("🏦 Carregando contas..."):
+                accounts = accounts_service.get_all_accounts(
+                    active_only=False
+                )
+            self._render_accounts_summary({'accounts': accounts})
+        except Exception as e:
+            self._render_error(e, 'accounts')
+
+    def _run_panel(self, renderer: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Executa um painel com os dados do período carregados.
 
-        except AuthenticationError as e:
+        Parameters
+        ----------
+        renderer : Callable[[Dict[str, Any]], None]
+            Método que renderiza o painel a partir dos dados do dashboard
+        """
+        try:
+            renderer(st.session_state['dashboard_data'])
+        except Exception as e:
+            self._render_error(e, renderer.__name__)
+
+    def _render_error(self, error: Exception, panel: str) -> None:
+        """
+        Exibe o erro ocorrido na renderização de um painel.
+
+        Parameters
+        ----------
+        error : Exception
+            Erro capturado
+        panel : str
+            Nome do painel, usado na chave dos widgets
+        """
+        if isinstance(error, AuthenticationError):
             st.error("🔐 **Sessão Expirada**")
             st.warning(
                 """
@@ -105,7 +208,8 @@ class DashboardPage(BasePage):
                 if st.button(
                     "🔄 Fazer Login",
                     type="primary",
-                    use_container_width=True
+                    use_container_width=True,
+                    key=f"dashboard_login_{panel}"
                 ):
                     # Limpa dados de autenticação
                     for key in [
@@ -118,13 +222,13 @@ class DashboardPage(BasePage):
                         if key in st.session_state:
                             del st.session_state[key]
                     st.rerun()
-            logger.error(f"Erro de autenticação no dashboard: {e}")
-        except ApiClientError as e:
-            st.error(f"❌ Erro ao carregar dashboard: {e}")
-            logger.error(f"Erro no dashboard: {e}")
-        except Exception as e:
-            st.error(f"💥 Erro inesperado: {e}")
-            logger.error(f"Erro inesperado no dashboard: {e}")
+            logger.error(f"Erro de autenticação no dashboard: {error}")
+        elif isinstance(error, ApiClientError):
+            st.error(f"❌ Erro ao carregar dashboard: {error}")
+            logger.error(f"Erro no dashboard: {error}")
+        else:
+            st.error(f"💥 Erro inesperado: {error}")
+            logger.error(f"Erro inesperado no dashboard: {error}")
 
     def _render_period_filters(self) -> None:
         """Renderiza filtros de período."""
@@ -152,8 +256,10 @@ class DashboardPage(BasePage):
 
         with col3:
             st.markdown("<br>", unsafe_allow_html=True)
+            # O clique reexecuta apenas o fragmento dos painéis do período,
+            # que recarrega os dados direto da API
             if st.button("🔄 Atualizar", width='stretch'):
-                st.rerun()
+                self._expire_dashboard_data()
 
         # Armazena filtros na sessão
         st.session_state['dashboard_filters'] = {
@@ -163,6 +269,21 @@ class DashboardPage(BasePage):
 
         st.markdown("---")
 
+    @staticmethod
+    def _expire_dashboard_data() -> None:
+        """
+        Descarta as respostas em cache e o intervalo de sincronização do
+        espelho local das fontes do dashboard.
+        """
+        endpoints = (
+            expenses_service.ENDPOINT,
+            revenues_service.ENDPOINT,
+            loans_service.ENDPOINT,
+            accounts_service.ENDPOINT
+        )
+        api_client.invalidate_cache(*endpoints)
+        local_ledger.expire(*endpoints)
+
     def _load_dashboard_data(self) -> Dict[str, Any]:
         """
         Carrega todos os dados necessários para o dashboard.
@@ -174,41 +295,167 @@ class DashboardPage(BasePage):
         """
         filters = st.session_state.get('dashboard_filters', {})
 
-        # Carrega dados básicos
-        accounts = accounts_service.get_all_accounts(active_only=False)
+        # Fontes independentes são carregadas simultaneamente
+        results, errors = concurrent_loader.load({
+            'accounts': lambda: accounts_service.get_all_accounts(
+                active_only=False
+            ),
+            'expenses': lambda: self._load_period_summary(
+                expenses_service.ENDPOINT,
+                'payed',
+                expenses_service.get_all_expenses,
+                expenses_service.get_expenses_batch,
+                filters
+            ),
+            'revenues': lambda: self._load_period_summary(
+                revenues_service.ENDPOINT,
+                'received',
+                revenues_service.get_all_revenues,
+                revenues_service.get_revenues_batch,
+                filters
+            ),
+            'loans': loans_service.get_all_loans
+        })
+
+        # Sessão expirada invalida todo o dashboard
+        for error in errors.values():
+            if isinstance(error, AuthenticationError):
+                raise error
+
+        empty_summary = self._summarize_period(
+            RollupCube([], 'payed'), None, None
+        )
+        loans = results.get('loans', [])
+
+        return {
+            'accounts': results.get('accounts', []),
+            'expenses': results.get('expenses', empty_summary),
+            'revenues': results.get('revenues', empty_summary),
+            'loans': loans,
+            'loans_frame': build_loans_frame(loans),
+            'filters': filters,
+            'errors': errors
+        }
+
+    def _load_period_summary(
+        self,
+        endpoint: str,
+        status_field: str,
+        get_all: Callable[..., List[Record]],
+        get_batch: Callable[..., TransactionBatch],
+        filters: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Obtém os totais do período de despesas ou receitas.
+
+        Com o espelho local habilitado, os totais vêm do cubo de somas
+        acumuladas do usuário, mantido entre execuções e atualizado a
+        cada alteração; mudar o período não percorre as movimentações.
+        Sem o espelho, o cubo é montado com o lote colunar do período,
+        sem converter cada movimentação em registro.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint de listagem (ex.: ``expenses/``)
+        status_field : str
+            Campo booleano de efetivação (``payed`` ou ``received``)
+        get_all : Callable[..., List[Record]]
+            Listagem do serviço, usada com o espelho local para as
+            movimentações recentes
+        get_batch : Callable[..., TransactionBatch]
+            Lote colunar do serviço, usado sem o espelho local
+        filters : Dict[str, str]
+            Período selecionado (``date_from`` e ``date_to``)
 
-        # Carrega despesas com filtros
-        expenses = expenses_service.get_all_expenses(
-            date_from=filters.get('date_from'),
-            date_to=filters.get('date_to')
+        Returns
+        -------
+        Dict[str, Any]
+            Resumo de ``_summarize_period`` e as movimentações candidatas
+            a recentes em ``recent``
+        """
+        date_from = filters.get('date_from')
+        date_to = filters.get('date_to')
+        summarize = partial(
+            self._summarize_period, date_from=date_from, date_to=date_to
         )
 
-        # Carrega receitas com filtros
-        revenues = revenues_service.get_all_revenues(
-            date_from=filters.get('date_from'),
-            date_to=filters.get('date_to')
+        if local_ledger.is_enabled():
+            summary = local_ledger.query_view(
+                endpoint,
+                'rollup_cube',
+                partial(RollupCube, status_field=status_field),
+                summarize
+            )
+            summary['recent'] = get_all(
+                date_from=date_from,
+                date_to=date_to,
+                limit=app_config.DASHBOARD_RECENT_TRANSACTIONS
+            )
+            return summary
+
+        batch = get_batch(date_from=date_from, date_to=date_to)
+        summary = summarize(RollupCube(batch, status_field))
+        summary['recent'] = batch.to_records(
+            batch.top_recent(app_config.DASHBOARD_RECENT_TRANSACTIONS)
         )
+        return summary
+
+    @staticmethod
+    def _summarize_period(
+        cube: RollupCube,
+        date_from: Optional[str],
+        date_to: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Consulta no cubo os totais usados pelos painéis.
 
-        # Carrega empréstimos
-        loans = []
-        try:
-            loans_data = api_client.get("loans/")
-            if isinstance(loans_data, list):
-                loans = loans_data
-            elif isinstance(loans_data, dict) and 'results' in loans_data:
-                loans = loans_data['results']
-        except Exception as e:
-            logger.warning(f"Erro ao carregar empréstimos: {e}")
-            loans = []
+        Parameters
+        ----------
+        cube : RollupCube
+            Cubo de despesas ou receitas
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
 
+        Returns
+        -------
+        Dict[str, Any]
+            ``count``, ``settled_total`` (Decimal), ``by_category`` e
+            ``settled_daily`` (centavos) do período
+        """
         return {
-            'accounts': accounts,
-            'expenses': expenses,
-            'revenues': revenues,
-            'loans': loans,
-            'filters': filters
+            'count': cube.count(date_from, date_to),
+            'settled_total': cents_to_decimal(
+                cube.total(date_from, date_to, settled=True)
+            ),
+            'by_category': cube.sums_by('category', date_from, date_to),
+            'settled_daily': cube.daily(date_from, date_to, settled=True),
+            'recent': []
         }
 
+    def _render_load_errors(self, data: Dict[str, Any]) -> None:
+        """
+        Exibe avisos para as fontes de dados que falharam no carregamento.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            Dados do dashboard
+        """
+        source_labels = {
+            'accounts': "contas",
+            'expenses': "despesas",
+            'revenues': "receitas",
+            'loans': "empréstimos"
+        }
+        for source, error in data.get('errors', {}).items():
+            st.warning(
+                f"⚠️ Não foi possível carregar "
+                f"{source_labels.get(source, source)}: {error}"
+            )
+
     def _render_main_metrics(self, data: Dict[str, Any]) -> None:
         """
         Renderiza as métricas principais do dashboard.
@@ -221,30 +468,11 @@ class DashboardPage(BasePage):
         st.markdown("### 📈 Resumo Financeiro")
 
         # Calcula métricas considerando apenas transações pagas/recebidas
-        total_expenses = sum(
-            float(
-                exp.get('value', 0)) for exp in data[
-                    'expenses'
-            ] if exp.get('payed', False)
-        )
-        total_revenues = sum(float(
-            rev.get('value', 0)
-        ) for rev in data['revenues'] if rev.get('received', False))
-        loans_given = sum(
-            float(loan.get('value', 0)) - float(
-                loan.get('payed_value', 0)
-            ) for loan in data['loans'] if loan.get(
-                'loan_type'
-            ) == 'given' and not loan.get('payed', False))
-
-        loans_received = sum(
-            float(loan.get(
-                'value', 0)
-            ) - float(loan.get('payed_value', 0)) for loan in data[
-                'loans'
-            ] if loan.get('loan_type') == 'received' and not loan.get(
-                'payed', False
-            )
+        total_expenses = data['expenses']['settled_total']
+        total_revenues = data['revenues']['settled_total']
+        loans_given = outstanding_loans_total(data['loans_frame'], 'given')
+        loans_received = outstanding_loans_total(
+            data['loans_frame'], 'received'
         )
         # Saldo real considerando empréstimos
         # Empréstimos dados: dinheiro que saiu (negativo no saldo)
@@ -331,11 +559,8 @@ class DashboardPage(BasePage):
                 )
 
             with col8:
-                total_loans = len(data['loans'])
-                active_loans = len(
-                    [loan for loan in data['loans']
-                     if not loan.get('payed', False)]
-                )
+                total_loans = len(data['loans_frame'])
+                active_loans = int((~data['loans_frame']['payed']).sum())
                 st.metric(
                     label="📋 Empréstimos",
                     value=f"{active_loans}/{total_loans}",
@@ -355,35 +580,23 @@ class DashboardPage(BasePage):
         """
         st.markdown("#### 💸 Despesas por Categoria")
 
-        if not data['expenses']:
+        if not data['expenses']['count']:
             st.info("📝 Nenhuma despesa encontrada no período selecionado.")
             return
 
-        # Processa dados para o gráfico
-        category_totals: Dict[str, float] = {}
-        for expense in data['expenses']:
-            category = expense.get('category', 'others')
-            category_name = db_categories.EXPENSE_CATEGORIES.get(
-                category, category)
-            value = float(expense.get('value', 0))
-            category_totals[category_name] = category_totals.get(
-                category_name, 0) + value
-
-        if category_totals:
-            # Cria DataFrame
-            df = pd.DataFrame(
-                list(category_totals.items()),
-                columns=['Categoria', 'Valor']
-            )
+        df = label_totals(
+            data['expenses']['by_category'], db_categories.EXPENSE_CATEGORIES
+        )
 
-            # Gráfico de pizza
-            fig = px.pie(
+        if not df.empty:
+            # Gráfico de pizza, reconstruído apenas se os totais mudarem
+            fig = figure_cache.get_or_build(
+                'dashboard_expenses_pie',
                 df,
-                values='Valor',
-                names='Categoria',
-                title="Distribuição de Despesas"
+                partial(
+                    self._build_category_pie, title="Distribuição de Despesas"
+                )
             )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig, width='stretch')
         else:
             st.info("📊 Dados insuficientes para gerar gráfico.")
@@ -399,60 +612,69 @@ class DashboardPage(BasePage):
         """
         st.markdown("#### 📈 Evolução Financeira")
 
-        # Combina receitas, despesas e empréstimos por data
-        all_transactions = []
+        # Fluxo líquido diário de despesas pagas, receitas recebidas e
+        # empréstimos, acumulado no saldo
+        df = cumulative_balance(daily_net_flow(
+            data['expenses']['settled_daily'],
+            data['revenues']['settled_daily'],
+            data['loans_frame']
+        ))
 
-        # Adiciona despesas (apenas pagas)
-        for expense in data['expenses']:
-            if expense.get('payed', False):
-                all_transactions.append({
-                    'date': expense.get('date'),
-                    'value': -float(expense.get('value', 0)),
-                    'type': 'Despesa'
-                })
+        if df.empty:
+            st.info("📊 Nenhuma transação encontrada no período.")
+            return
 
-        # Adiciona receitas (apenas recebidas)
-        for revenue in data['revenues']:
-            if revenue.get('received', False):
-                all_transactions.append({
-                    'date': revenue.get('date'),
-                    'value': float(revenue.get('value', 0)),
-                    'type': 'Receita'
-                })
+        # Períodos longos são reduzidos a no máximo CHART_MAX_POINTS
+        # pontos, preservando picos e vales do saldo
+        series = downsample_series(
+            df[['date', 'cumulative_balance']],
+            'date',
+            'cumulative_balance',
+            app_config.CHART_MAX_POINTS
+        )
 
-        # Adiciona empréstimos
-        for loan in data['loans']:
-            loan_date = loan.get('date')
-            loan_value = float(loan.get('value', 0))
-
-            if loan.get('loan_type') == 'given':
-                # Empréstimo dado: dinheiro saiu da conta (negativo)
-                all_transactions.append({
-                    'date': loan_date,
-                    'value': -loan_value,
-                    'type': 'Empréstimo Dado'
-                })
-            elif loan.get('loan_type') == 'received':
-                # Empréstimo recebido: dinheiro entrou na conta (positivo)
-                all_transactions.append({
-                    'date': loan_date,
-                    'value': loan_value,
-                    'type': 'Empréstimo Recebido'
-                })
+        # Gráfico de linha, reconstruído apenas se o saldo mudar
+        fig = figure_cache.get_or_build(
+            'dashboard_balance_line', series, self._build_balance_figure
+        )
+        st.plotly_chart(fig, width='stretch')
 
-        if not all_transactions:
-            st.info("📊 Nenhuma transação encontrada no período.")
-            return
+    @staticmethod
+    def _build_category_pie(df: pd.DataFrame, title: str) -> go.Figure:
+        """
+        Constrói o gráfico de pizza de totais por categoria.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Colunas ``Categoria`` e ``Valor``
+        title : str
+            Título do gráfico
+
+        Returns
+        -------
+        go.Figure
+            Gráfico de pizza
+        """
+        fig = px.pie(df, values='Valor', names='Categoria', title=title)
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        return fig
 
-        # Cria DataFrame e ordena por data
-        df = pd.DataFrame(all_transactions)
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
+    @staticmethod
+    def _build_balance_figure(df: pd.DataFrame) -> go.Figure:
+        """
+        Constrói o gráfico de linha do saldo acumulado.
 
-        # Calcula saldo acumulado
-        df['cumulative_balance'] = df['value'].cumsum()
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Colunas ``date`` e ``cumulative_balance``
 
-        # Gráfico de linha
+        Returns
+        -------
+        go.Figure
+            Gráfico de linha
+        """
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=df['date'],
@@ -468,8 +690,7 @@ class DashboardPage(BasePage):
             yaxis_title="Valor (R$)",
             hovermode='x unified'
         )
-
-        st.plotly_chart(fig, width='stretch')
+        return fig
 
     def _render_category_chart(self, data: Dict[str, Any]) -> None:
         """
@@ -482,35 +703,23 @@ class DashboardPage(BasePage):
         """
         st.markdown("#### 💰 Receitas por Categoria")
 
-        if not data['revenues']:
+        if not data['revenues']['count']:
             st.info("📝 Nenhuma receita encontrada no período selecionado.")
             return
 
-        # Processa dados para o gráfico
-        category_totals: Dict[str, float] = {}
-        for revenue in data['revenues']:
-            category = revenue.get('category', 'others')
-            category_name = db_categories.REVENUE_CATEGORIES.get(
-                category, category)
-            value = float(revenue.get('value', 0))
-            category_totals[category_name] = category_totals.get(
-                category_name, 0) + value
-
-        if category_totals:
-            # Cria DataFrame
-            df = pd.DataFrame(
-                list(category_totals.items()),
-                columns=['Categoria', 'Valor']
-            )
+        df = label_totals(
+            data['revenues']['by_category'], db_categories.REVENUE_CATEGORIES
+        )
 
-            # Gráfico de pizza
-            fig = px.pie(
+        if not df.empty:
+            # Gráfico de pizza, reconstruído apenas se os totais mudarem
+            fig = figure_cache.get_or_build(
+                'dashboard_revenues_pie',
                 df,
-                values='Valor',
-                names='Categoria',
-                title="Distribuição de Receitas"
+                partial(
+                    self._build_category_pie, title="Distribuição de Receitas"
+                )
             )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
             st.plotly_chart(fig, width='stretch')
         else:
             st.info("📊 Dados insuficientes para gerar gráfico.")
@@ -568,55 +777,52 @@ class DashboardPage(BasePage):
         """
         st.markdown("### 📋 Transações Recentes")
 
-        # Combina todas as transações
-        recent_transactions = []
-
-        # Adiciona despesas
-        for expense in data['expenses']:
-            recent_transactions.append({
-                'date': format_date_for_display(expense.get('date')),
-                'time': expense.get('horary', '00:00:00'),
-                'description': expense.get('description', 'Despesa'),
-                'value': f"-{format_currency_br(expense.get('value', 0))}",
-                'type': 'Despesa',
-                'category': db_categories.EXPENSE_CATEGORIES.get(
-                    expense.get('category', 'others'),
-                    expense.get('category', 'Outros')
-                ),
-                'status': '✅ Pago' if expense.get('payed', False) else (
-                    '⏳ Pendente'
-                )
-            })
-
-        # Adiciona receitas
-        for revenue in data['revenues']:
-            recent_transactions.append({
-                'date': format_date_for_display(revenue.get('date')),
-                'time': revenue.get('horary', '00:00:00'),
-                'description': revenue.get('description', 'Receita'),
-                'value': f"+{format_currency_br(revenue.get('value', 0))}",
-                'type': 'Receita',
-                'category': db_categories.REVENUE_CATEGORIES.get(
-                    revenue.get('category', 'others'),
-                    revenue.get('category', 'Outros')
-                ),
-                'status': '✅ Recebido' if revenue.get('received', False) else (
-                    '⏳ Pendente'
-                )
-            })
+        # Seleciona as mais recentes pela data e horário brutos; apenas
+        # as selecionadas são formatadas
+        winners = top_recent_transactions(
+            {
+                'expense': data['expenses']['recent'],
+                'revenue': data['revenues']['recent']
+            },
+            k=app_config.DASHBOARD_RECENT_TRANSACTIONS
+        )
 
-        if not recent_transactions:
+        if not winners:
             st.info("📝 Nenhuma transação encontrada no período selecionado.")
             return
 
-        # Ordena por data e horário (mais recentes primeiro)
-        recent_transactions.sort(
-            key=lambda x: (x['date'], x['time']),
-            reverse=True
-        )
-
-        # Limita a 10 transações mais recentes
-        recent_transactions = recent_transactions[:10]
+        recent_transactions = []
+        for kind, transaction in winners:
+            if kind == 'expense':
+                recent_transactions.append({
+                    'date': format_date_for_display(transaction.get('date')),
+                    'description': transaction.get('description', 'Despesa'),
+                    'value': (
+                        f"-{format_currency_br(transaction.get('value', 0))}"
+                    ),
+                    'category': db_categories.EXPENSE_CATEGORIES.get(
+                        transaction.get('category', 'others'),
+                        transaction.get('category', 'Outros')
+                    ),
+                    'status': '✅ Pago' if transaction.get(
+                        'payed', False
+                    ) else '⏳ Pendente'
+                })
+            else:
+                recent_transactions.append({
+                    'date': format_date_for_display(transaction.get('date')),
+                    'description': transaction.get('description', 'Receita'),
+                    'value': (
+                        f"+{format_currency_br(transaction.get('value', 0))}"
+                    ),
+                    'category': db_categories.REVENUE_CATEGORIES.get(
+                        transaction.get('category', 'others'),
+                        transaction.get('category', 'Outros')
+                    ),
+                    'status': '✅ Recebido' if transaction.get(
+                        'received', False
+                    ) else '⏳ Pendente'
+                })
 
         # Renderiza como DataFrame
         df = pd.DataFrame(recent_transactions)
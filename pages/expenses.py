@@ -15,6 +15,8 @@ import streamlit as st
 from components.auth import require_auth
 from services.expenses_service import expenses_service
 from services.api_client import api_client, ApiClientError, ValidationError
+from utils.date_utils import format_date_for_display
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components, centered_tabs
 from config.settings import db_categories
 
@@ -25,9 +27,15 @@ logger = logging.getLogger(__name__)
 class ExpensesPage:
     """Página de gerenciamento de despesas com padrão visual padronizado."""
 
+    # Prefixo das chaves da listagem no session_state
+    LIST_KEY = "expenses_list"
+    # Escopo das marcações de interface por registro
+    UI_SCOPE = "expenses"
+
     def __init__(self):
         """Inicializa a página de despesas."""
         self.auth = require_auth()
+        self.ui_state = ui_state.scope(self.UI_SCOPE)
 
     def main_menu(
             self,
@@ -119,6 +127,10 @@ class ExpensesPage:
                 format_func=lambda x: f"{self._get_category_emoji(x)} {x}"
             )
 
+        query = ui_components.render_search_box(
+            self.LIST_KEY, "Descrição ou conta"
+        )
+
         # Busca despesas
         try:
             with st.spinner("🔄 Carregando despesas..."):
@@ -147,10 +159,18 @@ class ExpensesPage:
                 )
                 return
 
+            if query:
+                expenses = expenses_service.search_expenses(query, expenses)
+                if not expenses:
+                    st.info("🔍 Nenhuma despesa encontrada para a busca.")
+                    return
+
             st.markdown("---")
 
             # Renderiza despesas no padrão de 3 colunas
-            self._render_expenses_three_column_layout(expenses)
+            self._render_expenses_three_column_layout(
+                expenses, ranked=bool(query)
+            )
 
         except Exception as e:
             ui_components.show_persistent_error(
@@ -164,77 +184,95 @@ class ExpensesPage:
                 ])
             logger.error(f"Erro ao carregar despesas: {e}")
 
-    def _render_expenses_three_column_layout(self, expenses: List[Dict]):
+    def _render_expenses_three_column_layout(
+        self,
+        expenses: List[Dict],
+        ranked: bool = False
+    ):
         """
         Renderiza despesas no layout padronizado de 3 colunas.
 
+        Apenas a página visível da listagem cria widgets.
+
         Parameters
         ----------
         expenses : List[Dict]
             Lista de despesas para exibir
+        ranked : bool, optional
+            Se a lista está na ordem de relevância de uma busca, sem o
+            salto para uma data
         """
-        for expense in expenses:
-            # Container para cada despesa
-            with st.container():
-                col1, col2, col3 = st.columns([3, 3, 1])
+        ui_components.render_windowed_list(
+            expenses,
+            key=self.LIST_KEY,
+            render_item=self._render_expense_row,
+            date_field=None if ranked else 'date',
+            state=self.ui_state
+        )
 
-                with col1:
-                    # Primeira coluna: descrição + emoji da categoria
-                    category = expense.get('category', 'others')
-                    category_display = db_categories.EXPENSE_CATEGORIES.get(
-                        category, 'Outros'
-                    )
-                    emoji = self._get_category_emoji(category_display)
+    def _render_expense_row(self, expense: Dict):
+        """
+        Renderiza uma despesa no layout de 3 colunas.
+
+        Parameters
+        ----------
+        expense : Dict
+            Dados da despesa
+        """
+        # Container para cada despesa
+        with st.container():
+            col1, col2, col3 = st.columns([3, 3, 1])
+
+            with col1:
+                # Primeira coluna: descrição + emoji da categoria
+                category = expense.get('category', 'others')
+                category_display = db_categories.EXPENSE_CATEGORIES.get(
+                    category, 'Outros'
+                )
+                emoji = self._get_category_emoji(category_display)
 
-                    st.markdown(f"""
-                    **Descrição: {emoji} {expense.get('description', 'N/A')}**
+                st.markdown(f"""
+                **Descrição: {emoji} {expense.get('description', 'N/A')}**
 
-                    📂 Categoria: {category_display}
-                    """)
+                📂 Categoria: {category_display}
+                """)
 
-                with col2:
-                    # Segunda coluna (central): dados principais
-                    value = expense.get('value', 0)
-                    expense_date = expense.get('date', 'N/A')
-                    expense_date_iso = datetime.strptime(
-                        expense_date,
-                        '%Y-%m-%d'
-                    )
-                    br_expense_date = expense_date_iso.strftime(
-                        '%d/%m/%Y'
-                    )
-                    payed_status = "✅ Pago" if expense.get(
-                        'payed', False
-                    ) else "⏳ Pendente"
+            with col2:
+                # Segunda coluna (central): dados principais
+                value = expense.get('value', 0)
+                br_expense_date = format_date_for_display(
+                    expense.get('date')
+                )
+                payed_status = "✅ Pago" if expense.get(
+                    'payed', False
+                ) else "⏳ Pendente"
 
-                    account_name = expense.get('account_name', 'N/A')
-                    st.markdown(f"""
-                    **💰 Valor: R$ {float(value):.2f}**
+                account_name = expense.get('account_name', 'N/A')
+                st.markdown(f"""
+                **💰 Valor: R$ {float(value):.2f}**
 
-                    🏦 Conta: {account_name}
+                🏦 Conta: {account_name}
 
-                    📅 Data: {br_expense_date}
+                📅 Data: {br_expense_date}
 
-                    Status: {payed_status}
-                    """)
+                Status: {payed_status}
+                """)
 
-                with col3:
-                    # Terceira coluna (direita): botão de ações
-                    if st.button(
-                        "⚙️",
-                        key=f"actions_{expense['id']}",
-                        help="Opções de ações",
-                        use_container_width=True
-                    ):
-                        st.session_state[
-                            f'show_actions_{expense["id"]}'
-                        ] = True
-                        st.rerun()
+            with col3:
+                # Terceira coluna (direita): botão de ações
+                if st.button(
+                    "⚙️",
+                    key=f"actions_{expense['id']}",
+                    help="Opções de ações",
+                    use_container_width=True
+                ):
+                    self.ui_state.set('actions', expense['id'])
+                    ui_components.rerun_fragment()
 
-                # Popup de ações para esta despesa
-                self._render_expense_action_popup(expense)
+            # Popup de ações para esta despesa
+            self._render_expense_action_popup(expense)
 
-                st.markdown("---")
+            st.markdown("---")
 
     def _render_expense_action_popup(self, expense: Dict):
         """
@@ -245,9 +283,7 @@ class ExpensesPage:
         expense : Dict
             Dados da despesa
         """
-        popup_key = f'show_actions_{expense["id"]}'
-
-        if st.session_state.get(popup_key, False):
+        if self.ui_state.is_set('actions', expense['id']):
             with st.expander(
                 f"⚙️ Ações para: {expense.get('description', 'N/A')}",
                 expanded=True
@@ -261,11 +297,9 @@ class ExpensesPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[
-                            f'edit_expense_{expense["id"]}'
-                        ] = expense
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('edit', expense['id'])
+                        self.ui_state.clear('actions', expense['id'])
+                        ui_components.rerun_fragment()
 
                 with col2:
                     if st.button(
@@ -274,11 +308,9 @@ class ExpensesPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[
-                            f'delete_expense_{expense["id"]}'
-                        ] = expense
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('delete', expense['id'])
+                        self.ui_state.clear('actions', expense['id'])
+                        ui_components.rerun_fragment()
 
                 with col3:
                     if st.button(
@@ -286,8 +318,8 @@ class ExpensesPage:
                         key=f"close_{expense['id']}",
                         use_container_width=True
                     ):
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', expense['id'])
+                        ui_components.rerun_fragment()
 
         # Renderiza modals de edição e exclusão
         self._render_edit_expense_modal(expense)
@@ -302,9 +334,7 @@ class ExpensesPage:
         expense : Dict
             Dados da despesa para editar
         """
-        edit_key = f'edit_expense_{expense["id"]}'
-
-        if st.session_state.get(edit_key):
+        if self.ui_state.is_set('edit', expense['id']):
             st.markdown("### ✏️ Editar Despesa")
 
             with st.form(f"edit_form_{expense['id']}", clear_on_submit=False):
@@ -382,13 +412,12 @@ class ExpensesPage:
                         expense['horary'],
                         category,
                         expense['account'],
-                        payed,
-                        edit_key
+                        payed
                     )
 
                 if cancelled:
-                    st.session_state.pop(edit_key, None)
-                    st.rerun()
+                    self.ui_state.clear('edit', expense['id'])
+                    ui_components.rerun_fragment()
 
     def _render_delete_expense_modal(self, expense: Dict):
         """
@@ -399,9 +428,7 @@ class ExpensesPage:
         expense : Dict
             Dados da despesa para excluir
         """
-        delete_key = f'delete_expense_{expense["id"]}'
-
-        if st.session_state.get(delete_key):
+        if self.ui_state.is_set('delete', expense['id']):
             st.markdown("### 🗑️ Confirmar Exclusão")
 
             st.warning(
@@ -421,7 +448,7 @@ class ExpensesPage:
                     key=f"confirm_delete_{expense['id']}",
                     use_container_width=True
                 ):
-                    self._handle_delete_expense(expense['id'], delete_key)
+                    self._handle_delete_expense(expense['id'])
 
             with col_cancel:
                 if st.button(
@@ -429,8 +456,8 @@ class ExpensesPage:
                     key=f"cancel_delete_{expense['id']}",
                     use_container_width=True
                 ):
-                    st.session_state.pop(delete_key, None)
-                    st.rerun()
+                    self.ui_state.clear('delete', expense['id'])
+                    ui_components.rerun_fragment()
 
     def _render_add_expense_form_standardized(self):
         """Renderiza formulário padronizado de adição de despesa."""
@@ -694,8 +721,7 @@ class ExpensesPage:
         horary: str,
         category: str,
         account: str,
-        payed: bool,
-        edit_key: str
+        payed: bool
     ):
         """
         Processa submissão da edição de despesa.
@@ -712,8 +738,6 @@ class ExpensesPage:
             Nova categoria
         payed : bool
             Novo status de pagamento
-        edit_key : str
-            Chave da sessão para limpeza
         """
         if not description or not value:
             st.error("❌ Por favor, preencha todos os campos obrigatórios!")
@@ -743,8 +767,9 @@ class ExpensesPage:
 
             if result:
                 st.success("✅ Despesa atualizada com sucesso!")
-                st.session_state.pop(edit_key, None)
-                st.rerun()
+                self.ui_state.clear('edit', expense_id)
+                ui_components.replace_list_record(self.LIST_KEY, result)
+                ui_components.rerun_fragment()
             else:
                 st.error("❌ Erro ao atualizar despesa!")
 
@@ -752,7 +777,7 @@ class ExpensesPage:
             st.error(f"❌ Erro ao atualizar: {str(e)}")
             logger.error(f"Erro ao atualizar despesa {expense_id}: {e}")
 
-    def _handle_delete_expense(self, expense_id: int, delete_key: str):
+    def _handle_delete_expense(self, expense_id: int):
         """
         Processa exclusão de despesa.
 
@@ -760,14 +785,13 @@ class ExpensesPage:
         ----------
         expense_id : int
             ID da despesa para excluir
-        delete_key : str
-            Chave da sessão para limpeza
         """
         try:
             with st.spinner("🗑️ Excluindo despesa..."):
                 expenses_service.delete_expense(expense_id)
             st.success("✅ Despesa excluída com sucesso!")
-            st.session_state.pop(delete_key, None)
+            self.ui_state.clear('delete', expense_id)
+            # A exclusão muda a contagem e a paginação da listagem
             st.rerun()
 
         except Exception as e:
@@ -7,13 +7,17 @@ e layout de 3 colunas para listagem.
 """
 
 import logging
-from datetime import date, datetime
+from datetime import date
 from typing import Dict, List
 
 import streamlit as st
 
 from components.auth import require_auth
 from services.api_client import api_client, ApiClientError, ValidationError
+from services.members_service import members_service
+from utils.filter_spec import FilterSpec
+from utils.records import Member, parse_date
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components, centered_tabs
 from config.settings import db_categories
 
@@ -24,9 +28,23 @@ logger = logging.getLogger(__name__)
 class MembersPage:
     """Página de gerenciamento de membros com padrão visual padronizado."""
 
+    # Prefixo das chaves da listagem no session_state
+    LIST_KEY = "members_list"
+    # Escopo das marcações de interface por registro
+    UI_SCOPE = "members"
+    # Valor de active de cada opção do filtro de status
+    STATUS_FILTERS = {'Ativos': True, 'Inativos': False}
+    # Campo booleano de cada opção do filtro de tipo
+    TYPE_FILTERS = {
+        'Usuários': 'is_user',
+        'Credores': 'is_creditor',
+        'Beneficiários': 'is_benefited'
+    }
+
     def __init__(self):
         """Inicializa a página de membros."""
         self.auth = require_auth()
+        self.ui_state = ui_state.scope(self.UI_SCOPE)
 
     def render(self):
         """
@@ -114,77 +132,90 @@ class MembersPage:
         """
         Renderiza membros no layout padronizado de 3 colunas.
 
+        Apenas a página visível da listagem cria widgets.
+
         Parameters
         ----------
         members : List[Dict]
             Lista de membros para exibir
         """
-        for member in members:
-            # Container para cada membro
-            with st.container():
-                col1, col2, col3 = st.columns([3, 3, 1])
+        ui_components.render_windowed_list(
+            members,
+            key=self.LIST_KEY,
+            render_item=self._render_member_row,
+            state=self.ui_state
+        )
 
-                with col1:
-                    # Primeira coluna: nome + emoji do tipo
-                    emoji = self._get_member_type_emoji(member)
-                    member_type = self._get_member_type_display(member)
+    def _render_member_row(self, member: Dict):
+        """
+        Renderiza um membro no layout de 3 colunas.
 
-                    st.markdown(f"""
-                    **{emoji} {member.get('name', 'N/A')}**
+        Parameters
+        ----------
+        member : Dict
+            Dados do membro
+        """
+        # Container para cada membro
+        with st.container():
+            col1, col2, col3 = st.columns([3, 3, 1])
 
-                    📂 {member_type}
+            with col1:
+                # Primeira coluna: nome + emoji do tipo
+                emoji = self._get_member_type_emoji(member)
+                member_type = self._get_member_type_display(member)
 
-                    🆔 {member.get('document', 'N/A')}
-                    """)
+                st.markdown(f"""
+                **{emoji} {member.get('name', 'N/A')}**
 
-                with col2:
-                    # Segunda coluna (central): dados principais
-                    phone = member.get('phone', '')
-                    email = member.get('email', '')
-                    status = "✅ Ativo" if member.get(
-                        'active', True
-                    ) else "⏸️ Inativo"
+                📂 {member_type}
 
-                    # Idade se disponível
-                    birth_date = member.get('birth_date')
-                    age_display = ""
-                    if birth_date:
-                        try:
-                            birth = datetime.fromisoformat(birth_date).date()
-                            today = date.today()
-                            age = today.year - birth.year - (
-                                (today.month, today.day) < (
-                                    birth.month, birth.day)
-                            )
-                            age_display = f"🎂 {age} anos"
-                        except BaseException:
-                            age_display = ""
+                🆔 {member.get('document', 'N/A')}
+                """)
 
-                    st.markdown(f"""
-                    **📞 {phone or 'N/A'}**
+            with col2:
+                # Segunda coluna (central): dados principais
+                phone = member.get('phone', '')
+                email = member.get('email', '')
+                status = "✅ Ativo" if member.get(
+                    'active', True
+                ) else "⏸️ Inativo"
+
+                # Idade se disponível
+                birth = parse_date(member.get('birth_date'))
+                age_display = ""
+                if birth:
+                    today = date.today()
+                    age = today.year - birth.year - (
+                        (today.month, today.day) < (
+                            birth.month, birth.day)
+                    )
+                    age_display = f"🎂 {age} anos"
 
-                    **📧 {email or 'N/A'}**
+                st.markdown(f"""
+                **📞 {phone or 'N/A'}**
 
-                    {age_display}
+                **📧 {email or 'N/A'}**
 
-                    {status}
-                    """)
+                {age_display}
 
-                with col3:
-                    # Terceira coluna (direita): botão de ações
-                    if st.button(
-                        "⚙️",
-                        key=f"actions_{member['id']}",
-                        help="Opções de ações",
-                        use_container_width=True
-                    ):
-                        st.session_state[f'show_actions_{member["id"]}'] = True
-                        st.rerun()
+                {status}
+                """)
+
+            with col3:
+                # Terceira coluna (direita): botão de ações
+                if st.button(
+                    "⚙️",
+                    key=f"actions_{member['id']}",
+                    help="Opções de ações",
+                    use_container_width=True
+                ):
+                    self.ui_state.set('actions', member['id'])
+                    ui_components.rerun_fragment()
 
-                # Popup de ações para este membro
-                self._render_member_action_popup(member)
+            # Popup de ações para este membro
+            self._render_member_action_popup(member)
 
-                st.markdown("---")
+            st.markdown("---")
 
     def _render_member_action_popup(self, member: Dict):
         """
@@ -195,9 +226,7 @@ class MembersPage:
         member : Dict
             Dados do membro
         """
-        popup_key = f'show_actions_{member["id"]}'
-
-        if st.session_state.get(popup_key, False):
+        if self.ui_state.is_set('actions', member['id']):
             with st.expander(
                 f"⚙️ Ações para: {member.get('name', 'N/A')}",
                 expanded=True
@@ -211,11 +240,9 @@ class MembersPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[f'edit_member_{member["id"]}'] = (
-                            member
-                        )
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('edit', member['id'])
+                        self.ui_state.clear('actions', member['id'])
+                        ui_components.rerun_fragment()
 
                 with col2:
                     action_text = "⏸️ Desativar" if member.get(
@@ -228,8 +255,8 @@ class MembersPage:
                         use_container_width=True
                     ):
                         self._handle_toggle_member_status(member)
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', member['id'])
+                        ui_components.rerun_fragment()
 
                 with col3:
                     if st.button(
@@ -237,8 +264,8 @@ class MembersPage:
                         key=f"close_{member['id']}",
                         use_container_width=True
                     ):
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', member['id'])
+                        ui_components.rerun_fragment()
 
         # Renderiza modal de edição
         self._render_edit_member_modal(member)
@@ -252,9 +279,7 @@ class MembersPage:
         member : Dict
             Dados do membro para editar
         """
-        edit_key = f'edit_member_{member["id"]}'
-
-        if st.session_state.get(edit_key):
+        if self.ui_state.is_set('edit', member['id']):
             st.markdown("### ✏️ Editar Membro")
 
             with st.form(f"edit_form_{member['id']}", clear_on_submit=False):
@@ -305,15 +330,7 @@ class MembersPage:
                     )
 
                     # Data de nascimento
-                    birth_date = None
-                    birth_date_str = member.get('birth_date')
-                    if birth_date_str:
-                        try:
-                            birth_date = datetime.fromisoformat(
-                                birth_date_str
-                            ).date()
-                        except BaseException:
-                            birth_date = None
+                    birth_date = parse_date(member.get('birth_date'))
 
                     birth_date = st.date_input(
                         "🎂 Data de Nascimento",
@@ -393,12 +410,12 @@ class MembersPage:
                         member['id'], name, document, phone, email,
                         sex, birth_date, occupation, monthly_income,
                         emergency_contact, is_creditor, is_benefited,
-                        address, notes, edit_key
+                        address, notes
                     )
 
                 if cancelled:
-                    st.session_state.pop(edit_key, None)
-                    st.rerun()
+                    self.ui_state.clear('edit', member['id'])
+                    ui_components.rerun_fragment()
 
     def _render_add_member_form_standardized(self):
         """Renderiza formulário padronizado de adição de membro."""
@@ -562,7 +579,7 @@ class MembersPage:
     def _fetch_members(
             self,
             status_filter: str,
-            type_filter: str) -> List[Dict]:
+            type_filter: str) -> List[Member]:
         """
         Busca membros com filtros aplicados.
 
@@ -575,54 +592,20 @@ class MembersPage:
 
         Returns
         -------
-        List[Dict]
+        List[Member]
             Lista de membros filtrados
         """
+        type_field = self.TYPE_FILTERS.get(type_filter)
+        filters = FilterSpec(
+            active=self.STATUS_FILTERS.get(status_filter),
+            **({type_field: True} if type_field else {})
+        )
+
         try:
-            members_response = api_client.get("members/")
-            members = (
-                members_response.get('results', members_response)
-                if isinstance(members_response, dict)
-                else members_response
+            return members_service.get_all_members(
+                active=None, filters=filters
             )
 
-            if not members:
-                return []
-
-            # Aplica filtros
-            filtered_members = members
-
-            # Filtro por status
-            if status_filter == 'Ativos':
-                filtered_members = [
-                    m for m in filtered_members
-                    if m.get('active', True)
-                ]
-            elif status_filter == 'Inativos':
-                filtered_members = [
-                    m for m in filtered_members
-                    if not m.get('active', True)
-                ]
-
-            # Filtro por tipo
-            if type_filter == 'Usuários':
-                filtered_members = [
-                    m for m in filtered_members
-                    if m.get('user_id')
-                ]
-            elif type_filter == 'Credores':
-                filtered_members = [
-                    m for m in filtered_members
-                    if m.get('is_creditor', False)
-                ]
-            elif type_filter == 'Beneficiários':
-                filtered_members = [
-                    m for m in filtered_members
-                    if m.get('is_benefited', False)
-                ]
-
-            return filtered_members
-
         except Exception as e:
             logger.error(f"Erro ao buscar membros: {e}")
             raise
@@ -726,7 +709,7 @@ class MembersPage:
         email: str, sex: str, birth_date: date, occupation: str,
         monthly_income: float, emergency_contact: str,
         is_creditor: bool, is_benefited: bool, address: str,
-        notes: str, edit_key: str
+        notes: str
     ):
         """
         Processa submissão da edição de membro.
@@ -761,8 +744,6 @@ class MembersPage:
             Novo endereço
         notes : str
             Novas observações
-        edit_key : str
-            Chave da sessão
         """
         if not name or not document:
             st.error("❌ Por favor, preencha todos os campos obrigatórios!")
@@ -798,8 +779,9 @@ class MembersPage:
 
             if result:
                 st.success("✅ Membro atualizado com sucesso!")
-                st.session_state.pop(edit_key, None)
-                st.rerun()
+                self.ui_state.clear('edit', member_id)
+                ui_components.replace_list_record(self.LIST_KEY, result)
+                ui_components.rerun_fragment()
             else:
                 st.error("❌ Erro ao atualizar membro!")
 
@@ -831,7 +813,8 @@ class MembersPage:
                 st.success(
                     f"✅ Membro {status_text} com sucesso!"
                 )
-                st.rerun()
+                ui_components.replace_list_record(self.LIST_KEY, result)
+                ui_components.rerun_fragment()
             else:
                 st.error(
                     f"❌ Erro ao {'ativar' if new_status else 'desativar'} "
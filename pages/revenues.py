@@ -15,6 +15,8 @@ import streamlit as st
 from components.auth import require_auth
 from services.revenues_service import revenues_service
 from services.api_client import api_client, ApiClientError, ValidationError
+from utils.date_utils import format_date_for_display
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components, centered_tabs
 from config.settings import db_categories
 
@@ -25,9 +27,15 @@ logger = logging.getLogger(__name__)
 class RevenuesPage:
     """Página de gerenciamento de receitas com padrão visual padronizado."""
 
+    # Prefixo das chaves da listagem no session_state
+    LIST_KEY = "revenues_list"
+    # Escopo das marcações de interface por registro
+    UI_SCOPE = "revenues"
+
     def __init__(self):
         """Inicializa a página de receitas."""
         self.auth = require_auth()
+        self.ui_state = ui_state.scope(self.UI_SCOPE)
 
     def main_menu(self, token=None, permissions=None):
         """
@@ -109,6 +117,10 @@ class RevenuesPage:
                 format_func=lambda x: f"{self._get_category_emoji(x)} {x}"
             )
 
+        query = ui_components.render_search_box(
+            self.LIST_KEY, "Descrição, fonte, observações ou conta"
+        )
+
         # Busca receitas
         try:
             with st.spinner("🔄 Carregando receitas..."):
@@ -137,10 +149,18 @@ class RevenuesPage:
                 )
                 return
 
+            if query:
+                revenues = revenues_service.search_revenues(query, revenues)
+                if not revenues:
+                    st.info("🔍 Nenhuma receita encontrada para a busca.")
+                    return
+
             st.markdown("---")
 
             # Renderiza receitas no padrão de 3 colunas
-            self._render_revenues_three_column_layout(revenues)
+            self._render_revenues_three_column_layout(
+                revenues, ranked=bool(query)
+            )
 
         except Exception as e:
             ui_components.show_persistent_error(
@@ -154,93 +174,114 @@ class RevenuesPage:
                 ])
             logger.error(f"Erro ao carregar receitas: {e}")
 
-    def _render_revenues_three_column_layout(self, revenues: List[Dict]):
+    def _render_revenues_three_column_layout(
+        self,
+        revenues: List[Dict],
+        ranked: bool = False
+    ):
         """
         Renderiza receitas no layout padronizado de 3 colunas.
 
+        Apenas a página visível da listagem cria widgets.
+
         Parameters
         ----------
         revenues : List[Dict]
             Lista de receitas para exibir
+        ranked : bool, optional
+            Se a lista está na ordem de relevância de uma busca, sem o
+            salto para uma data
         """
-        for revenue in revenues:
-            # Container para cada receita
-            with st.container():
-                col1, col2, col3 = st.columns([3, 3, 1])
+        ui_components.render_windowed_list(
+            revenues,
+            key=self.LIST_KEY,
+            render_item=self._render_revenue_row,
+            date_field=None if ranked else 'date',
+            state=self.ui_state
+        )
 
-                with col1:
-                    # Primeira coluna: descrição + emoji da categoria
-                    category = revenue.get('category', 'deposit')
-                    category_display = db_categories.REVENUE_CATEGORIES.get(
-                        category, 'Depósito'
+    def _render_revenue_row(self, revenue: Dict):
+        """
+        Renderiza uma receita no layout de 3 colunas.
+
+        Parameters
+        ----------
+        revenue : Dict
+            Dados da receita
+        """
+        # Container para cada receita
+        with st.container():
+            col1, col2, col3 = st.columns([3, 3, 1])
+
+            with col1:
+                # Primeira coluna: descrição + emoji da categoria
+                category = revenue.get('category', 'deposit')
+                category_display = db_categories.REVENUE_CATEGORIES.get(
+                    category, 'Depósito'
+                )
+                emoji = self._get_category_emoji(category_display)
+                received_status = "✅ Recebido" if revenue.get(
+                    'received', False
+                ) else "⏳ Pendente"
+
+                # Fonte da receita
+                st.markdown(f"""
+                **Descrição: {
+                    emoji
+                } {
+                    revenue.get('description', 'N/A')
+                }**
+
+                📂 Categoria: {
+                    db_categories.REVENUE_CATEGORY_EMOJIS.get(
+                        category,
+                        'deposit'
                     )
-                    emoji = self._get_category_emoji(category_display)
-                    received_status = "✅ Recebido" if revenue.get(
-                        'received', False
-                    ) else "⏳ Pendente"
-
-                    # Fonte da receita
-                    st.markdown(f"""
-                    **Descrição: {
-                        emoji
-                    } {
-                        revenue.get('description', 'N/A')
-                    }**
-
-                    📂 Categoria: {
-                        db_categories.REVENUE_CATEGORY_EMOJIS.get(
-                            category,
-                            'deposit'
-                        )
-                    } {category_display}
+                } {category_display}
 
-                    Status: {received_status}
+                Status: {received_status}
 
-                    """)
+                """)
 
-                with col2:
-                    # Valor líquido se disponível
-                    net_amount = revenue.get('net_amount')
-                    net_display = (
-                        f"💚 Líquido: R$ {float(net_amount):.2f}" if (
-                            net_amount
-                        ) else ""
-                    )
-                    # Segunda coluna (central): dados principais
-                    value = revenue.get('value', 0)
-                    revenue_date = revenue.get('date', 'N/A')
-                    revenue_date_iso = datetime.strptime(
-                        revenue_date, '%Y-%m-%d'
-                    )
-                    br_revenue_date = revenue_date_iso.strftime('%d/%m/%Y')
-                    account_name = revenue.get('account_name', 'N/A')
-                    st.markdown(f"""
-                    **💰 Valor: R$ {float(value):.2f}**
+            with col2:
+                # Valor líquido se disponível
+                net_amount = revenue.get('net_amount')
+                net_display = (
+                    f"💚 Líquido: R$ {float(net_amount):.2f}" if (
+                        net_amount
+                    ) else ""
+                )
+                # Segunda coluna (central): dados principais
+                value = revenue.get('value', 0)
+                br_revenue_date = format_date_for_display(
+                    revenue.get('date')
+                )
+                account_name = revenue.get('account_name', 'N/A')
+                st.markdown(f"""
+                **💰 Valor: R$ {float(value):.2f}**
 
-                    {net_display}
+                {net_display}
 
-                    🏦 Conta: {account_name}
+                🏦 Conta: {account_name}
 
-                    Data: 📅 {br_revenue_date}
-                    """)
+                Data: 📅 {br_revenue_date}
+                """)
 
-                with col3:
-                    # Terceira coluna (direita): botão de ações
-                    if st.button(
-                        "⚙️",
-                        key=f"actions_{revenue['id']}",
-                        help="Opções de ações",
-                        use_container_width=True
-                    ):
-                        st.session_state[
-                            f'show_actions_{revenue["id"]}'
-                        ] = True
-                        st.rerun()
+            with col3:
+                # Terceira coluna (direita): botão de ações
+                if st.button(
+                    "⚙️",
+                    key=f"actions_{revenue['id']}",
+                    help="Opções de ações",
+                    use_container_width=True
+                ):
+                    self.ui_state.set('actions', revenue['id'])
+                    ui_components.rerun_fragment()
 
-                # Popup de ações para esta receita
-                self._render_revenue_action_popup(revenue)
+            # Popup de ações para esta receita
+            self._render_revenue_action_popup(revenue)
 
-                st.markdown("---")
+            st.markdown("---")
 
     def _render_revenue_action_popup(self, revenue: Dict):
         """
@@ -251,9 +292,7 @@ class RevenuesPage:
         revenue : Dict
             Dados da receita
         """
-        popup_key = f'show_actions_{revenue["id"]}'
-
-        if st.session_state.get(popup_key, False):
+        if self.ui_state.is_set('actions', revenue['id']):
             with st.expander(
                 f"⚙️ Ações para: {revenue.get('description', 'N/A')}",
                 expanded=True
@@ -267,11 +306,9 @@ class RevenuesPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[
-                            f'edit_revenue_{revenue["id"]}'
-                        ] = revenue
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('edit', revenue['id'])
+                        self.ui_state.clear('actions', revenue['id'])
+                        ui_components.rerun_fragment()
 
                 with col2:
                     if st.button(
@@ -280,11 +317,9 @@ class RevenuesPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[
-                            f'delete_revenue_{revenue["id"]}'
-                        ] = revenue
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('delete', revenue['id'])
+                        self.ui_state.clear('actions', revenue['id'])
+                        ui_components.rerun_fragment()
 
                 with col3:
                     if st.button(
@@ -292,8 +327,8 @@ class RevenuesPage:
                         key=f"close_{revenue['id']}",
                         use_container_width=True
                     ):
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', revenue['id'])
+                        ui_components.rerun_fragment()
 
         # Renderiza modals de edição e exclusão
         self._render_edit_revenue_modal(revenue)
@@ -308,9 +343,7 @@ class RevenuesPage:
         revenue : Dict
             Dados da receita para editar
         """
-        edit_key = f'edit_revenue_{revenue["id"]}'
-
-        if st.session_state.get(edit_key):
+        if self.ui_state.is_set('edit', revenue['id']):
             st.markdown("### ✏️ Editar Receita")
 
             with st.form(f"edit_form_{revenue['id']}", clear_on_submit=False):
@@ -426,13 +459,12 @@ class RevenuesPage:
                         source or '',
                         tax_amount,
                         net_amount,
-                        notes or '',
-                        edit_key
+                        notes or ''
                     )
 
                 if cancelled:
-                    st.session_state.pop(edit_key, None)
-                    st.rerun()
+                    self.ui_state.clear('edit', revenue['id'])
+                    ui_components.rerun_fragment()
 
     def _render_delete_revenue_modal(self, revenue: Dict):
         """
@@ -443,9 +475,7 @@ class RevenuesPage:
         revenue : Dict
             Dados da receita para excluir
         """
-        delete_key = f'delete_revenue_{revenue["id"]}'
-
-        if st.session_state.get(delete_key):
+        if self.ui_state.is_set('delete', revenue['id']):
             st.markdown("### 🗑️ Confirmar Exclusão")
 
             st.warning(
@@ -465,7 +495,7 @@ class RevenuesPage:
                     key=f"confirm_delete_{revenue['id']}",
                     use_container_width=True
                 ):
-                    self._handle_delete_revenue(revenue['id'], delete_key)
+                    self._handle_delete_revenue(revenue['id'])
 
             with col_cancel:
                 if st.button(
@@ -473,8 +503,8 @@ class RevenuesPage:
                     key=f"cancel_delete_{revenue['id']}",
                     use_container_width=True
                 ):
-                    st.session_state.pop(delete_key, None)
-                    st.rerun()
+                    self.ui_state.clear('delete', revenue['id'])
+                    ui_components.rerun_fragment()
 
     def _render_add_revenue_form_standardized(self):
         """Renderiza formulário padronizado de adição de receita."""
@@ -765,8 +795,7 @@ class RevenuesPage:
         source: str,
         tax_amount: float,
         net_amount: float,
-        notes: str,
-        edit_key: str
+        notes: str
     ):
         """
         Processa submissão da edição de receita.
@@ -791,8 +820,6 @@ class RevenuesPage:
             Novo valor líquido
         notes : str
             Novas observações
-        edit_key : str
-            Chave da sessão para limpeza
         """
         if not description or not value:
             st.error("❌ Por favor, preencha todos os campos obrigatórios!")
@@ -826,8 +853,9 @@ class RevenuesPage:
 
             if result:
                 st.success("✅ Receita atualizada com sucesso!")
-                st.session_state.pop(edit_key, None)
-                st.rerun()
+                self.ui_state.clear('edit', revenue_id)
+                ui_components.replace_list_record(self.LIST_KEY, result)
+                ui_components.rerun_fragment()
             else:
                 st.error("❌ Erro ao atualizar receita!")
 
@@ -835,7 +863,7 @@ class RevenuesPage:
             st.error(f"❌ Erro ao atualizar: {str(e)}")
             logger.error(f"Erro ao atualizar receita {revenue_id}: {e}")
 
-    def _handle_delete_revenue(self, revenue_id: int, delete_key: str):
+    def _handle_delete_revenue(self, revenue_id: int):
         """
         Processa exclusão de receita.
 
@@ -843,15 +871,14 @@ class RevenuesPage:
         ----------
         revenue_id : int
             ID da receita para excluir
-        delete_key : str
-            Chave da sessão para limpeza
         """
         try:
             with st.spinner("🗑️ Excluindo receita..."):
                 revenues_service.delete_revenue(revenue_id)
 
             st.success("✅ Receita excluída com sucesso!")
-            st.session_state.pop(delete_key, None)
+            self.ui_state.clear('delete', revenue_id)
+            # A exclusão muda a contagem e a paginação da listagem
             st.rerun()
 
         except Exception as e:
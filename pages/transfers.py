@@ -16,6 +16,7 @@ import streamlit as st
 from components.auth import require_auth
 from services.transfers_service import transfers_service
 from services.api_client import api_client, ApiClientError, ValidationError
+from utils.ui_state import ui_state
 from utils.ui_utils import ui_components, centered_tabs
 from utils.date_utils import format_currency_br
 from config.settings import db_categories
@@ -26,9 +27,15 @@ logger = logging.getLogger(__name__)
 class TransfersPage:
     """Página de gerenciamento de transferências."""
 
+    # Prefixo das chaves da listagem no session_state
+    LIST_KEY = "transfers_list"
+    # Escopo das marcações de interface por registro
+    UI_SCOPE = "transfers"
+
     def __init__(self):
         """Inicializa a página de transferências."""
         self.auth = require_auth()
+        self.ui_state = ui_state.scope(self.UI_SCOPE)
 
     def main_menu(
             self,
@@ -118,6 +125,10 @@ class TransfersPage:
                 step=10
             )
 
+        query = ui_components.render_search_box(
+            self.LIST_KEY, "Descrição, observações ou contas"
+        )
+
         # Buscar transferências com filtros
         try:
             filters = {}
@@ -138,12 +149,18 @@ class TransfersPage:
             filters['limit'] = int(limit)
 
             transfers = transfers_service.get_all_transfers(**filters)
+            if transfers and query:
+                transfers = transfers_service.search_transfers(
+                    query, transfers
+                )
 
             if transfers:
                 st.markdown(
                     f"**{len(transfers)} transferência(s) encontrada(s)**")
                 st.markdown("---")
-                self._render_transfers_three_column_layout(transfers)
+                self._render_transfers_three_column_layout(
+                    transfers, ranked=bool(query)
+                )
             else:
                 st.info(
                     "🔍 Nenhuma transferência encontrada " +
@@ -157,89 +174,112 @@ class TransfersPage:
             st.error("❌ Erro inesperado. Tente novamente.")
             st.error(e)
 
-    def _render_transfers_three_column_layout(self, transfers: List[Dict]):
+    def _render_transfers_three_column_layout(
+        self,
+        transfers: List[Dict],
+        ranked: bool = False
+    ):
         """
         Renderiza transferências no layout de três colunas.
 
+        Apenas a página visível da listagem cria widgets.
+
         Parameters
         ----------
         transfers : List[Dict]
             Lista de transferências para exibir
+        ranked : bool, optional
+            Se a lista está na ordem de relevância de uma busca, sem o
+            salto para uma data
         """
-        for transfer in transfers:
-            # Container para cada transferência
-            with st.container():
-                col1, col2, col3 = st.columns([3, 4, 1])
+        ui_components.render_windowed_list(
+            transfers,
+            key=self.LIST_KEY,
+            render_item=self._render_transfer_row,
+            date_field=None if ranked else 'date',
+            state=self.ui_state
+        )
 
-                with col1:
-                    # Primeira coluna: descrição + emoji da categoria
-                    category = transfer.get('category', '')
-                    category_display = db_categories.TRANSFER_CATEGORIES.get(
-                        category, category or 'N/A'
-                    )
-                    emoji = self._get_transfer_category_emoji(category)
+    def _render_transfer_row(self, transfer: Dict):
+        """
+        Renderiza uma transferência no layout de 3 colunas.
 
-                    # Status da transferência
-                    status = "✅ Transferida" if transfer.get(
-                        'transfered', False
-                    ) else "⏳ Pendente"
+        Parameters
+        ----------
+        transfer : Dict
+            Dados da transferência
+        """
+        # Container para cada transferência
+        with st.container():
+            col1, col2, col3 = st.columns([3, 4, 1])
 
-                    st.markdown(f"""
-                    **{emoji} Descrição: {transfer.get('description', 'N/A')}**
+            with col1:
+                # Primeira coluna: descrição + emoji da categoria
+                category = transfer.get('category', '')
+                category_display = db_categories.TRANSFER_CATEGORIES.get(
+                    category, category or 'N/A'
+                )
+                emoji = self._get_transfer_category_emoji(category)
 
-                    📂 Tipo: {category_display}
+                # Status da transferência
+                status = "✅ Transferida" if transfer.get(
+                    'transfered', False
+                ) else "⏳ Pendente"
 
-                    {status}
-                    """)
+                st.markdown(f"""
+                **{emoji} Descrição: {transfer.get('description', 'N/A')}**
 
-                with col2:
-                    # Segunda coluna: dados financeiros e contas
-                    value = format_currency_br(transfer.get('value', 0))
-                    transfer_date = transfer.get('date', 'N/A')
-                    horary = transfer.get('horary', 'N/A')
-
-                    # Informações das contas
-                    origin_account = transfer.get('origin_account_name', 'N/A')
-                    destiny_account = transfer.get(
-                        'destiny_account_name', 'N/A')
-
-                    # Taxa se houver
-                    fee = transfer.get('fee', 0)
-                    try:
-                        fee_float = float(fee) if fee else 0.0
-                    except (ValueError, TypeError):
-                        fee_float = 0.0
-                    fee_display = (
-                        f" (Taxa: {format_currency_br(fee_float)})"
-                        if fee_float > 0 else ""
-                    )
+                📂 Tipo: {category_display}
 
-                    st.markdown(f"""
-                    **💰 Valor: {value}{fee_display}**
+                {status}
+                """)
 
-                    🏦 De: {origin_account}
+            with col2:
+                # Segunda coluna: dados financeiros e contas
+                value = format_currency_br(transfer.get('value', 0))
+                transfer_date = transfer.get('date', 'N/A')
+                horary = transfer.get('horary', 'N/A')
+
+                # Informações das contas
+                origin_account = transfer.get('origin_account_name', 'N/A')
+                destiny_account = transfer.get(
+                    'destiny_account_name', 'N/A')
+
+                # Taxa se houver
+                fee = transfer.get('fee', 0)
+                try:
+                    fee_float = float(fee) if fee else 0.0
+                except (ValueError, TypeError):
+                    fee_float = 0.0
+                fee_display = (
+                    f" (Taxa: {format_currency_br(fee_float)})"
+                    if fee_float > 0 else ""
+                )
 
-                    🎯 Para: {destiny_account}
+                st.markdown(f"""
+                **💰 Valor: {value}{fee_display}**
 
-                    📅 Data: {transfer_date} às {horary}
-                    """)
+                🏦 De: {origin_account}
 
-                with col3:
-                    # Terceira coluna: botão de ações
-                    if st.button(
-                        "⚙️",
-                        key=f"actions_{transfer['id']}",
-                        help="Opções de ações",
-                        use_container_width=True
-                    ):
-                        st.session_state[
-                            f'show_actions_{transfer["id"]}'
-                        ] = True
-                        st.rerun()
+                🎯 Para: {destiny_account}
 
-                # Popup de ações para esta transferência
-                self._render_transfer_action_popup(transfer)
-                st.markdown("---")
+                📅 Data: {transfer_date} às {horary}
+                """)
+
+            with col3:
+                # Terceira coluna: botão de ações
+                if st.button(
+                    "⚙️",
+                    key=f"actions_{transfer['id']}",
+                    help="Opções de ações",
+                    use_container_width=True
+                ):
+                    self.ui_state.set('actions', transfer['id'])
+                    ui_components.rerun_fragment()
+
+            # Popup de ações para esta transferência
+            self._render_transfer_action_popup(transfer)
+            st.markdown("---")
 
     def _render_transfer_action_popup(self, transfer: Dict):
         """
@@ -250,8 +290,7 @@ class TransfersPage:
         transfer : Dict
             Dados da transferência
         """
-        popup_key = f'show_actions_{transfer["id"]}'
-        if st.session_state.get(popup_key, False):
+        if self.ui_state.is_set('actions', transfer['id']):
             with st.expander(
                 f"⚙️ Ações para: {transfer.get('description', 'N/A')}",
                 expanded=True
@@ -265,11 +304,9 @@ class TransfersPage:
                         type="secondary",
                         use_container_width=True
                     ):
-                        st.session_state[
-                            f'edit_transfer_{transfer["id"]}'
-                        ] = transfer
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.set('edit', transfer['id'])
+                        self.ui_state.clear('actions', transfer['id'])
+                        ui_components.rerun_fragment()
 
                 with col2:
                     action_text = "✅ Confirmar" if not transfer.get(
@@ -282,8 +319,8 @@ class TransfersPage:
                         use_container_width=True
                     ):
                         self._handle_toggle_transfer_status(transfer)
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', transfer['id'])
+                        ui_components.rerun_fragment()
 
                 with col3:
                     if st.button(
@@ -291,8 +328,8 @@ class TransfersPage:
                         key=f"close_{transfer['id']}",
                         use_container_width=True
                     ):
-                        st.session_state[popup_key] = False
-                        st.rerun()
+                        self.ui_state.clear('actions', transfer['id'])
+                        ui_components.rerun_fragment()
 
         # Renderiza modal de edição
         self._render_edit_transfer_modal(transfer)
@@ -311,15 +348,16 @@ class TransfersPage:
             transfer_data = {'transfered': new_status}
 
             with st.spinner("🔄 Atualizando status..."):
-                transfers_service.update_transfer(
+                result = transfers_service.update_transfer(
                     transfer['id'], transfer_data)
+            ui_components.replace_list_record(self.LIST_KEY, result)
 
             status_text = (
                 "confirmada" if new_status else "marcada como pendente"
             )
             st.success(f"✅ Transferência {status_text} com sucesso!")
             sleep(2)
-            st.rerun()
+            ui_components.rerun_fragment()
 
         except ApiClientError as e:
             st.error(f"❌ Erro ao atualizar transferência: {str(e)}")
@@ -339,9 +377,7 @@ class TransfersPage:
         transfer : Dict[str, Any]
             Dados da transferência para editar
         """
-        edit_key = f'edit_transfer_{transfer["id"]}'
-
-        if st.session_state.get(edit_key):
+        if self.ui_state.is_set('edit', transfer['id']):
             st.markdown("### ✏️ Editar Transferência")
 
             with st.form(f"edit_form_{transfer['id']}", clear_on_submit=False):
@@ -413,12 +449,12 @@ class TransfersPage:
                         category_display=category_display,
                         transfered=transfered
                     )
-                    st.session_state[edit_key] = None
-                    st.rerun()
+                    self.ui_state.clear('edit', transfer['id'])
+                    ui_components.rerun_fragment()
 
                 if canceled:
-                    st.session_state[edit_key] = None
-                    st.rerun()
+                    self.ui_state.clear('edit', transfer['id'])
+                    ui_components.rerun_fragment()
 
     def _process_transfer_edit(
         self,
@@ -480,10 +516,11 @@ class TransfersPage:
                     transfer_id, transfer_data)
 
             if result:
+                ui_components.replace_list_record(self.LIST_KEY, result)
                 st.success("✅ Transferência atualizada com sucesso!")
                 st.balloons()
                 sleep(3)
-                st.rerun()
+                ui_components.rerun_fragment()
             else:
                 st.error("❌ Erro ao atualizar transferência")
 
@@ -6,10 +6,25 @@ gerenciamento de contas financeiras na expenselit-api.
 """
 
 import logging
-from typing import List, Dict, Any
-# Optional
+import threading
+from datetime import date
+from decimal import Decimal
+from functools import partial
+from typing import List, Dict, Any, Optional, Union
+
+import streamlit as st
 
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
+from services.expenses_service import expenses_service
+from services.loans_service import loans_service
+from services.local_ledger import local_ledger
+from services.revenues_service import revenues_service
+from services.transfers_service import transfers_service
+from utils.aggregations import cents_to_decimal
+from utils.balance_ledger import AccountBalanceLedger
+from utils.filter_spec import FilterSpec
+from utils.records import Account
 
 
 logger = logging.getLogger(__name__)
@@ -25,10 +40,27 @@ class AccountsService:
 
     ENDPOINT = "accounts/"
 
+    # Campos filtrados pela API; os demais são aplicados localmente
+    FILTER_FIELDS = ('is_active',)
+
+    # Endpoints das movimentações que geram lançamentos nas contas
+    BALANCE_SOURCES = {
+        'expense': expenses_service.ENDPOINT,
+        'revenue': revenues_service.ENDPOINT,
+        'transfer': transfers_service.ENDPOINT,
+        'loan': loans_service.ENDPOINT
+    }
+
+    def __init__(self):
+        """Inicializa o serviço de contas."""
+        self._balance_ledgers: Dict[str, AccountBalanceLedger] = {}
+        self._lock = threading.Lock()
+
     def get_all_accounts(
         self,
-        active_only: bool = True
-    ) -> List[Dict[str, Any]]:
+        active_only: bool = True,
+        filters: Optional[FilterSpec] = None
+    ) -> List[Account]:
         """
         Obtém todas as contas do usuário.
 
@@ -36,10 +68,13 @@ class AccountsService:
         ----------
         active_only : bool, optional
             Se deve retornar apenas contas ativas, por padrão True
+        filters : FilterSpec, optional
+            Filtros adicionais; os campos de ``FILTER_FIELDS`` são
+            enviados à API e os demais aplicados sobre a resposta
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Account]
             Lista de contas
 
         Raises
@@ -47,23 +82,52 @@ class AccountsService:
         ApiClientError
             Se houver erro na comunicação com a API
         """
+        spec = FilterSpec(is_active=True if active_only else None)
+        spec = spec.merge(filters)
+
         try:
-            params = {"is_active": "true"} if active_only else {}
+            params = spec.to_params(self.FILTER_FIELDS)
             response = api_client.get(self.ENDPOINT, params=params)
 
             # A API pode retornar uma lista direta ou um objeto com 'results'
             if isinstance(response, dict) and 'results' in response:
-                return response['results']
-            elif isinstance(response, list):
-                return response
-            else:
+                response = response['results']
+            elif not isinstance(response, list):
                 return []
+            return spec.apply(
+                [Account.from_api(account) for account in response],
+                self.FILTER_FIELDS
+            )
 
         except ApiClientError as e:
             logger.error(f"Erro ao buscar contas: {e}")
             raise
 
-    def get_account_by_id(self, account_id: int) -> Dict[str, Any]:
+    async def get_all_accounts_async(
+        self,
+        **filters: Any
+    ) -> List[Account]:
+        """
+        Versão assíncrona de ``get_all_accounts``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_accounts``
+
+        Returns
+        -------
+        List[Account]
+            Lista de contas
+        """
+        return await async_api_client.run_sync(
+            self.get_all_accounts, **filters
+        )
+
+    def get_account_by_id(self, account_id: int) -> Account:
         """
         Obtém uma conta específica pelo ID.
 
@@ -74,7 +138,7 @@ class AccountsService:
 
         Returns
         -------
-        Dict[str, Any]
+        Account
             Dados da conta
 
         Raises
@@ -84,12 +148,12 @@ class AccountsService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{account_id}/"
-            return api_client.get(endpoint)
+            return Account.from_api(api_client.get(endpoint))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar conta {account_id}: {e}")
             raise
 
-    def create_account(self, account_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_account(self, account_data: Dict[str, Any]) -> Account:
         """
         Cria uma nova conta.
 
@@ -102,7 +166,7 @@ class AccountsService:
 
         Returns
         -------
-        Dict[str, Any]
+        Account
             Dados da conta criada
 
         Raises
@@ -120,7 +184,9 @@ class AccountsService:
         >>> account = accounts_service.create_account(account_data)
         """
         try:
-            return api_client.post(self.ENDPOINT, account_data)
+            return Account.from_api(
+                api_client.post(self.ENDPOINT, account_data)
+            )
         except ApiClientError as e:
             logger.error(f"Erro ao criar conta: {e}")
             raise
@@ -129,7 +195,7 @@ class AccountsService:
         self,
         account_id: int,
         account_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Account:
         """
         Atualiza uma conta existente.
 
@@ -142,7 +208,7 @@ class AccountsService:
 
         Returns
         -------
-        Dict[str, Any]
+        Account
             Dados da conta atualizada
 
         Raises
@@ -152,7 +218,7 @@ class AccountsService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{account_id}/"
-            return api_client.put(endpoint, account_data)
+            return Account.from_api(api_client.put(endpoint, account_data))
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar conta {account_id}: {e}")
             raise
@@ -241,33 +307,144 @@ class AccountsService:
 
         return errors
 
-    def get_account_balance(self, account_id: int) -> float:
+    def _get_balance_ledger(self) -> AccountBalanceLedger:
+        """
+        Obtém o razão de saldos das contas do usuário atual.
+
+        Com o espelho local habilitado, o razão é mantido por usuário e
+        registrado como estrutura derivada das tabelas de movimentações,
+        sendo atualizado de forma incremental a cada sincronização ou
+        alteração. Sem o espelho, é construído a partir da API.
+
+        Returns
+        -------
+        AccountBalanceLedger
+            Razão de saldos
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        if not local_ledger.is_enabled():
+            # Busca sequencial: este método pode ser chamado de dentro de
+            # tarefas do concurrent_loader, que não devem aguardar outras
+            # tarefas do mesmo pool
+            ledger = AccountBalanceLedger()
+            ledger.load(
+                'expense', expenses_service.get_expenses_batch(payed=True)
+            )
+            ledger.load(
+                'revenue', revenues_service.get_revenues_batch(received=True)
+            )
+            ledger.load(
+                'transfer',
+                transfers_service.get_all_transfers(transfered=True)
+            )
+            ledger.load('loan', loans_service.get_all_loans())
+            return ledger
+
+        username = st.session_state['username']
+        with self._lock:
+            ledger = self._balance_ledgers.setdefault(
+                username, AccountBalanceLedger()
+            )
+        for source, endpoint in self.BALANCE_SOURCES.items():
+            local_ledger.query_view(
+                endpoint,
+                'account_balance',
+                partial(ledger.attach, source),
+                lambda view: None
+            )
+        return ledger
+
+    def release_balance_ledger(self, username: str) -> None:
+        """
+        Descarta o razão de saldos mantido para um usuário (ex.: no logout).
+
+        Deve acompanhar ``local_ledger.release``, que descarta as
+        estruturas derivadas registradas nas tabelas do usuário.
+
+        Parameters
+        ----------
+        username : str
+            Nome do usuário
         """
-        Calcula o saldo atual de uma conta.
+        with self._lock:
+            self._balance_ledgers.pop(username, None)
 
-        Note
-        ----
-        Esta funcionalidade requer implementação adicional na API
-        para cálculo de saldos baseado em receitas e despesas.
+    def get_account_balance(
+        self,
+        account_id: int,
+        as_of: Optional[Union[str, date]] = None
+    ) -> Decimal:
+        """
+        Calcula o saldo de uma conta a partir das movimentações.
+
+        Considera despesas pagas, receitas recebidas, transferências
+        efetivadas (origem e destino) e empréstimos dados ou recebidos.
 
         Parameters
         ----------
         account_id : int
             ID da conta
+        as_of : str or date, optional
+            Data (inclusive) do saldo, no formato YYYY-MM-DD; por
+            padrão, considera todas as movimentações
 
         Returns
         -------
-        float
-            Saldo atual da conta
+        Decimal
+            Saldo da conta em reais
 
         Raises
         ------
-        NotImplementedError
-            Funcionalidade não implementada na API atual
+        ApiClientError
+            Se houver erro na comunicação com a API
+
+        Examples
+        --------
+        >>> accounts_service.get_account_balance(1, as_of='2024-01-31')
+        Decimal('1234.50')
         """
-        raise NotImplementedError(
-            "Cálculo de saldo requer implementação adicional na API"
-        )
+        try:
+            ledger = self._get_balance_ledger()
+        except ApiClientError as e:
+            logger.error(f"Erro ao calcular saldo da conta {account_id}: {e}")
+            raise
+        return cents_to_decimal(ledger.balance(account_id, as_of))
+
+    def get_account_balances(
+        self,
+        as_of: Optional[Union[str, date]] = None
+    ) -> Dict[int, Decimal]:
+        """
+        Calcula o saldo de todas as contas com movimentações.
+
+        Parameters
+        ----------
+        as_of : str or date, optional
+            Data (inclusive) dos saldos, no formato YYYY-MM-DD
+
+        Returns
+        -------
+        Dict[int, Decimal]
+            Saldos em reais indexados pelo ID da conta
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        try:
+            ledger = self._get_balance_ledger()
+        except ApiClientError as e:
+            logger.error(f"Erro ao calcular saldos das contas: {e}")
+            raise
+        return {
+            account_id: cents_to_decimal(cents)
+            for account_id, cents in ledger.balances(as_of).items()
+        }
 
 
 # Instância global do serviço de contas
@@ -8,17 +8,42 @@ tratamento de erros e retry logic.
 
 import json
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from concurrent.futures import Future
+from typing import (
+    Callable, Dict, Any, Iterator, List, Optional, Tuple, TypeVar
+)
 from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlsplit
 import requests
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from config.settings import api_config, auth_config
+from .concurrent_loader import ConcurrentLoader
 from .cookie_auth import cookie_auth
+from .http_transport import HttpTransport, http_transport
+from .token_refresher import token_refresh_scheduler
+from utils.records import to_api_payload
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Entrada do cache: expiração, resposta e validadores HTTP
+CacheEntry = Tuple[float, Any, Dict[str, str]]
+
+# Evita que threads da mesma sessão criem caches concorrentes
+_cache_creation_lock = threading.Lock()
+
+# Pool próprio para pré-busca de páginas, evitando que iterações
+# executadas dentro do carregador concorrente esgotem o pool principal
+_prefetch_loader = ConcurrentLoader(max_workers=api_config.PREFETCH_WORKERS)
+
 
 class ApiClientError(Exception):
     """Exceção base para erros do cliente da API."""
@@ -35,6 +60,11 @@ class ValidationError(ApiClientError):
     pass
 
 
+class TokenExpiredError(AuthenticationError):
+    """Exceção para token de acesso expirado, que pode ser renovado."""
+    pass
+
+
 class NotFoundError(ApiClientError):
     """Exceção para recursos não encontrados."""
     pass
@@ -45,6 +75,336 @@ class PermissionError(ApiClientError):
     pass
 
 
+class SingleFlight:
+    """
+    Executa chamadas idênticas simultâneas uma única vez.
+
+    Chamadas concorrentes com a mesma chave aguardam a execução em
+    andamento e recebem o mesmo resultado (ou a mesma exceção),
+    evitando requisições duplicadas à API.
+    """
+
+    def __init__(self):
+        """Inicializa o registro de chamadas em andamento."""
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Any, "Future[Any]"] = {}
+
+    def run(self, key: Any, func: Callable[[], T]) -> T:
+        """
+        Executa a função ou aguarda a execução já em andamento.
+
+        Parameters
+        ----------
+        key : Any
+            Identificador (hashable) da chamada
+        func : Callable[[], T]
+            Função executada apenas pela primeira chamada
+
+        Returns
+        -------
+        T
+            Resultado compartilhado da execução
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = func()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+
+# Renovações de token em andamento, por sessão e refresh token
+token_refresh_coordinator = SingleFlight()
+
+# Requisições GET idênticas em andamento, por usuário, endpoint e params
+request_coalescer = SingleFlight()
+
+
+class ResponseCache:
+    """
+    Cache LRU de respostas GET com tempo de vida por recurso.
+
+    As entradas são indexadas pelo endpoint e pelos parâmetros
+    normalizados da query string. O recurso de um endpoint é o seu
+    primeiro segmento (``expenses/12/`` pertence a ``expenses``), usado
+    para definir o tempo de vida e para invalidar entradas após
+    operações de escrita.
+
+    Respostas com ``ETag``/``Last-Modified`` continuam armazenadas após
+    expirar, para que a próxima leitura seja uma requisição condicional.
+
+    Note
+    ----
+    As respostas armazenadas são compartilhadas entre as leituras
+    e não devem ser modificadas pelos chamadores.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = api_config.CACHE_MAX_ENTRIES,
+        default_ttl: int = api_config.CACHE_DEFAULT_TTL
+    ):
+        """
+        Inicializa o cache de respostas.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Número máximo de respostas armazenadas
+        default_ttl : int, optional
+            Tempo de vida padrão das entradas em segundos
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[Tuple[str, str], CacheEntry]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_resource(endpoint: str) -> str:
+        """
+        Obtém o recurso (primeiro segmento) de um endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API, ex: ``expenses/12/``
+
+        Returns
+        -------
+        str
+            Nome do recurso, ex: ``expenses``
+        """
+        return endpoint.strip('/').split('/', 1)[0]
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """
+        Gera a chave do cache a partir do endpoint e dos parâmetros.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API
+        params : Dict[str, Any], optional
+            Parâmetros da query string
+
+        Returns
+        -------
+        Tuple[str, str]
+            Endpoint normalizado e parâmetros serializados em ordem
+        """
+        normalized_params = sorted(
+            (str(key), str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+        return (endpoint.strip('/'), json.dumps(normalized_params))
+
+    def get_ttl(self, endpoint: str) -> int:
+        """
+        Obtém o tempo de vida configurado para o recurso do endpoint.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API
+
+        Returns
+        -------
+        int
+            Tempo de vida em segundos
+        """
+        return api_config.CACHE_RESOURCE_TTLS.get(
+            self.get_resource(endpoint), self.default_ttl
+        )
+
+    def get(self, key: Tuple[str, str]) -> Optional[Any]:
+        """
+        Obtém uma resposta válida do cache.
+
+        Parameters
+        ----------
+        key : Tuple[str, str]
+            Chave gerada por ``make_key``
+
+        Returns
+        -------
+        Optional[Any]
+            Resposta armazenada ou None se ausente ou expirada
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value, validators = entry
+            if time.monotonic() >= expires_at:
+                # Entradas com validadores são mantidas para revalidação
+                if not validators:
+                    del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def get_stale(
+        self,
+        key: Tuple[str, str]
+    ) -> Tuple[Optional[Any], Dict[str, str]]:
+        """
+        Obtém uma resposta expirada e seus validadores HTTP.
+
+        Parameters
+        ----------
+        key : Tuple[str, str]
+            Chave gerada por ``make_key``
+
+        Returns
+        -------
+        Tuple[Optional[Any], Dict[str, str]]
+            Resposta armazenada e headers condicionais
+            (``If-None-Match``/``If-Modified-Since``) para revalidá-la
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry[2]:
+                return None, {}
+
+            conditional_headers = {}
+            validators = entry[2]
+            if 'ETag' in validators:
+                conditional_headers['If-None-Match'] = validators['ETag']
+            if 'Last-Modified' in validators:
+                conditional_headers['If-Modified-Since'] = (
+                    validators['Last-Modified']
+                )
+            return entry[1], conditional_headers
+
+    def set(
+        self,
+        key: Tuple[str, str],
+        value: Any,
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Armazena uma resposta no cache.
+
+        Parameters
+        ----------
+        key : Tuple[str, str]
+            Chave gerada por ``make_key``
+        value : Any
+            Resposta da API
+        validators : Dict[str, str], optional
+            Headers ``ETag``/``Last-Modified`` recebidos com a resposta
+        """
+        expires_at = time.monotonic() + self.get_ttl(key[0])
+        with self._lock:
+            self._entries[key] = (expires_at, value, validators or {})
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revalidate(
+        self,
+        key: Tuple[str, str],
+        validators: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Renova o tempo de vida de uma entrada confirmada por um 304.
+
+        Parameters
+        ----------
+        key : Tuple[str, str]
+            Chave gerada por ``make_key``
+        validators : Dict[str, str], optional
+            Validadores reenviados pela API, que substituem os atuais
+        """
+        expires_at = time.monotonic() + self.get_ttl(key[0])
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+
+            _, value, current_validators = entry
+            self._entries[key] = (
+                expires_at, value, {**current_validators, **(validators or {})}
+            )
+            self._entries.move_to_end(key)
+
+    @staticmethod
+    def extract_validators(response: requests.Response) -> Dict[str, str]:
+        """
+        Extrai os validadores HTTP de uma resposta.
+
+        Parameters
+        ----------
+        response : requests.Response
+            Resposta da requisição HTTP
+
+        Returns
+        -------
+        Dict[str, str]
+            Headers ``ETag`` e ``Last-Modified`` presentes na resposta
+        """
+        return {
+            header: response.headers[header]
+            for header in ('ETag', 'Last-Modified')
+            if response.headers.get(header)
+        }
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Remove as entradas do recurso do endpoint e de seus dependentes.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint alterado por uma operação de escrita
+        """
+        resource = self.get_resource(endpoint)
+        resources = {resource}
+        resources.update(api_config.CACHE_DEPENDENCIES.get(resource, []))
+
+        with self._lock:
+            stale_keys = [
+                key for key in self._entries
+                if self.get_resource(key[0]) in resources
+            ]
+            for key in stale_keys:
+                del self._entries[key]
+
+        if stale_keys:
+            logger.debug(
+                f"Cache invalidado para {sorted(resources)}: "
+                f"{len(stale_keys)} entradas"
+            )
+
+    def clear(self) -> None:
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._entries.clear()
+
+
 class ApiClient:
     """
     Cliente HTTP para comunicação com a expenselit-api.
@@ -53,17 +413,81 @@ class ApiClient:
     - Autenticação JWT automática
     - Refresh de tokens
     - Tratamento de erros
-    - Retry logic
+    - Retry logic (métodos idempotentes, backoff exponencial com jitter)
+    - Pool de conexões e timeouts configuráveis
     - Cache de sessão
+
+    O pool de conexões pertence ao ``HttpTransport`` do processo e é
+    compartilhado por todas as sessões do Streamlit; os headers de
+    autenticação são obtidos de ``st.session_state`` a cada chamada.
     """
 
-    def __init__(self):
-        """Inicializa o cliente da API."""
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+    def __init__(self, transport: HttpTransport = http_transport):
+        """
+        Inicializa o cliente da API.
+
+        Parameters
+        ----------
+        transport : HttpTransport, optional
+            Transporte HTTP compartilhado pelo processo
+        """
+        self.transport = transport
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Obtém a sessão HTTP da thread atual.
+
+        Returns
+        -------
+        requests.Session
+            Sessão sem estado compartilhado, ligada ao pool do processo
+        """
+        return self.transport.session
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Tuple[float, float]] = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """
+        Executa uma requisição HTTP pelo transporte compartilhado.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP
+        url : str
+            URL completa da requisição
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura em segundos
+        **kwargs : Any
+            Argumentos repassados para ``HttpTransport.request``
+
+        Returns
+        -------
+        requests.Response
+            Resposta da requisição
+        """
+        return self.transport.request(method, url, timeout=timeout, **kwargs)
+
+    def _get_response_cache(self) -> ResponseCache:
+        """
+        Obtém o cache de respostas da sessão atual do Streamlit.
+
+        Returns
+        -------
+        ResponseCache
+            Cache de respostas GET da sessão
+        """
+        with _cache_creation_lock:
+            cache = st.session_state.get('api_response_cache')
+            if cache is None:
+                cache = ResponseCache()
+                st.session_state['api_response_cache'] = cache
+        return cache
 
     def _get_auth_headers(self) -> Dict[str, str]:
         """
@@ -85,7 +509,10 @@ class ApiClient:
 
         return {'Authorization': f'Bearer {access_token}'}
 
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    def _handle_response(
+            self,
+            response: requests.Response,
+            cached_response: Optional[Any] = None) -> Dict[str, Any]:
         """
         Processa a resposta da API e trata erros.
 
@@ -93,6 +520,9 @@ class ApiClient:
         ----------
         response : requests.Response
             Resposta da requisição HTTP
+        cached_response : Any, optional
+            Resposta em cache revalidada por uma requisição condicional,
+            retornada quando a API responde 304 (Not Modified)
 
         Returns
         -------
@@ -101,6 +531,8 @@ class ApiClient:
 
         Raises
         ------
+        TokenExpiredError
+            Para erros 401 causados por token de acesso expirado
         AuthenticationError
             Para erros 401 (não autorizado)
         PermissionError
@@ -119,6 +551,8 @@ class ApiClient:
                 return response.json()
             elif response.status_code == 204:
                 return {}
+            elif response.status_code == 304 and cached_response is not None:
+                return cached_response
             elif response.status_code == 400:
                 error_data = response.json() if response.content else {}
                 raise ValidationError(f"Dados inválidos: {error_data}")
@@ -132,32 +566,14 @@ class ApiClient:
                         if any(msg.get(
                             'message'
                         ) == 'Token is expired' for msg in messages):
-                            # Token expirado - tenta renovar automaticamente
-                            logger.info(
-                                """
-                                Token expirado detectado,
-                                tentando renovar...
+                            # Token expirado - a requisição original é
+                            # reexecutada após a renovação (ver _send)
+                            raise TokenExpiredError(
+                                """Sua sessão expirou.
+                                Por favor,
+                                faça login novamente para continuar.
                                 """
                             )
-                            if hasattr(
-                                self,
-                                'refresh_token'
-                            ) and self.refresh_token():
-                                logger.info(
-                                    """Token renovado com sucesso,
-                                    reexecutando requisição...
-                                    """
-                                )
-                                # Não relança a exceção,
-                                # deixa a requisição original tentar novamente
-                                return {}
-                            else:
-                                raise AuthenticationError(
-                                    """Sua sessão expirou.
-                                    Por favor,
-                                    faça login novamente para continuar.
-                                    """
-                                )
                         else:
                             raise AuthenticationError(
                                 """Token inválido.
@@ -218,7 +634,7 @@ class ApiClient:
         logger.info(f"Tentando autenticar em: {url}")
 
         try:
-            response = self.session.post(url, json=data)
+            response = self._request('POST', url, json=data)
             logger.info(f"Status da resposta: {response.status_code}")
             auth_data = self._handle_response(response)
 
@@ -232,6 +648,7 @@ class ApiClient:
             )
             st.session_state['is_authenticated'] = True
             st.session_state['username'] = username
+            self._get_response_cache().clear()
 
             # Salva token usando sistema de cookies
             cookie_auth.save_auth_data(
@@ -247,10 +664,20 @@ class ApiClient:
             logger.error(f"Erro de conexão na autenticação: {e}")
             raise ApiClientError(f"Erro de conexão: {e}")
 
-    def refresh_token(self) -> bool:
+    def refresh_token(self, stale_access_token: Optional[str] = None) -> bool:
         """
         Renova o token de acesso usando o refresh token.
 
+        Chamadas simultâneas da mesma sessão compartilham uma única
+        renovação. Se o token de acesso já tiver sido substituído por
+        outra chamada, nenhuma nova requisição é feita.
+
+        Parameters
+        ----------
+        stale_access_token : str, optional
+            Token de acesso considerado expirado pelo chamador.
+            Por padrão, o token atual da sessão
+
         Returns
         -------
         bool
@@ -265,11 +692,42 @@ class ApiClient:
         if not refresh_token:
             raise AuthenticationError("Refresh token não encontrado")
 
+        if stale_access_token is None:
+            stale_access_token = st.session_state.get('access_token')
+
+        def refresh() -> bool:
+            if st.session_state.get('access_token') != stale_access_token:
+                # Outra chamada já renovou o token desta sessão
+                return True
+            return self._request_new_access_token(refresh_token)
+
+        # Sessões restauradas do mesmo cookie compartilham o refresh
+        # token, mas cada uma precisa atualizar o próprio session_state
+        ctx = get_script_run_ctx()
+        session_id = ctx.session_id if ctx else str(threading.get_ident())
+        return token_refresh_coordinator.run(
+            f"{session_id}:{refresh_token}", refresh
+        )
+
+    def _request_new_access_token(self, refresh_token: str) -> bool:
+        """
+        Solicita um novo token de acesso ao endpoint de refresh.
+
+        Parameters
+        ----------
+        refresh_token : str
+            Refresh token da sessão
+
+        Returns
+        -------
+        bool
+            True se o token foi renovado com sucesso
+        """
         url = api_config.get_full_url(auth_config.REFRESH_ENDPOINT)
         data = {"refresh": refresh_token}
 
         try:
-            response = self.session.post(url, json=data)
+            response = self._request('POST', url, json=data)
             token_data = self._handle_response(response)
 
             # Atualiza o token de acesso
@@ -299,32 +757,134 @@ class ApiClient:
         if not st.session_state.get('is_authenticated'):
             raise AuthenticationError("Usuário não autenticado")
 
+        # Mantém o token renovado em segundo plano durante a sessão
+        token_refresh_scheduler.ensure_running(self.refresh_token)
+
         # Verifica se o token está próximo do vencimento
         token_expires_at = st.session_state.get('token_expires_at')
         if token_expires_at and datetime.now() >= token_expires_at - timedelta(
             minutes=2
         ):
+            self._refresh_or_expire_session()
+
+    def _refresh_or_expire_session(
+        self,
+        stale_access_token: Optional[str] = None
+    ) -> None:
+        """
+        Renova o token ou marca a sessão como expirada.
+
+        Parameters
+        ----------
+        stale_access_token : str, optional
+            Token de acesso considerado expirado pelo chamador
+
+        Raises
+        ------
+        AuthenticationError
+            Se não for possível renovar o token
+        """
+        try:
+            self.refresh_token(stale_access_token)
+        except AuthenticationError:
+            st.session_state['is_authenticated'] = False
+            raise AuthenticationError(
+                "Sessão expirada. Faça login novamente."
+            )
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        timeout: Optional[Tuple[float, float]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        cached_response: Optional[Any] = None,
+        **kwargs: Any
+    ) -> Tuple[requests.Response, Any]:
+        """
+        Envia uma requisição autenticada e trata a resposta.
+
+        Se a API indicar token expirado, o token é renovado (uma única
+        vez para todas as chamadas concorrentes da sessão) e a
+        requisição original é reexecutada uma vez.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura em segundos
+        headers : Dict[str, str], optional
+            Headers adicionais aos de autenticação
+        cached_response : Any, optional
+            Resposta em cache usada para respostas 304
+        **kwargs : Any
+            Argumentos repassados para ``requests``
+
+        Returns
+        -------
+        Tuple[requests.Response, Any]
+            Resposta HTTP e dados processados
+
+        Raises
+        ------
+        requests.RequestException
+            Para erros de conexão
+        """
+        self._ensure_authenticated()
+        url = api_config.get_full_url(endpoint)
+
+        for attempt in range(2):
+            access_token = st.session_state.get('access_token')
+            request_headers = self._get_auth_headers()
+            request_headers.update(headers or {})
+            response = self._request(
+                method, url, timeout, headers=request_headers, **kwargs
+            )
             try:
-                self.refresh_token()
-            except AuthenticationError:
-                st.session_state['is_authenticated'] = False
-                raise AuthenticationError(
-                    "Sessão expirada. Faça login novamente."
+                return response, self._handle_response(
+                    response, cached_response
+                )
+            except TokenExpiredError:
+                if attempt:
+                    raise
+                logger.info(
+                    f"Token expirado em {method} {endpoint}, "
+                    "renovando e reexecutando a requisição..."
                 )
+                self._refresh_or_expire_session(access_token)
+
+        raise AuthenticationError("Sessão expirada. Faça login novamente.")
 
     def get(
             self,
             endpoint: str,
-            params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+            params: Optional[Dict[str, Any]] = None,
+            use_cache: bool = True,
+            timeout: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
         """
         Realiza uma requisição GET à API.
 
+        Respostas são reaproveitadas do cache da sessão enquanto
+        estiverem dentro do tempo de vida do recurso. Após expirar, a
+        resposta é revalidada com ``If-None-Match``/``If-Modified-Since``
+        e um 304 da API reaproveita o corpo já armazenado. Chamadas
+        idênticas e simultâneas do mesmo usuário, com a mesma versão
+        armazenada do recurso, são agrupadas em uma única requisição
+        HTTP.
+
         Parameters
         ----------
         endpoint : str
             Endpoint da API (sem barra inicial)
         params : Dict[str, Any], optional
             Parâmetros da query string
+        use_cache : bool, optional
+            Se deve consultar e alimentar o cache, por padrão True
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura desta requisição em segundos
 
         Returns
         -------
@@ -332,17 +892,191 @@ class ApiClient:
             Resposta da API
         """
         self._ensure_authenticated()
-        url = api_config.get_full_url(endpoint)
-        headers = self._get_auth_headers()
+
+        use_cache = use_cache and api_config.CACHE_ENABLED
+        stale_response: Optional[Any] = None
+        conditional_headers: Dict[str, str] = {}
+        if use_cache:
+            cache = self._get_response_cache()
+            cache_key = cache.make_key(endpoint, params)
+            cached_response = cache.get(cache_key)
+            if cached_response is not None:
+                return cached_response
+            stale_response, conditional_headers = cache.get_stale(cache_key)
+
+        def fetch() -> Tuple[int, Any, Dict[str, str]]:
+            response, result = self._send(
+                'GET', endpoint, timeout,
+                headers=conditional_headers,
+                cached_response=stale_response,
+                params=params
+            )
+            return (
+                response.status_code,
+                result,
+                ResponseCache.extract_validators(response)
+            )
+
+        # GETs idênticos simultâneos do mesmo usuário compartilham a
+        # mesma requisição HTTP (ex: contas buscadas por várias telas).
+        # Os validadores enviados fazem parte da chave: um 304 só vale
+        # para quem possui a mesma versão armazenada do recurso
+        coalescing_key = (
+            st.session_state.get('username'),
+            *ResponseCache.make_key(endpoint, params),
+            tuple(sorted(conditional_headers.items()))
+        )
 
         try:
-            response = self.session.get(url, headers=headers, params=params)
-            return self._handle_response(response)
+            status_code, result, validators = request_coalescer.run(
+                coalescing_key, fetch
+            )
+            if use_cache and status_code == 304 and (
+                stale_response is not None
+            ):
+                cache.revalidate(cache_key, validators)
+            elif use_cache and status_code in (200, 304):
+                cache.set(cache_key, result, validators)
+            return result
         except requests.RequestException as e:
             logger.error(f"Erro na requisição GET {endpoint}: {e}")
             raise ApiClientError(f"Erro de conexão: {e}")
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _split_next_link(next_url: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Converte o link ``next`` da paginação em endpoint e parâmetros.
+
+        Parameters
+        ----------
+        next_url : str
+            URL absoluta da próxima página retornada pela API
+
+        Returns
+        -------
+        Tuple[str, Dict[str, str]]
+            Endpoint relativo à base da API e parâmetros da query string
+        """
+        parts = urlsplit(next_url)
+        base_path = f"{api_config.API_BASE_PATH}/"
+        if base_path in parts.path:
+            endpoint = parts.path.split(base_path, 1)[1]
+        else:
+            endpoint = parts.path.lstrip('/')
+        return endpoint, dict(parse_qsl(parts.query))
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        prefetch: bool = True,
+        use_cache: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Percorre as páginas de um endpoint de listagem sob demanda.
+
+        Segue os links ``next`` da paginação do Django REST Framework.
+        Enquanto o chamador consome uma página, a seguinte é buscada em
+        segundo plano. Endpoints sem paginação produzem uma única página.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        params : Dict[str, Any], optional
+            Parâmetros da query string da primeira página
+        prefetch : bool, optional
+            Se deve buscar a próxima página em segundo plano,
+            por padrão True
+        use_cache : bool, optional
+            Se deve usar o cache de respostas da sessão, por padrão True
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            Registros de cada página
+
+        Examples
+        --------
+        >>> for page in api_client.iter_pages("expenses/"):
+        ...     print(len(page))
+        """
+        response: Any = self.get(endpoint, params=params, use_cache=use_cache)
+
+        while True:
+            if isinstance(response, list):
+                yield response
+                return
+            if not isinstance(response, dict) or 'results' not in response:
+                return
+
+            next_url = response.get('next')
+            next_page = None
+            if next_url:
+                next_endpoint, next_params = self._split_next_link(next_url)
+                if prefetch:
+                    next_page = _prefetch_loader.submit(partial(
+                        self.get, next_endpoint,
+                        params=next_params, use_cache=use_cache
+                    ))
+
+            yield response['results']
+
+            if not next_url:
+                return
+            response = (
+                next_page.result() if next_page is not None
+                else self.get(
+                    next_endpoint, params=next_params, use_cache=use_cache
+                )
+            )
+
+    def iter_items(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        use_cache: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre os registros de um endpoint de listagem sob demanda.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        params : Dict[str, Any], optional
+            Parâmetros da query string da primeira página
+        max_items : int, optional
+            Número máximo de registros a produzir
+        prefetch : bool, optional
+            Se deve buscar a próxima página em segundo plano,
+            por padrão True
+        use_cache : bool, optional
+            Se deve usar o cache de respostas da sessão, por padrão True
+
+        Yields
+        ------
+        Dict[str, Any]
+            Registros de todas as páginas, em ordem
+        """
+        produced = 0
+        pages = self.iter_pages(
+            endpoint, params, prefetch=prefetch, use_cache=use_cache
+        )
+        for page in pages:
+            for item in page:
+                if max_items is not None and produced >= max_items:
+                    return
+                produced += 1
+                yield item
+
+    def post(
+            self,
+            endpoint: str,
+            data: Dict[str, Any],
+            timeout: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
         """
         Realiza uma requisição POST à API.
 
@@ -351,25 +1085,31 @@ class ApiClient:
         endpoint : str
             Endpoint da API (sem barra inicial)
         data : Dict[str, Any]
-            Dados para enviar no corpo da requisição
+            Dados para enviar no corpo da requisição; valores ``Decimal``,
+            ``date`` e ``time`` são convertidos ao formato da API
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura desta requisição em segundos
 
         Returns
         -------
         Dict[str, Any]
             Resposta da API
         """
-        self._ensure_authenticated()
-        url = api_config.get_full_url(endpoint)
-        headers = self._get_auth_headers()
-
         try:
-            response = self.session.post(url, headers=headers, json=data)
-            return self._handle_response(response)
+            _, result = self._send(
+                'POST', endpoint, timeout, json=to_api_payload(data)
+            )
+            self._get_response_cache().invalidate(endpoint)
+            return result
         except requests.RequestException as e:
             logger.error(f"Erro na requisição POST {endpoint}: {e}")
             raise ApiClientError(f"Erro de conexão: {e}")
 
-    def put(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    def put(
+            self,
+            endpoint: str,
+            data: Dict[str, Any],
+            timeout: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
         """
         Realiza uma requisição PUT à API.
 
@@ -378,25 +1118,30 @@ class ApiClient:
         endpoint : str
             Endpoint da API (sem barra inicial)
         data : Dict[str, Any]
-            Dados para atualizar
+            Dados para atualizar; valores ``Decimal``, ``date`` e ``time``
+            são convertidos ao formato da API
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura desta requisição em segundos
 
         Returns
         -------
         Dict[str, Any]
             Resposta da API
         """
-        self._ensure_authenticated()
-        url = api_config.get_full_url(endpoint)
-        headers = self._get_auth_headers()
-
         try:
-            response = self.session.put(url, headers=headers, json=data)
-            return self._handle_response(response)
+            _, result = self._send(
+                'PUT', endpoint, timeout, json=to_api_payload(data)
+            )
+            self._get_response_cache().invalidate(endpoint)
+            return result
         except requests.RequestException as e:
             logger.error(f"Erro na requisição PUT {endpoint}: {e}")
             raise ApiClientError(f"Erro de conexão: {e}")
 
-    def delete(self, endpoint: str) -> None:
+    def delete(
+            self,
+            endpoint: str,
+            timeout: Optional[Tuple[float, float]] = None) -> None:
         """
         Realiza uma requisição DELETE à API.
 
@@ -404,18 +1149,32 @@ class ApiClient:
         ----------
         endpoint : str
             Endpoint da API (sem barra inicial)
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura desta requisição em segundos
         """
-        self._ensure_authenticated()
-        url = api_config.get_full_url(endpoint)
-        headers = self._get_auth_headers()
-
         try:
-            response = self.session.delete(url, headers=headers)
-            self._handle_response(response)
+            self._send('DELETE', endpoint, timeout)
+            self._get_response_cache().invalidate(endpoint)
         except requests.RequestException as e:
             logger.error(f"Erro na requisição DELETE {endpoint}: {e}")
             raise ApiClientError(f"Erro de conexão: {e}")
 
+    def invalidate_cache(self, *endpoints: str) -> None:
+        """
+        Descarta as respostas em cache dos recursos dos endpoints.
+
+        A próxima leitura de cada recurso é feita na API, sem esperar o
+        fim do tempo de vida da resposta armazenada.
+
+        Parameters
+        ----------
+        *endpoints : str
+            Endpoints cujos recursos devem ser recarregados
+        """
+        cache = self._get_response_cache()
+        for endpoint in endpoints:
+            cache.invalidate(endpoint)
+
     def get_user_permissions(self) -> Dict[str, Any]:
         """
         Obtém as permissões do usuário atual.
@@ -431,8 +1190,10 @@ class ApiClient:
         """Remove dados de autenticação da sessão e cookie."""
         keys_to_remove = [
             'access_token', 'refresh_token', 'token_expires_at',
-            'is_authenticated', 'username', 'user_permissions'
+            'is_authenticated', 'username', 'user_permissions',
+            'api_response_cache'
         ]
+        token_refresh_scheduler.stop()
         for key in keys_to_remove:
             st.session_state.pop(key, None)
 
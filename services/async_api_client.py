@@ -0,0 +1,281 @@
+"""
+Cliente assíncrono para comunicação com a expenselit-api.
+
+Este módulo expõe a API do ``ApiClient`` como corrotinas, permitindo
+que dashboards, relatórios e operações em lote aguardem dezenas de
+chamadas simultâneas em um único event loop. As requisições reutilizam
+o ``ApiClient`` síncrono (mesmo tratamento de erros, cache, renovação
+de token e pool de conexões), executado em um pool de threads próprio.
+"""
+
+import asyncio
+import logging
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar
+)
+
+from config.settings import api_config
+from services.api_client import ApiClient, api_client
+from services.concurrent_loader import ConcurrentLoader
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class AsyncApiClient:
+    """
+    Variante assíncrona do cliente da API.
+
+    Os métodos possuem a mesma assinatura e as mesmas exceções
+    (``ApiClientError`` e subclasses) do ``ApiClient``. O método
+    ``run`` é a fachada síncrona usada pelas páginas do Streamlit.
+    """
+
+    def __init__(
+        self,
+        client: ApiClient = api_client,
+        max_workers: int = api_config.ASYNC_WORKERS
+    ):
+        """
+        Inicializa o cliente assíncrono.
+
+        Parameters
+        ----------
+        client : ApiClient, optional
+            Cliente síncrono usado para as requisições
+        max_workers : int, optional
+            Número máximo de requisições executadas simultaneamente
+        """
+        self.client = client
+        self._loader = ConcurrentLoader(max_workers=max_workers)
+
+    async def run_sync(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any
+    ) -> T:
+        """
+        Aguarda uma função síncrona executada no pool de threads.
+
+        O contexto do Streamlit da sessão é propagado para a thread,
+        preservando o acesso aos tokens em ``st.session_state``.
+
+        Parameters
+        ----------
+        func : Callable[..., T]
+            Função síncrona a executar
+        *args : Any
+            Argumentos posicionais da função
+        **kwargs : Any
+            Argumentos nomeados da função
+
+        Returns
+        -------
+        T
+            Resultado da função
+        """
+        future = self._loader.submit(partial(func, *args, **kwargs))
+        return await asyncio.wrap_future(future)
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Realiza uma requisição GET à API.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        params : Dict[str, Any], optional
+            Parâmetros da query string
+        **kwargs : Any
+            Opções de ``ApiClient.get`` (use_cache, timeout)
+
+        Returns
+        -------
+        Dict[str, Any]
+            Resposta da API
+        """
+        return await self.run_sync(
+            self.client.get, endpoint, params=params, **kwargs
+        )
+
+    async def get_all(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_items: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém todos os registros de um endpoint de listagem paginado.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        params : Dict[str, Any], optional
+            Parâmetros da query string da primeira página
+        max_items : int, optional
+            Número máximo de registros
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Registros de todas as páginas
+        """
+        return await self.run_sync(
+            lambda: list(self.client.iter_items(
+                endpoint, params=params, max_items=max_items
+            ))
+        )
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Realiza uma requisição POST à API.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        data : Dict[str, Any]
+            Dados para enviar no corpo da requisição
+        **kwargs : Any
+            Opções de ``ApiClient.post`` (timeout)
+
+        Returns
+        -------
+        Dict[str, Any]
+            Resposta da API
+        """
+        return await self.run_sync(self.client.post, endpoint, data, **kwargs)
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Realiza uma requisição PUT à API.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        data : Dict[str, Any]
+            Dados para atualizar
+        **kwargs : Any
+            Opções de ``ApiClient.put`` (timeout)
+
+        Returns
+        -------
+        Dict[str, Any]
+            Resposta da API
+        """
+        return await self.run_sync(self.client.put, endpoint, data, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> None:
+        """
+        Realiza uma requisição DELETE à API.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (sem barra inicial)
+        **kwargs : Any
+            Opções de ``ApiClient.delete`` (timeout)
+        """
+        await self.run_sync(self.client.delete, endpoint, **kwargs)
+
+    async def gather(
+        self,
+        calls: Dict[str, Awaitable[Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        """
+        Aguarda várias chamadas simultaneamente, isolando os erros.
+
+        Parameters
+        ----------
+        calls : Dict[str, Awaitable[Any]]
+            Corrotinas indexadas pelo nome da fonte
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], Dict[str, Exception]]
+            Resultados das chamadas bem-sucedidas e erros das que
+            falharam, ambos indexados pelo nome da fonte
+
+        Examples
+        --------
+        >>> results, errors = async_api_client.run(async_api_client.gather({
+        ...     'expenses': expenses_service.get_all_expenses_async(),
+        ...     'revenues': revenues_service.get_all_revenues_async()
+        ... }))
+        """
+        names = list(calls)
+        outcomes = await asyncio.gather(
+            *calls.values(), return_exceptions=True
+        )
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"Erro ao carregar '{name}': {outcome}")
+                errors[name] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[name] = outcome
+        return results, errors
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        """
+        Executa uma corrotina a partir de código síncrono.
+
+        Fachada para as páginas do Streamlit, cujo script é síncrono.
+
+        Parameters
+        ----------
+        awaitable : Awaitable[T]
+            Corrotina a executar
+
+        Returns
+        -------
+        T
+            Resultado da corrotina
+        """
+        async def runner() -> T:
+            return await awaitable
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(runner())
+
+        # Já existe um event loop nesta thread: executa em outra thread
+        return self._loader.submit(lambda: asyncio.run(runner())).result()
+
+
+# Instância global do cliente assíncrono
+async_api_client = AsyncApiClient()
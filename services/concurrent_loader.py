@@ -0,0 +1,157 @@
+"""
+Carregamento concorrente de dados da expenselit-api.
+
+Este módulo implementa um carregador que dispara requisições
+independentes ao mesmo tempo sobre um pool de threads compartilhado,
+coletando os erros de cada fonte sem descartar os demais resultados.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from streamlit.runtime.scriptrunner import (
+    add_script_run_ctx,
+    get_script_run_ctx
+)
+from streamlit.runtime.scriptrunner_utils.script_run_context import (
+    SCRIPT_RUN_CONTEXT_ATTR_NAME
+)
+
+from config.settings import api_config
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrentLoader:
+    """
+    Executa múltiplas funções de carregamento em paralelo.
+
+    As tarefas são executadas em um pool de threads compartilhado por
+    todo o processo. O contexto de execução do Streamlit da thread que
+    submeteu as tarefas é propagado para as threads do pool, permitindo
+    que os serviços acessem ``st.session_state`` (tokens de autenticação).
+    """
+
+    def __init__(self, max_workers: int = api_config.CONCURRENT_WORKERS):
+        """
+        Inicializa o carregador concorrente.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Número máximo de threads do pool
+        """
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Obtém o pool de threads, criando-o sob demanda.
+
+        Returns
+        -------
+        ThreadPoolExecutor
+            Pool de threads compartilhado
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="expenselit-loader"
+                    )
+        return self._executor
+
+    @staticmethod
+    def _run_with_context(ctx: Any, task: Callable[[], Any]) -> Any:
+        """
+        Executa uma tarefa com o contexto do Streamlit da sessão de origem.
+
+        Parameters
+        ----------
+        ctx : ScriptRunContext or None
+            Contexto da thread que submeteu a tarefa
+        task : Callable[[], Any]
+            Função de carregamento
+
+        Returns
+        -------
+        Any
+            Resultado da função de carregamento
+        """
+        thread = threading.current_thread()
+        add_script_run_ctx(thread, ctx)
+        try:
+            return task()
+        finally:
+            # Threads do pool são reutilizadas por outras sessões
+            thread.__dict__.pop(SCRIPT_RUN_CONTEXT_ATTR_NAME, None)
+
+    def submit(self, task: Callable[[], Any]) -> "Future[Any]":
+        """
+        Agenda uma única tarefa no pool com o contexto da sessão atual.
+
+        Parameters
+        ----------
+        task : Callable[[], Any]
+            Função de carregamento
+
+        Returns
+        -------
+        Future[Any]
+            Futuro com o resultado da tarefa
+        """
+        return self.executor.submit(
+            self._run_with_context, get_script_run_ctx(), task
+        )
+
+    def load(
+        self,
+        tasks: Dict[str, Callable[[], Any]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        """
+        Executa as tarefas de carregamento simultaneamente.
+
+        Parameters
+        ----------
+        tasks : Dict[str, Callable[[], Any]]
+            Funções de carregamento indexadas pelo nome da fonte
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], Dict[str, Exception]]
+            Resultados das fontes carregadas com sucesso e erros
+            das fontes que falharam, ambos indexados pelo nome da fonte
+
+        Examples
+        --------
+        >>> results, errors = concurrent_loader.load({
+        ...     'accounts': accounts_service.get_all_accounts,
+        ...     'expenses': expenses_service.get_all_expenses
+        ... })
+        """
+        ctx = get_script_run_ctx()
+        futures = {
+            name: self.executor.submit(self._run_with_context, ctx, task)
+            for name, task in tasks.items()
+        }
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.warning(f"Erro ao carregar '{name}': {e}")
+                errors[name] = e
+
+        return results, errors
+
+
+# Instância global do carregador concorrente
+concurrent_loader = ConcurrentLoader()
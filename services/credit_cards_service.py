@@ -10,7 +10,10 @@ from datetime import date
 from typing import List, Dict, Any, Optional
 
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
 from utils.date_utils import format_date_for_api
+from utils.filter_spec import FilterSpec
+from utils.records import CreditCard
 
 
 logger = logging.getLogger(__name__)
@@ -26,12 +29,16 @@ class CreditCardsService:
 
     ENDPOINT = "credit-cards/"
 
+    # Campos filtrados pela API; os demais são aplicados localmente
+    FILTER_FIELDS = ('associated_account', 'is_active', 'flag')
+
     def list_credit_cards(
         self,
         associated_account: Optional[int] = None,
         is_active: Optional[bool] = None,
-        flag: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        flag: Optional[str] = None,
+        filters: Optional[FilterSpec] = None
+    ) -> List[CreditCard]:
         """
         Lista todos os cartões de crédito (método principal).
 
@@ -43,10 +50,13 @@ class CreditCardsService:
             Filtrar por status ativo
         flag : str, optional
             Filtrar por bandeira do cartão
+        filters : FilterSpec, optional
+            Filtros adicionais; os campos de ``FILTER_FIELDS`` são
+            enviados à API e os demais aplicados sobre a resposta
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[CreditCard]
             Lista de cartões de crédito
 
         Raises
@@ -57,15 +67,17 @@ class CreditCardsService:
         return self.get_all_credit_cards(
             associated_account=associated_account,
             is_active=is_active,
-            flag=flag
+            flag=flag,
+            filters=filters
         )
 
     def get_all_credit_cards(
         self,
         associated_account: Optional[int] = None,
         is_active: Optional[bool] = None,
-        flag: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+        flag: Optional[str] = None,
+        filters: Optional[FilterSpec] = None
+    ) -> List[CreditCard]:
         """
         Obtém todos os cartões de crédito com filtros opcionais.
 
@@ -77,10 +89,13 @@ class CreditCardsService:
             Filtrar por status ativo
         flag : str, optional
             Filtrar por bandeira do cartão
+        filters : FilterSpec, optional
+            Filtros adicionais; os campos de ``FILTER_FIELDS`` são
+            enviados à API e os demais aplicados sobre a resposta
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[CreditCard]
             Lista de cartões de crédito
 
         Raises
@@ -88,31 +103,55 @@ class CreditCardsService:
         ApiClientError
             Se houver erro na comunicação com a API
         """
-        try:
-            params = {}
-
-            if associated_account:
-                params['associated_account'] = str(associated_account)
-            if is_active is not None:
-                params['is_active'] = str(is_active).lower()
-            if flag:
-                params['flag'] = flag
+        spec = FilterSpec(
+            associated_account=associated_account or None,
+            is_active=is_active,
+            flag=flag or None
+        ).merge(filters)
 
+        try:
+            params = spec.to_params(self.FILTER_FIELDS)
             response = api_client.get(self.ENDPOINT, params=params)
 
             # A API pode retornar uma lista direta ou um objeto com 'results'
             if isinstance(response, dict) and 'results' in response:
-                return response['results']
-            elif isinstance(response, list):
-                return response
-            else:
+                response = response['results']
+            elif not isinstance(response, list):
                 return []
+            return spec.apply(
+                [CreditCard.from_api(card) for card in response],
+                self.FILTER_FIELDS
+            )
 
         except ApiClientError as e:
             logger.error(f"Erro ao buscar cartões de crédito: {e}")
             raise
 
-    def get_credit_card_by_id(self, card_id: int) -> Dict[str, Any]:
+    async def get_all_credit_cards_async(
+        self,
+        **filters: Any
+    ) -> List[CreditCard]:
+        """
+        Versão assíncrona de ``get_all_credit_cards``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_credit_cards``
+
+        Returns
+        -------
+        List[CreditCard]
+            Lista de cartões de crédito
+        """
+        return await async_api_client.run_sync(
+            self.get_all_credit_cards, **filters
+        )
+
+    def get_credit_card_by_id(self, card_id: int) -> CreditCard:
         """
         Obtém um cartão de crédito específico pelo ID.
 
@@ -123,7 +162,7 @@ class CreditCardsService:
 
         Returns
         -------
-        Dict[str, Any]
+        CreditCard
             Dados do cartão de crédito
 
         Raises
@@ -133,14 +172,14 @@ class CreditCardsService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{card_id}/"
-            return api_client.get(endpoint)
+            return CreditCard.from_api(api_client.get(endpoint))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar cartão {card_id}: {e}")
             raise
 
     def create_credit_card(
             self,
-            card_data: Dict[str, Any]) -> Dict[str, Any]:
+            card_data: Dict[str, Any]) -> CreditCard:
         """
         Cria um novo cartão de crédito.
 
@@ -156,7 +195,7 @@ class CreditCardsService:
 
         Returns
         -------
-        Dict[str, Any]
+        CreditCard
             Dados do cartão criado
 
         Raises
@@ -181,7 +220,9 @@ class CreditCardsService:
         try:
             # Processa dados antes do envio
             processed_data = self._process_card_data(card_data)
-            return api_client.post(self.ENDPOINT, processed_data)
+            return CreditCard.from_api(
+                api_client.post(self.ENDPOINT, processed_data)
+            )
         except ApiClientError as e:
             logger.error(f"Erro ao criar cartão de crédito: {e}")
             raise
@@ -189,7 +230,7 @@ class CreditCardsService:
     def update_credit_card(
             self,
             card_id: int,
-            card_data: Dict[str, Any]) -> Dict[str, Any]:
+            card_data: Dict[str, Any]) -> CreditCard:
         """
         Atualiza um cartão de crédito existente.
 
@@ -202,7 +243,7 @@ class CreditCardsService:
 
         Returns
         -------
-        Dict[str, Any]
+        CreditCard
             Dados do cartão atualizado
 
         Raises
@@ -213,7 +254,9 @@ class CreditCardsService:
         try:
             processed_data = self._process_card_data(card_data)
             endpoint = f"{self.ENDPOINT}{card_id}/"
-            return api_client.put(endpoint, processed_data)
+            return CreditCard.from_api(
+                api_client.put(endpoint, processed_data)
+            )
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar cartão {card_id}: {e}")
             raise
@@ -240,7 +283,7 @@ class CreditCardsService:
             logger.error(f"Erro ao excluir cartão {card_id}: {e}")
             raise
 
-    def get_cards_by_account(self, account_id: int) -> List[Dict[str, Any]]:
+    def get_cards_by_account(self, account_id: int) -> List[CreditCard]:
         """
         Obtém cartões filtrados por conta associada.
 
@@ -251,23 +294,23 @@ class CreditCardsService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[CreditCard]
             Lista de cartões da conta
         """
         return self.get_all_credit_cards(associated_account=account_id)
 
-    def get_active_cards(self) -> List[Dict[str, Any]]:
+    def get_active_cards(self) -> List[CreditCard]:
         """
         Obtém todos os cartões ativos.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[CreditCard]
             Lista de cartões ativos
         """
         return self.get_all_credit_cards(is_active=True)
 
-    def get_cards_by_flag(self, flag: str) -> List[Dict[str, Any]]:
+    def get_cards_by_flag(self, flag: str) -> List[CreditCard]:
         """
         Obtém cartões filtrados por bandeira.
 
@@ -278,7 +321,7 @@ class CreditCardsService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[CreditCard]
             Lista de cartões da bandeira
         """
         return self.get_all_credit_cards(flag=flag)
@@ -7,10 +7,17 @@ gerenciamento de despesas na expenselit-api.
 
 import logging
 from datetime import date, timedelta
-from typing import List, Dict, Any, Optional, Union
+from functools import partial
+from typing import Iterator, List, Dict, Any, Optional, Union
 
+from config.settings import db_categories
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
+from services.local_ledger import local_ledger
 from utils.date_utils import format_date_for_api
+from utils.records import Expense
+from utils.text_index import TextIndex, order_by_ids
+from utils.transaction_batch import TransactionBatch
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +33,9 @@ class ExpensesService:
 
     ENDPOINT = "expenses/"
 
+    # Campos de texto considerados pela busca textual
+    SEARCH_FIELDS = ('description', 'account_name')
+
     def get_all_expenses(
         self,
         category: Optional[str] = None,
@@ -34,7 +44,7 @@ class ExpensesService:
         date_from: Optional[Union[str, date]] = None,
         date_to: Optional[Union[str, date]] = None,
         limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Expense]:
         """
         Obtém todas as despesas com filtros opcionais.
 
@@ -55,45 +65,242 @@ class ExpensesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Expense]
             Lista de despesas
 
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        if local_ledger.is_enabled():
+            try:
+                records = local_ledger.select(
+                    self.ENDPOINT,
+                    equals={
+                        'category': category,
+                        'payed': payed,
+                        'account': account_id or None
+                    },
+                    date_from=format_date_for_api(date_from),
+                    date_to=format_date_for_api(date_to),
+                    limit=limit
+                )
+                return [Expense.from_api(record) for record in records]
+            except ApiClientError as e:
+                logger.error(f"Erro ao buscar despesas: {e}")
+                raise
+
+        return list(self.iter_expenses(
+            category=category,
+            payed=payed,
+            account_id=account_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit
+        ))
+
+    async def get_all_expenses_async(
+        self,
+        **filters: Any
+    ) -> List[Expense]:
+        """
+        Versão assíncrona de ``get_all_expenses``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_expenses``
+
+        Returns
+        -------
+        List[Expense]
+            Lista de despesas
+        """
+        return await async_api_client.run_sync(
+            self.get_all_expenses, **filters
+        )
+
+    @staticmethod
+    def _get_params(
+        category: Optional[str],
+        payed: Optional[bool],
+        account_id: Optional[int],
+        date_from: Optional[Union[str, date]],
+        date_to: Optional[Union[str, date]],
+        limit: Optional[int]
+    ) -> Dict[str, str]:
+        """
+        Monta os parâmetros de consulta da listagem de despesas.
+
+        Parameters
+        ----------
+        category, payed, account_id, date_from, date_to, limit
+            Mesmos filtros de ``get_all_expenses``
+
+        Returns
+        -------
+        Dict[str, str]
+            Parâmetros da requisição
+        """
+        params: Dict[str, str] = {}
+
+        if category:
+            params['category'] = category
+        if payed is not None:
+            params['payed'] = str(payed).lower()
+        if account_id:
+            params['account'] = str(account_id)
+        if date_from:
+            params['date_from'] = format_date_for_api(date_from)
+        if date_to:
+            params['date_to'] = format_date_for_api(date_to)
+        if limit:
+            params['limit'] = str(limit)
+        return params
+
+    def get_expenses_batch(
+        self,
+        category: Optional[str] = None,
+        payed: Optional[bool] = None,
+        account_id: Optional[int] = None,
+        date_from: Optional[Union[str, date]] = None,
+        date_to: Optional[Union[str, date]] = None
+    ) -> TransactionBatch:
+        """
+        Obtém as despesas como lote colunar, para agregações.
+
+        Os registros não são convertidos um a um: com o espelho local
+        habilitado, o lote é montado a partir da tabela espelhada; sem
+        ele, a partir do JSON das páginas da API.
+
+        Parameters
+        ----------
+        category, payed, account_id, date_from, date_to
+            Mesmos filtros de ``get_all_expenses``
+
+        Returns
+        -------
+        TransactionBatch
+            Lote com as despesas
+
         Raises
         ------
         ApiClientError
             Se houver erro na comunicação com a API
         """
         try:
-            params = {}
-
-            if category:
-                params['category'] = category
-            if payed is not None:
-                params['payed'] = str(payed).lower()
-            if account_id:
-                params['account'] = str(account_id)
-            if date_from:
-                params['date_from'] = format_date_for_api(date_from)
-            if date_to:
-                params['date_to'] = format_date_for_api(date_to)
-            if limit:
-                params['limit'] = str(limit)
-
-            response = api_client.get(self.ENDPOINT, params=params)
-
-            # A API pode retornar uma lista direta ou um objeto com 'results'
-            if isinstance(response, dict) and 'results' in response:
-                return response['results']
-            elif isinstance(response, list):
-                return response
+            if local_ledger.is_enabled():
+                records = local_ledger.select_frame(
+                    self.ENDPOINT,
+                    equals={
+                        'category': category,
+                        'payed': payed,
+                        'account': account_id or None
+                    },
+                    date_from=format_date_for_api(date_from),
+                    date_to=format_date_for_api(date_to)
+                )
             else:
-                return []
+                records = list(api_client.iter_items(
+                    self.ENDPOINT,
+                    params=self._get_params(
+                        category, payed, account_id, date_from, date_to,
+                        None
+                    )
+                ))
+            return TransactionBatch.from_records(
+                records, 'payed', db_categories.EXPENSE_CATEGORIES
+            )
+        except ApiClientError as e:
+            logger.error(f"Erro ao buscar despesas: {e}")
+            raise
 
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        payed: Optional[bool] = None,
+        account_id: Optional[int] = None,
+        date_from: Optional[Union[str, date]] = None,
+        date_to: Optional[Union[str, date]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Expense]:
+        """
+        Percorre as despesas sob demanda, seguindo a paginação da API.
+
+        A próxima página é buscada em segundo plano enquanto a atual
+        é consumida, sem manter todos os registros em memória.
+
+        Parameters
+        ----------
+        category, payed, account_id, date_from, date_to, limit
+            Mesmos filtros de ``get_all_expenses``
+
+        Yields
+        ------
+        Expense
+            Despesas de todas as páginas
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        params = self._get_params(
+            category, payed, account_id, date_from, date_to, limit
+        )
+        try:
+            yield from map(Expense.from_api, api_client.iter_items(
+                self.ENDPOINT, params=params, max_items=limit
+            ))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar despesas: {e}")
             raise
 
-    def get_expense_by_id(self, expense_id: int) -> Dict[str, Any]:
+    def search_expenses(
+        self,
+        query: str,
+        expenses: List[Expense]
+    ) -> List[Expense]:
+        """
+        Busca despesas pelo texto de ``SEARCH_FIELDS``.
+
+        Com o espelho local, a busca usa o índice textual do usuário,
+        construído uma única vez e atualizado a cada alteração; sem ele,
+        o índice é montado sobre as despesas informadas. Nenhum dos casos
+        consulta a API.
+
+        Parameters
+        ----------
+        query : str
+            Texto buscado
+        expenses : List[Expense]
+            Despesas carregadas (já filtradas pela listagem)
+
+        Returns
+        -------
+        List[Expense]
+            Despesas encontradas, da mais relevante para a menos
+        """
+        if local_ledger.is_enabled():
+            try:
+                ranked = local_ledger.query_view(
+                    self.ENDPOINT,
+                    'text_index',
+                    partial(TextIndex, fields=self.SEARCH_FIELDS),
+                    lambda index: index.search(query)
+                )
+            except ApiClientError as e:
+                logger.error(f"Erro ao buscar despesas: {e}")
+                raise
+        else:
+            ranked = TextIndex(expenses, self.SEARCH_FIELDS).search(query)
+        return order_by_ids(expenses, ranked)
+
+    def get_expense_by_id(self, expense_id: int) -> Expense:
         """
         Obtém uma despesa específica pelo ID.
 
@@ -104,7 +311,7 @@ class ExpensesService:
 
         Returns
         -------
-        Dict[str, Any]
+        Expense
             Dados da despesa
 
         Raises
@@ -114,12 +321,12 @@ class ExpensesService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{expense_id}/"
-            return api_client.get(endpoint)
+            return Expense.from_api(api_client.get(endpoint))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar despesa {expense_id}: {e}")
             raise
 
-    def create_expense(self, expense_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_expense(self, expense_data: Dict[str, Any]) -> Expense:
         """
         Cria uma nova despesa.
 
@@ -133,7 +340,7 @@ class ExpensesService:
 
         Returns
         -------
-        Dict[str, Any]
+        Expense
             Dados da despesa criada
 
         Raises
@@ -157,7 +364,9 @@ class ExpensesService:
         try:
             # Processa dados antes do envio
             processed_data = self._process_expense_data(expense_data)
-            return api_client.post(self.ENDPOINT, processed_data)
+            expense = api_client.post(self.ENDPOINT, processed_data)
+            local_ledger.upsert(self.ENDPOINT, expense)
+            return Expense.from_api(expense)
         except ApiClientError as e:
             logger.error(f"Erro ao criar despesa: {e}")
             raise
@@ -165,7 +374,7 @@ class ExpensesService:
     def update_expense(
             self,
             expense_id: int,
-            expense_data: Dict[str, Any]) -> Dict[str, Any]:
+            expense_data: Dict[str, Any]) -> Expense:
         """
         Atualiza uma despesa existente.
 
@@ -178,7 +387,7 @@ class ExpensesService:
 
         Returns
         -------
-        Dict[str, Any]
+        Expense
             Dados da despesa atualizada
 
         Raises
@@ -189,7 +398,9 @@ class ExpensesService:
         try:
             processed_data = self._process_expense_data(expense_data)
             endpoint = f"{self.ENDPOINT}{expense_id}/"
-            return api_client.put(endpoint, processed_data)
+            expense = api_client.put(endpoint, processed_data)
+            local_ledger.upsert(self.ENDPOINT, expense)
+            return Expense.from_api(expense)
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar despesa {expense_id}: {e}")
             raise
@@ -211,12 +422,13 @@ class ExpensesService:
         try:
             endpoint = f"{self.ENDPOINT}{expense_id}/"
             api_client.delete(endpoint)
+            local_ledger.remove(self.ENDPOINT, expense_id)
             logger.info(f"Despesa {expense_id} excluída com sucesso")
         except ApiClientError as e:
             logger.error(f"Erro ao excluir despesa {expense_id}: {e}")
             raise
 
-    def get_expenses_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def get_expenses_by_category(self, category: str) -> List[Expense]:
         """
         Obtém despesas filtradas por categoria.
 
@@ -227,18 +439,18 @@ class ExpensesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Expense]
             Lista de despesas da categoria
         """
         return self.get_all_expenses(category=category)
 
-    def get_unpaid_expenses(self) -> List[Dict[str, Any]]:
+    def get_unpaid_expenses(self) -> List[Expense]:
         """
         Obtém todas as despesas não pagas.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Expense]
             Lista de despesas não pagas
         """
         return self.get_all_expenses(payed=False)
@@ -247,7 +459,7 @@ class ExpensesService:
         self,
         start_date: Union[str, date],
         end_date: Union[str, date]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Expense]:
         """
         Obtém despesas em um período específico.
 
@@ -260,7 +472,7 @@ class ExpensesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Expense]
             Lista de despesas no período
         """
         return self.get_all_expenses(date_from=start_date, date_to=end_date)
@@ -268,7 +480,7 @@ class ExpensesService:
     def get_monthly_expenses(
             self,
             year: int,
-            month: int) -> List[Dict[str, Any]]:
+            month: int) -> List[Expense]:
         """
         Obtém despesas de um mês específico.
 
@@ -281,7 +493,7 @@ class ExpensesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Expense]
             Lista de despesas do mês
         """
         start_date = date(year, month, 1)
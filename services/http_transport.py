@@ -0,0 +1,239 @@
+"""
+Transporte HTTP compartilhado para comunicação com a expenselit-api.
+
+Este módulo mantém um único pool de conexões por processo, reutilizado
+por todas as sessões do Streamlit. Cada thread recebe uma sessão HTTP
+própria e sem estado (cookies e headers de autenticação não são
+guardados), enquanto o pool, os timeouts e a política de retentativas
+são compartilhados e configurados em ``ApiConfig``.
+"""
+
+import logging
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import api_config
+
+
+logger = logging.getLogger(__name__)
+
+
+class ApiMetrics:
+    """
+    Métricas de requisições HTTP do processo.
+
+    Acumula, por método HTTP, o número de requisições, de retentativas,
+    de falhas de conexão e as latências observadas.
+    """
+
+    def __init__(self):
+        """Inicializa os contadores de métricas."""
+        self._lock = threading.Lock()
+        self._methods: Dict[str, Dict[str, float]] = {}
+
+    def _get_counters(self, method: str) -> Dict[str, float]:
+        """
+        Obtém os contadores de um método HTTP, criando-os se necessário.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP
+
+        Returns
+        -------
+        Dict[str, float]
+            Contadores do método
+        """
+        return self._methods.setdefault(method.upper(), {
+            'requests': 0,
+            'retries': 0,
+            'failures': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0
+        })
+
+    def record_request(
+        self,
+        method: str,
+        latency: float,
+        failed: bool = False
+    ) -> None:
+        """
+        Registra uma requisição concluída.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP
+        latency : float
+            Duração total da requisição em segundos, incluindo retentativas
+        failed : bool, optional
+            Se a requisição terminou com erro de conexão
+        """
+        with self._lock:
+            counters = self._get_counters(method)
+            counters['requests'] += 1
+            counters['total_latency'] += latency
+            counters['max_latency'] = max(counters['max_latency'], latency)
+            if failed:
+                counters['failures'] += 1
+
+    def record_retry(self, method: Optional[str]) -> None:
+        """
+        Registra uma retentativa.
+
+        Parameters
+        ----------
+        method : str, optional
+            Método HTTP da requisição retentada
+        """
+        with self._lock:
+            self._get_counters(method or 'UNKNOWN')['retries'] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Obtém uma cópia das métricas acumuladas.
+
+        Returns
+        -------
+        Dict[str, Dict[str, float]]
+            Métricas por método HTTP, incluindo a latência média
+        """
+        with self._lock:
+            result = {}
+            for method, counters in self._methods.items():
+                requests_count = counters['requests']
+                result[method] = {
+                    **counters,
+                    'avg_latency': (
+                        counters['total_latency'] / requests_count
+                        if requests_count else 0.0
+                    )
+                }
+            return result
+
+
+# Métricas globais das requisições à API
+api_metrics = ApiMetrics()
+
+
+class MetricsRetry(Retry):
+    """Política de retentativas que registra cada tentativa nas métricas."""
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        """Registra a retentativa antes de delegar ao urllib3."""
+        api_metrics.record_retry(method)
+        return super().increment(method, url, *args, **kwargs)
+
+
+class HttpTransport:
+    """
+    Transporte HTTP thread-safe com pool de conexões por processo.
+
+    ``requests.Session`` não é thread-safe e guarda cookies e headers
+    que poderiam vazar entre usuários. Por isso cada thread usa uma
+    sessão própria, todas montadas sobre o mesmo ``HTTPAdapter``, cujo
+    pool de conexões (urllib3) é thread-safe e mantém as conexões
+    keep-alive reaproveitadas entre todas as sessões do nó.
+    """
+
+    DEFAULT_HEADERS: Dict[str, str] = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    }
+
+    def __init__(self):
+        """Inicializa o transporte com o adapter compartilhado."""
+        self.timeout = (api_config.CONNECT_TIMEOUT, api_config.READ_TIMEOUT)
+        self.adapter = HTTPAdapter(
+            pool_connections=api_config.POOL_CONNECTIONS,
+            pool_maxsize=api_config.POOL_MAXSIZE,
+            pool_block=api_config.POOL_BLOCK,
+            max_retries=MetricsRetry(
+                total=api_config.MAX_RETRIES,
+                backoff_factor=api_config.RETRY_BACKOFF_FACTOR,
+                backoff_jitter=api_config.RETRY_BACKOFF_JITTER,
+                status_forcelist=api_config.RETRY_STATUS_CODES,
+                allowed_methods=api_config.RETRY_METHODS,
+                raise_on_status=False
+            )
+        )
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Obtém a sessão HTTP da thread atual, criando-a se necessário.
+
+        Returns
+        -------
+        requests.Session
+            Sessão ligada ao pool compartilhado, que recusa cookies
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.DEFAULT_HEADERS)
+            # Cookies da API não podem ser reenviados para outros usuários
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            session.mount('http://', self.adapter)
+            session.mount('https://', self.adapter)
+            self._local.session = session
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Tuple[float, float]] = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """
+        Executa uma requisição HTTP com timeout e registro de métricas.
+
+        Parameters
+        ----------
+        method : str
+            Método HTTP
+        url : str
+            URL completa da requisição
+        timeout : Tuple[float, float], optional
+            Timeouts de conexão e leitura em segundos. Se None, usa os
+            valores de ``ApiConfig``
+        **kwargs : Any
+            Argumentos repassados para ``requests.Session.request``,
+            incluindo os headers de autenticação da sessão do usuário
+
+        Returns
+        -------
+        requests.Response
+            Resposta da requisição
+
+        Raises
+        ------
+        requests.RequestException
+            Para erros de conexão ou timeout após as retentativas
+        """
+        started_at = time.perf_counter()
+        failed = True
+        try:
+            response = self.session.request(
+                method, url, timeout=timeout or self.timeout, **kwargs
+            )
+            failed = False
+            return response
+        finally:
+            api_metrics.record_request(
+                method, time.perf_counter() - started_at, failed
+            )
+
+
+# Transporte HTTP único do processo
+http_transport = HttpTransport()
@@ -7,10 +7,13 @@ gerenciamento de empréstimos na expenselit-api.
 
 import logging
 # from datetime import date  # Não usado
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
+from services.local_ledger import local_ledger
 from utils.date_utils import format_date_for_api
+from utils.records import Loan
 
 
 logger = logging.getLogger(__name__)
@@ -35,7 +38,7 @@ class LoansService:
         benefited_id: Optional[int] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Loan]:
         """
         Obtém todos os empréstimos com filtros opcionais.
 
@@ -58,7 +61,7 @@ class LoansService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Loan]
             Lista de empréstimos
 
         Raises
@@ -66,39 +69,119 @@ class LoansService:
         ApiClientError
             Se houver erro na comunicação com a API
         """
-        try:
-            params = {}
-
-            if category:
-                params['category'] = category
-            if payed is not None:
-                params['payed'] = str(payed).lower()
-            if account_id:
-                params['account'] = str(account_id)
-            if creditor_id:
-                params['creditor'] = str(creditor_id)
-            if benefited_id:
-                params['benefited'] = str(benefited_id)
-            if date_from:
-                params['date_from'] = date_from
-            if date_to:
-                params['date_to'] = date_to
-
-            response = api_client.get(self.ENDPOINT, params=params)
-
-            # A API pode retornar uma lista direta ou um objeto com 'results'
-            if isinstance(response, dict) and 'results' in response:
-                return response['results']
-            elif isinstance(response, list):
-                return response
-            else:
-                return []
+        if local_ledger.is_enabled():
+            try:
+                records = local_ledger.select(
+                    self.ENDPOINT,
+                    equals={
+                        'category': category,
+                        'payed': payed,
+                        'account': account_id or None,
+                        'creditor': creditor_id or None,
+                        'benefited': benefited_id or None
+                    },
+                    date_from=date_from,
+                    date_to=date_to
+                )
+                return [Loan.from_api(record) for record in records]
+            except ApiClientError as e:
+                logger.error(f"Erro ao buscar empréstimos: {e}")
+                raise
+
+        return list(self.iter_loans(
+            category=category,
+            payed=payed,
+            account_id=account_id,
+            creditor_id=creditor_id,
+            benefited_id=benefited_id,
+            date_from=date_from,
+            date_to=date_to
+        ))
+
+    async def get_all_loans_async(
+        self,
+        **filters: Any
+    ) -> List[Loan]:
+        """
+        Versão assíncrona de ``get_all_loans``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_loans``
+
+        Returns
+        -------
+        List[Loan]
+            Lista de empréstimos
+        """
+        return await async_api_client.run_sync(
+            self.get_all_loans, **filters
+        )
+
+    def iter_loans(
+        self,
+        category: Optional[str] = None,
+        payed: Optional[bool] = None,
+        account_id: Optional[int] = None,
+        creditor_id: Optional[int] = None,
+        benefited_id: Optional[int] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None
+    ) -> Iterator[Loan]:
+        """
+        Percorre os empréstimos sob demanda, seguindo a paginação da API.
 
+        A próxima página é buscada em segundo plano enquanto a atual
+        é consumida, sem manter todos os registros em memória.
+
+        Parameters
+        ----------
+        category, payed, account_id, creditor_id, benefited_id
+            Mesmos filtros de ``get_all_loans``
+        date_from, date_to
+            Mesmos filtros de ``get_all_loans``
+
+        Yields
+        ------
+        Loan
+            Empréstimos de todas as páginas
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        params: Dict[str, str] = {}
+
+        if category:
+            params['category'] = category
+        if payed is not None:
+            params['payed'] = str(payed).lower()
+        if account_id:
+            params['account'] = str(account_id)
+        if creditor_id:
+            params['creditor'] = str(creditor_id)
+        if benefited_id:
+            params['benefited'] = str(benefited_id)
+        if date_from:
+            params['date_from'] = date_from
+        if date_to:
+            params['date_to'] = date_to
+
+        try:
+            yield from map(
+                Loan.from_api,
+                api_client.iter_items(self.ENDPOINT, params=params)
+            )
         except ApiClientError as e:
             logger.error(f"Erro ao buscar empréstimos: {e}")
             raise
 
-    def get_loan_by_id(self, loan_id: int) -> Dict[str, Any]:
+    def get_loan_by_id(self, loan_id: int) -> Loan:
         """
         Obtém um empréstimo específico pelo ID.
 
@@ -109,7 +192,7 @@ class LoansService:
 
         Returns
         -------
-        Dict[str, Any]
+        Loan
             Dados do empréstimo
 
         Raises
@@ -119,12 +202,12 @@ class LoansService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{loan_id}/"
-            return api_client.get(endpoint)
+            return Loan.from_api(api_client.get(endpoint))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar empréstimo {loan_id}: {e}")
             raise
 
-    def create_loan(self, loan_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_loan(self, loan_data: Dict[str, Any]) -> Loan:
         """
         Cria um novo empréstimo.
 
@@ -141,7 +224,7 @@ class LoansService:
 
         Returns
         -------
-        Dict[str, Any]
+        Loan
             Dados do empréstimo criado
 
         Raises
@@ -166,7 +249,9 @@ class LoansService:
         try:
             # Processa dados antes do envio
             processed_data = self._process_loan_data(loan_data)
-            return api_client.post(self.ENDPOINT, processed_data)
+            loan = api_client.post(self.ENDPOINT, processed_data)
+            local_ledger.upsert(self.ENDPOINT, loan)
+            return Loan.from_api(loan)
         except ApiClientError as e:
             logger.error(f"Erro ao criar empréstimo: {e}")
             raise
@@ -174,7 +259,7 @@ class LoansService:
     def update_loan(
             self,
             loan_id: int,
-            loan_data: Dict[str, Any]) -> Dict[str, Any]:
+            loan_data: Dict[str, Any]) -> Loan:
         """
         Atualiza um empréstimo existente.
 
@@ -187,7 +272,7 @@ class LoansService:
 
         Returns
         -------
-        Dict[str, Any]
+        Loan
             Dados do empréstimo atualizado
 
         Raises
@@ -198,7 +283,9 @@ class LoansService:
         try:
             processed_data = self._process_loan_data(loan_data)
             endpoint = f"{self.ENDPOINT}{loan_id}/"
-            return api_client.put(endpoint, processed_data)
+            loan = api_client.put(endpoint, processed_data)
+            local_ledger.upsert(self.ENDPOINT, loan)
+            return Loan.from_api(loan)
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar empréstimo {loan_id}: {e}")
             raise
@@ -220,12 +307,13 @@ class LoansService:
         try:
             endpoint = f"{self.ENDPOINT}{loan_id}/"
             api_client.delete(endpoint)
+            local_ledger.remove(self.ENDPOINT, loan_id)
             logger.info(f"Empréstimo {loan_id} excluído com sucesso")
         except ApiClientError as e:
             logger.error(f"Erro ao excluir empréstimo {loan_id}: {e}")
             raise
 
-    def get_loans_as_creditor(self, creditor_id: int) -> List[Dict[str, Any]]:
+    def get_loans_as_creditor(self, creditor_id: int) -> List[Loan]:
         """
         Obtém empréstimos onde um membro é credor.
 
@@ -236,14 +324,14 @@ class LoansService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Loan]
             Lista de empréstimos como credor
         """
         return self.get_all_loans(creditor_id=creditor_id)
 
     def get_loans_as_benefited(
             self,
-            benefited_id: int) -> List[Dict[str, Any]]:
+            benefited_id: int) -> List[Loan]:
         """
         Obtém empréstimos onde um membro é beneficiário.
 
@@ -254,34 +342,34 @@ class LoansService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Loan]
             Lista de empréstimos como beneficiário
         """
         return self.get_all_loans(benefited_id=benefited_id)
 
-    def get_pending_loans(self) -> List[Dict[str, Any]]:
+    def get_pending_loans(self) -> List[Loan]:
         """
         Obtém todos os empréstimos não pagos.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Loan]
             Lista de empréstimos não pagos
         """
         return self.get_all_loans(payed=False)
 
-    def get_paid_loans(self) -> List[Dict[str, Any]]:
+    def get_paid_loans(self) -> List[Loan]:
         """
         Obtém todos os empréstimos pagos.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Loan]
             Lista de empréstimos pagos
         """
         return self.get_all_loans(payed=True)
 
-    def get_loans_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def get_loans_by_category(self, category: str) -> List[Loan]:
         """
         Obtém empréstimos filtrados por categoria.
 
@@ -292,7 +380,7 @@ class LoansService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Loan]
             Lista de empréstimos da categoria
         """
         return self.get_all_loans(category=category)
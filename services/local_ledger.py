@@ -0,0 +1,815 @@
+"""
+Espelho local das movimentações financeiras do usuário.
+
+Este módulo mantém, por usuário, uma cópia colunar (pandas/pyarrow)
+de despesas, receitas, transferências e empréstimos, persistida em
+disco no formato Parquet. A cópia é sincronizada de forma incremental,
+buscando na API apenas os registros alterados desde a última
+sincronização (``updated_at``), e atende às listagens dos serviços
+como varreduras em memória.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import streamlit as st
+
+from config.settings import api_config, app_config
+from services.api_client import api_client
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Chaves de metadados gravadas no esquema do arquivo Parquet
+_WATERMARK_KEY = b'expenselit.watermark'
+_FULL_SYNCED_AT_KEY = b'expenselit.full_synced_at'
+
+
+class LedgerTable:
+    """
+    Tabela espelhada de um endpoint de listagem para um usuário.
+
+    Attributes
+    ----------
+    frame : pd.DataFrame
+        Registros do endpoint, um por linha (colunas do tipo object,
+        preservando os valores exatamente como vieram da API)
+    watermark : str or None
+        Maior ``updated_at`` presente na tabela
+    full_synced_at : float
+        Instante (epoch) da última sincronização completa
+    synced_at : float
+        Instante (monotônico) da última sincronização de qualquer tipo
+    dirty : bool
+        Se há alterações ainda não gravadas em disco
+    persisted_at : float
+        Instante (monotônico) da última gravação em disco
+    views : Dict[str, Any]
+        Estruturas derivadas da tabela (ex.: cubos de agregação),
+        mantidas em dia a cada alteração pelo método
+        ``apply(removed, added)`` de cada uma
+    """
+
+    def __init__(
+        self,
+        frame: pd.DataFrame,
+        watermark: Optional[str] = None,
+        full_synced_at: float = 0.0
+    ):
+        """
+        Inicializa a tabela espelhada.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Registros do endpoint
+        watermark : str, optional
+            Maior ``updated_at`` presente na tabela
+        full_synced_at : float, optional
+            Instante (epoch) da última sincronização completa
+        """
+        self.frame = frame
+        self.watermark = watermark
+        self.full_synced_at = full_synced_at
+        self.synced_at = 0.0
+        self.dirty = False
+        self.persisted_at = 0.0
+        self.views: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def notify_views(
+        self,
+        removed: pd.DataFrame,
+        added: pd.DataFrame
+    ) -> None:
+        """
+        Repassa uma alteração da tabela às estruturas derivadas.
+
+        Parameters
+        ----------
+        removed : pd.DataFrame
+            Linhas removidas ou versões anteriores de linhas alteradas
+        added : pd.DataFrame
+            Linhas novas ou versões atuais de linhas alteradas
+        """
+        for view in self.views.values():
+            view.apply(removed, added)
+
+
+class LocalLedger:
+    """
+    Espelho local, por usuário, dos endpoints de movimentações.
+
+    As tabelas são compartilhadas entre as sessões do mesmo usuário no
+    processo e persistidas em ``app_config.LEDGER_DIR``. Alterações
+    feitas pelos serviços desta aplicação são aplicadas diretamente ao
+    espelho; alterações externas chegam pela sincronização incremental
+    e exclusões externas pela sincronização completa periódica.
+
+    As alterações feitas pela aplicação são gravadas em disco em lotes,
+    no máximo uma vez a cada ``api_config.LEDGER_PERSIST_INTERVAL``
+    segundos por tabela; as pendentes são gravadas na sincronização
+    seguinte, no logout (``flush``) e no encerramento do processo.
+    """
+
+    def __init__(self, base_dir: Path = app_config.LEDGER_DIR):
+        """
+        Inicializa o espelho local.
+
+        Parameters
+        ----------
+        base_dir : Path, optional
+            Diretório onde as tabelas são persistidas
+        """
+        self.base_dir = base_dir
+        self._tables: Dict[Tuple[str, str], LedgerTable] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def is_enabled(self) -> bool:
+        """
+        Verifica se o espelho pode atender à sessão atual.
+
+        Returns
+        -------
+        bool
+            True se o espelho está habilitado e há usuário autenticado
+        """
+        return api_config.LEDGER_ENABLED and bool(
+            st.session_state.get('is_authenticated')
+            and st.session_state.get('username')
+        )
+
+    @staticmethod
+    def _get_resource(endpoint: str) -> str:
+        """
+        Obtém o nome do recurso de um endpoint de listagem.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (ex.: ``expenses/``)
+
+        Returns
+        -------
+        str
+            Nome do recurso (ex.: ``expenses``)
+        """
+        return endpoint.strip('/').split('/')[0]
+
+    def _get_path(self, username: str, endpoint: str) -> Path:
+        """
+        Obtém o arquivo Parquet de uma tabela.
+
+        Parameters
+        ----------
+        username : str
+            Nome do usuário dono dos dados
+        endpoint : str
+            Endpoint da API
+
+        Returns
+        -------
+        Path
+            Caminho do arquivo da tabela
+        """
+        user_dir = hashlib.sha256(username.encode('utf-8')).hexdigest()[:16]
+        file_name = f"{self._get_resource(endpoint)}.parquet"
+        return self.base_dir / user_dir / file_name
+
+    @staticmethod
+    def _to_frame(records: List[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Converte registros da API em DataFrame ordenado.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]]
+            Registros retornados pela API
+
+        Returns
+        -------
+        pd.DataFrame
+            Registros do mais recente para o mais antigo
+        """
+        return LocalLedger._sort(pd.DataFrame(records, dtype=object))
+
+    @staticmethod
+    def _sort(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ordena os registros do mais recente para o mais antigo.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Registros da tabela
+
+        Returns
+        -------
+        pd.DataFrame
+            Registros ordenados por data, horário e ID
+        """
+        columns = [
+            column for column in ('date', 'horary', 'id')
+            if column in frame.columns
+        ]
+        if not columns or frame.empty:
+            return frame.reset_index(drop=True)
+        return frame.sort_values(
+            columns, ascending=False, na_position='last', kind='stable'
+        ).reset_index(drop=True)
+
+    @staticmethod
+    def _to_records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Converte linhas da tabela de volta em registros da API.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Linhas selecionadas
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Registros, com campos ausentes como None
+        """
+        return frame.astype(object).where(frame.notna(), None).to_dict(
+            'records'
+        )
+
+    @staticmethod
+    def _get_watermark(frame: pd.DataFrame) -> Optional[str]:
+        """
+        Obtém o maior ``updated_at`` da tabela.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Registros da tabela
+
+        Returns
+        -------
+        str or None
+            Marca d'água para a próxima sincronização incremental
+        """
+        if 'updated_at' not in frame.columns:
+            return None
+        updated_at = frame['updated_at'].dropna()
+        return str(updated_at.max()) if not updated_at.empty else None
+
+    def _load(self, path: Path) -> LedgerTable:
+        """
+        Carrega uma tabela persistida, se existir.
+
+        Parameters
+        ----------
+        path : Path
+            Caminho do arquivo da tabela
+
+        Returns
+        -------
+        LedgerTable
+            Tabela carregada ou vazia
+        """
+        if not path.exists():
+            return LedgerTable(pd.DataFrame(dtype=object))
+
+        try:
+            table = pq.read_table(path)
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Espelho local ilegível em {path}: {e}")
+            return LedgerTable(pd.DataFrame(dtype=object))
+
+        metadata = table.schema.metadata or {}
+        watermark = metadata.get(_WATERMARK_KEY)
+        return LedgerTable(
+            self._to_frame(table.to_pylist()),
+            watermark=watermark.decode('utf-8') if watermark else None,
+            full_synced_at=float(metadata.get(_FULL_SYNCED_AT_KEY, b'0'))
+        )
+
+    def _persist(self, path: Path, ledger_table: LedgerTable) -> None:
+        """
+        Grava uma tabela em disco de forma atômica.
+
+        Falhas de gravação não interrompem a aplicação: o espelho
+        continua válido em memória e a gravação fica pendente.
+
+        Parameters
+        ----------
+        path : Path
+            Caminho do arquivo da tabela
+        ledger_table : LedgerTable
+            Tabela a gravar
+        """
+        metadata = {
+            _FULL_SYNCED_AT_KEY: str(ledger_table.full_synced_at).encode()
+        }
+        if ledger_table.watermark:
+            metadata[_WATERMARK_KEY] = ledger_table.watermark.encode('utf-8')
+
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            table = pa.Table.from_pylist(self._to_records(ledger_table.frame))
+            pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+            os.replace(tmp_path, path)
+            ledger_table.dirty = False
+            ledger_table.persisted_at = time.monotonic()
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Não foi possível gravar o espelho {path}: {e}")
+
+    def _get_table(self, username: str, endpoint: str) -> LedgerTable:
+        """
+        Obtém a tabela de um usuário, carregando-a do disco sob demanda.
+
+        Parameters
+        ----------
+        username : str
+            Nome do usuário dono dos dados
+        endpoint : str
+            Endpoint da API
+
+        Returns
+        -------
+        LedgerTable
+            Tabela espelhada
+        """
+        key = (username, self._get_resource(endpoint))
+        with self._lock:
+            ledger_table = self._tables.get(key)
+            if ledger_table is None:
+                ledger_table = self._load(self._get_path(username, endpoint))
+                self._tables[key] = ledger_table
+        return ledger_table
+
+    def _sync(
+        self,
+        username: str,
+        endpoint: str,
+        ledger_table: LedgerTable
+    ) -> None:
+        """
+        Sincroniza uma tabela com a API, se o intervalo já passou.
+
+        Deve ser chamado com ``ledger_table.lock`` adquirido.
+
+        Parameters
+        ----------
+        username : str
+            Nome do usuário dono dos dados
+        endpoint : str
+            Endpoint da API
+        ledger_table : LedgerTable
+            Tabela a sincronizar
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        path = self._get_path(username, endpoint)
+        if ledger_table.synced_at and (
+            time.monotonic() - ledger_table.synced_at
+            < api_config.LEDGER_SYNC_INTERVAL
+        ):
+            self._persist_pending(path, ledger_table)
+            return
+
+        full = ledger_table.watermark is None or (
+            time.time() - ledger_table.full_synced_at
+            >= api_config.LEDGER_FULL_SYNC_INTERVAL
+        )
+        params: Dict[str, str] = {}
+        if not full:
+            params[api_config.LEDGER_UPDATED_SINCE_PARAM] = str(
+                ledger_table.watermark
+            )
+
+        # O espelho já é o cache: a resposta não passa pelo cache da sessão
+        records = list(api_client.iter_items(
+            endpoint, params=params, use_cache=False
+        ))
+
+        if full:
+            ledger_table.frame = self._to_frame(records)
+            ledger_table.full_synced_at = time.time()
+            # Estruturas derivadas são reconstruídas sob demanda
+            ledger_table.views.clear()
+        elif records:
+            # O filtro da API é inclusivo: os registros da marca d'água
+            # voltam a cada sincronização, mesmo sem alterações
+            records = self._drop_unchanged(ledger_table.frame, records)
+            if records:
+                self._merge(ledger_table, records)
+
+        ledger_table.synced_at = time.monotonic()
+        if full or records:
+            ledger_table.watermark = self._get_watermark(ledger_table.frame)
+            self._persist(path, ledger_table)
+            logger.debug(
+                f"Espelho de {endpoint} sincronizado "
+                f"({'completo' if full else 'incremental'}, "
+                f"{len(records)} registros)"
+            )
+        else:
+            self._persist_pending(path, ledger_table)
+
+    @staticmethod
+    def _drop_unchanged(
+        frame: pd.DataFrame,
+        records: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Descarta os registros já presentes na tabela na mesma versão.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Registros da tabela
+        records : List[Dict[str, Any]]
+            Registros retornados pela sincronização incremental
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Registros novos ou com ``updated_at`` diferente do da tabela
+        """
+        if frame.empty or not {'id', 'updated_at'} <= set(frame.columns):
+            return records
+        ids = [record.get('id') for record in records]
+        known_rows = frame[frame['id'].isin(ids)]
+        known = set(zip(
+            known_rows['id'].tolist(),
+            known_rows['updated_at'].map(str).tolist()
+        ))
+        return [
+            record for record in records
+            if (record.get('id'), str(record.get('updated_at'))) not in known
+        ]
+
+    def _persist_pending(
+        self,
+        path: Path,
+        ledger_table: LedgerTable,
+        force: bool = False
+    ) -> None:
+        """
+        Grava as alterações pendentes de uma tabela, se já for a hora.
+
+        Deve ser chamado com ``ledger_table.lock`` adquirido.
+
+        Parameters
+        ----------
+        path : Path
+            Caminho do arquivo da tabela
+        ledger_table : LedgerTable
+            Tabela a gravar
+        force : bool, optional
+            Grava mesmo antes de ``api_config.LEDGER_PERSIST_INTERVAL``
+        """
+        if ledger_table.dirty and (
+            force or time.monotonic() - ledger_table.persisted_at
+            >= api_config.LEDGER_PERSIST_INTERVAL
+        ):
+            self._persist(path, ledger_table)
+
+    def flush(self, username: Optional[str] = None) -> None:
+        """
+        Grava em disco todas as alterações pendentes.
+
+        Parameters
+        ----------
+        username : str, optional
+            Grava apenas as tabelas deste usuário; por padrão, todas
+        """
+        with self._lock:
+            tables = list(self._tables.items())
+        for (owner, resource), ledger_table in tables:
+            if username is not None and owner != username:
+                continue
+            with ledger_table.lock:
+                self._persist_pending(
+                    self._get_path(owner, resource),
+                    ledger_table,
+                    force=True
+                )
+
+    def _merge(
+        self,
+        ledger_table: LedgerTable,
+        records: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Substitui ou acrescenta registros na tabela, pelo ID.
+
+        Parameters
+        ----------
+        ledger_table : LedgerTable
+            Tabela a atualizar
+        records : List[Dict[str, Any]]
+            Registros novos ou alterados
+        """
+        changes = pd.DataFrame(records, dtype=object)
+        frame = ledger_table.frame
+        removed = frame.iloc[0:0]
+        if not frame.empty and 'id' in changes.columns:
+            replaced = frame['id'].isin(changes['id'])
+            removed = frame[replaced]
+            frame = frame[~replaced]
+        ledger_table.frame = self._sort(
+            pd.concat([frame, changes], ignore_index=True)
+            if not frame.empty else changes
+        )
+        ledger_table.notify_views(removed, changes)
+
+    def get_frame(self, endpoint: str) -> pd.DataFrame:
+        """
+        Obtém a tabela sincronizada de um endpoint para o usuário atual.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (ex.: ``expenses/``)
+
+        Returns
+        -------
+        pd.DataFrame
+            Todos os registros do usuário, do mais recente para o mais
+            antigo; o DataFrame não deve ser alterado pelo chamador
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        username = st.session_state['username']
+        ledger_table = self._get_table(username, endpoint)
+        with ledger_table.lock:
+            self._sync(username, endpoint, ledger_table)
+            return ledger_table.frame
+
+    def select_frame(
+        self,
+        endpoint: str,
+        equals: Optional[Dict[str, Any]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Consulta registros do espelho, mantendo-os em um DataFrame.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (ex.: ``expenses/``)
+        equals : Dict[str, Any], optional
+            Valores exigidos por coluna; valores None são ignorados
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
+        limit : int, optional
+            Limite de resultados
+
+        Returns
+        -------
+        pd.DataFrame
+            Registros, do mais recente para o mais antigo; o DataFrame
+            não deve ser alterado pelo chamador
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        frame = self.get_frame(endpoint)
+        if frame.empty:
+            return frame
+
+        mask = pd.Series(True, index=frame.index)
+        for column, value in (equals or {}).items():
+            if value is None:
+                continue
+            if column not in frame.columns:
+                return frame.iloc[0:0]
+            mask &= frame[column] == value
+        if (date_from or date_to) and 'date' not in frame.columns:
+            return frame.iloc[0:0]
+        if date_from:
+            mask &= frame['date'] >= date_from
+        if date_to:
+            mask &= frame['date'] <= date_to
+
+        selected = frame[mask]
+        if limit:
+            selected = selected.head(limit)
+        return selected
+
+    def select(
+        self,
+        endpoint: str,
+        equals: Optional[Dict[str, Any]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Consulta registros do espelho com os filtros das listagens.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (ex.: ``expenses/``)
+        equals : Dict[str, Any], optional
+            Valores exigidos por coluna; valores None são ignorados
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
+        limit : int, optional
+            Limite de resultados
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Registros, do mais recente para o mais antigo
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+
+        Examples
+        --------
+        >>> local_ledger.select(
+        ...     "expenses/", equals={'payed': False}, date_from='2024-01-01'
+        ... )
+        """
+        return self._to_records(self.select_frame(
+            endpoint,
+            equals=equals,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit
+        ))
+
+    def upsert(self, endpoint: str, record: Dict[str, Any]) -> None:
+        """
+        Aplica ao espelho um registro criado ou alterado pela aplicação.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint de listagem do registro (ex.: ``expenses/``)
+        record : Dict[str, Any]
+            Registro retornado pela API
+        """
+        if not self.is_enabled() or not isinstance(record, dict) or (
+            'id' not in record
+        ):
+            return
+
+        username = st.session_state['username']
+        ledger_table = self._get_table(username, endpoint)
+        with ledger_table.lock:
+            self._merge(ledger_table, [record])
+            ledger_table.dirty = True
+            self._persist_pending(
+                self._get_path(username, endpoint), ledger_table
+            )
+
+    def remove(self, endpoint: str, record_id: int) -> None:
+        """
+        Remove do espelho um registro excluído pela aplicação.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint de listagem do registro (ex.: ``expenses/``)
+        record_id : int
+            ID do registro excluído
+        """
+        if not self.is_enabled():
+            return
+
+        username = st.session_state['username']
+        ledger_table = self._get_table(username, endpoint)
+        with ledger_table.lock:
+            frame = ledger_table.frame
+            if frame.empty or 'id' not in frame.columns:
+                return
+            removed = frame['id'] == record_id
+            ledger_table.frame = frame[~removed].reset_index(drop=True)
+            ledger_table.notify_views(frame[removed], frame.iloc[0:0])
+            ledger_table.dirty = True
+            self._persist_pending(
+                self._get_path(username, endpoint), ledger_table
+            )
+
+    def expire(self, *endpoints: str) -> None:
+        """
+        Força a sincronização das tabelas do usuário atual no próximo
+        acesso, sem esperar o intervalo de sincronização.
+
+        Parameters
+        ----------
+        *endpoints : str
+            Endpoints das tabelas (ex.: ``expenses/``)
+        """
+        if not self.is_enabled():
+            return
+
+        username = st.session_state['username']
+        for endpoint in endpoints:
+            ledger_table = self._get_table(username, endpoint)
+            with ledger_table.lock:
+                ledger_table.synced_at = 0.0
+
+    def release(self, username: str) -> None:
+        """
+        Libera da memória as tabelas de um usuário (ex.: no logout).
+
+        As alterações pendentes são gravadas antes; no próximo acesso, as
+        tabelas são recarregadas do disco e as estruturas derivadas,
+        reconstruídas.
+
+        Parameters
+        ----------
+        username : str
+            Nome do usuário
+        """
+        self.flush(username)
+        with self._lock:
+            for key in [key for key in self._tables if key[0] == username]:
+                del self._tables[key]
+
+    def query_view(
+        self,
+        endpoint: str,
+        name: str,
+        factory: Callable[[pd.DataFrame], Any],
+        query: Callable[[Any], T]
+    ) -> T:
+        """
+        Consulta uma estrutura derivada da tabela do usuário atual.
+
+        A estrutura é construída uma única vez a partir da tabela e,
+        depois, atualizada de forma incremental pelas sincronizações e
+        pelas alterações feitas pela aplicação. A consulta é executada
+        com a tabela bloqueada, sem alterações simultâneas.
+
+        Parameters
+        ----------
+        endpoint : str
+            Endpoint da API (ex.: ``expenses/``)
+        name : str
+            Nome da estrutura derivada
+        factory : Callable[[pd.DataFrame], Any]
+            Constrói a estrutura a partir da tabela; o objeto criado deve
+            implementar ``apply(removed, added)``
+        query : Callable[[Any], T]
+            Consulta executada sobre a estrutura
+
+        Returns
+        -------
+        T
+            Resultado da consulta
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+
+        Examples
+        --------
+        >>> local_ledger.query_view(
+        ...     "expenses/", 'rollup', build_cube, lambda cube: cube.total()
+        ... )
+        """
+        username = st.session_state['username']
+        ledger_table = self._get_table(username, endpoint)
+        with ledger_table.lock:
+            self._sync(username, endpoint, ledger_table)
+            view = ledger_table.views.get(name)
+            if view is None:
+                view = factory(ledger_table.frame)
+                ledger_table.views[name] = view
+            return query(view)
+
+
+# Instância global do espelho local
+local_ledger = LocalLedger()
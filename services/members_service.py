@@ -6,9 +6,12 @@ gerenciamento de membros (usuários, credores, beneficiários) na expenselit-api
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
+from utils.filter_spec import FilterSpec
+from utils.records import Member
 
 
 logger = logging.getLogger(__name__)
@@ -24,13 +27,17 @@ class MembersService:
 
     ENDPOINT = "members/"
 
+    # Campos filtrados pela API; os demais são aplicados localmente
+    FILTER_FIELDS = ('is_user', 'is_creditor', 'is_benefited', 'active')
+
     def get_all_members(
         self,
         is_user: Optional[bool] = None,
         is_creditor: Optional[bool] = None,
         is_benefited: Optional[bool] = None,
-        active: Optional[bool] = True
-    ) -> List[Dict[str, Any]]:
+        active: Optional[bool] = True,
+        filters: Optional[FilterSpec] = None
+    ) -> List[Member]:
         """
         Obtém todos os membros com filtros opcionais.
 
@@ -44,10 +51,13 @@ class MembersService:
             Filtrar por beneficiários
         active : bool, optional
             Filtrar por status ativo, por padrão True
+        filters : FilterSpec, optional
+            Filtros adicionais; os campos de ``FILTER_FIELDS`` são
+            enviados à API e os demais aplicados sobre a resposta
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Member]
             Lista de membros
 
         Raises
@@ -55,33 +65,89 @@ class MembersService:
         ApiClientError
             Se houver erro na comunicação com a API
         """
-        try:
-            params = {}
-
-            if is_user is not None:
-                params['is_user'] = str(is_user).lower()
-            if is_creditor is not None:
-                params['is_creditor'] = str(is_creditor).lower()
-            if is_benefited is not None:
-                params['is_benefited'] = str(is_benefited).lower()
-            if active is not None:
-                params['active'] = str(active).lower()
-
-            response = api_client.get(self.ENDPOINT, params=params)
-
-            # A API pode retornar uma lista direta ou um objeto com 'results'
-            if isinstance(response, dict) and 'results' in response:
-                return response['results']
-            elif isinstance(response, list):
-                return response
-            else:
-                return []
+        return list(self.iter_members(
+            is_user=is_user,
+            is_creditor=is_creditor,
+            is_benefited=is_benefited,
+            active=active,
+            filters=filters
+        ))
+
+    async def get_all_members_async(
+        self,
+        **filters: Any
+    ) -> List[Member]:
+        """
+        Versão assíncrona de ``get_all_members``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_members``
+
+        Returns
+        -------
+        List[Member]
+            Lista de membros
+        """
+        return await async_api_client.run_sync(
+            self.get_all_members, **filters
+        )
+
+    def iter_members(
+        self,
+        is_user: Optional[bool] = None,
+        is_creditor: Optional[bool] = None,
+        is_benefited: Optional[bool] = None,
+        active: Optional[bool] = True,
+        filters: Optional[FilterSpec] = None
+    ) -> Iterator[Member]:
+        """
+        Percorre os membros sob demanda, seguindo a paginação da API.
+
+        A próxima página é buscada em segundo plano enquanto a atual
+        é consumida, sem manter todos os registros em memória.
 
+        Parameters
+        ----------
+        is_user, is_creditor, is_benefited, active, filters
+            Mesmos filtros de ``get_all_members``
+
+        Yields
+        ------
+        Member
+            Membros de todas as páginas
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        spec = FilterSpec(
+            is_user=is_user,
+            is_creditor=is_creditor,
+            is_benefited=is_benefited,
+            active=active
+        ).merge(filters)
+        params = spec.to_params(self.FILTER_FIELDS)
+        local = spec.local(self.FILTER_FIELDS)
+
+        try:
+            members = map(
+                Member.from_api,
+                api_client.iter_items(self.ENDPOINT, params=params)
+            )
+            if local:
+                members = filter(local.matches, members)
+            yield from members
         except ApiClientError as e:
             logger.error(f"Erro ao buscar membros: {e}")
             raise
 
-    def get_member_by_id(self, member_id: int) -> Dict[str, Any]:
+    def get_member_by_id(self, member_id: int) -> Member:
         """
         Obtém um membro específico pelo ID.
 
@@ -92,7 +158,7 @@ class MembersService:
 
         Returns
         -------
-        Dict[str, Any]
+        Member
             Dados do membro
 
         Raises
@@ -102,12 +168,12 @@ class MembersService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{member_id}/"
-            return api_client.get(endpoint)
+            return Member.from_api(api_client.get(endpoint))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar membro {member_id}: {e}")
             raise
 
-    def create_member(self, member_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_member(self, member_data: Dict[str, Any]) -> Member:
         """
         Cria um novo membro.
 
@@ -120,7 +186,7 @@ class MembersService:
 
         Returns
         -------
-        Dict[str, Any]
+        Member
             Dados do membro criado
 
         Raises
@@ -144,7 +210,9 @@ class MembersService:
         >>> member = members_service.create_member(member_data)
         """
         try:
-            return api_client.post(self.ENDPOINT, member_data)
+            return Member.from_api(
+                api_client.post(self.ENDPOINT, member_data)
+            )
         except ApiClientError as e:
             logger.error(f"Erro ao criar membro: {e}")
             raise
@@ -152,7 +220,7 @@ class MembersService:
     def update_member(
             self,
             member_id: int,
-            member_data: Dict[str, Any]) -> Dict[str, Any]:
+            member_data: Dict[str, Any]) -> Member:
         """
         Atualiza um membro existente.
 
@@ -165,7 +233,7 @@ class MembersService:
 
         Returns
         -------
-        Dict[str, Any]
+        Member
             Dados do membro atualizado
 
         Raises
@@ -175,7 +243,7 @@ class MembersService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{member_id}/"
-            return api_client.put(endpoint, member_data)
+            return Member.from_api(api_client.put(endpoint, member_data))
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar membro {member_id}: {e}")
             raise
@@ -202,35 +270,35 @@ class MembersService:
             logger.error(f"Erro ao excluir membro {member_id}: {e}")
             raise
 
-    def get_users(self) -> List[Dict[str, Any]]:
+    def get_users(self) -> List[Member]:
         """
         Obtém todos os usuários do sistema.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Member]
             Lista de usuários
         """
         return self.get_all_members(is_user=True)
 
-    def get_creditors(self) -> List[Dict[str, Any]]:
+    def get_creditors(self) -> List[Member]:
         """
         Obtém todos os credores.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Member]
             Lista de credores
         """
         return self.get_all_members(is_creditor=True)
 
-    def get_benefited(self) -> List[Dict[str, Any]]:
+    def get_benefited(self) -> List[Member]:
         """
         Obtém todos os beneficiários.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Member]
             Lista de beneficiários
         """
         return self.get_all_members(is_benefited=True)
@@ -273,7 +341,7 @@ class MembersService:
             logger.error(f"Erro ao buscar beneficiários para seleção: {e}")
             return {}
 
-    def search_by_document(self, document: str) -> Optional[Dict[str, Any]]:
+    def search_by_document(self, document: str) -> Optional[Member]:
         """
         Busca um membro pelo documento.
 
@@ -284,7 +352,7 @@ class MembersService:
 
         Returns
         -------
-        Optional[Dict[str, Any]]
+        Optional[Member]
             Dados do membro encontrado ou None se não encontrado
         """
         try:
@@ -7,10 +7,17 @@ gerenciamento de receitas na expenselit-api.
 
 import logging
 from datetime import date, timedelta
-from typing import List, Dict, Any, Optional, Union
+from functools import partial
+from typing import Iterator, List, Dict, Any, Optional, Union
 
+from config.settings import db_categories
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
+from services.local_ledger import local_ledger
 from utils.date_utils import format_date_for_api
+from utils.records import Revenue
+from utils.text_index import TextIndex, order_by_ids
+from utils.transaction_batch import TransactionBatch
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +33,11 @@ class RevenuesService:
 
     ENDPOINT = "revenues/"
 
+    # Campos de texto considerados pela busca textual
+    SEARCH_FIELDS = (
+        'description', 'source', 'notes', 'account_name'
+    )
+
     def get_all_revenues(
         self,
         category: Optional[str] = None,
@@ -34,7 +46,7 @@ class RevenuesService:
         date_from: Optional[Union[str, date]] = None,
         date_to: Optional[Union[str, date]] = None,
         limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Revenue]:
         """
         Obtém todas as receitas com filtros opcionais.
 
@@ -55,45 +67,242 @@ class RevenuesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas
 
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        if local_ledger.is_enabled():
+            try:
+                records = local_ledger.select(
+                    self.ENDPOINT,
+                    equals={
+                        'category': category,
+                        'received': received,
+                        'account': account_id or None
+                    },
+                    date_from=format_date_for_api(date_from),
+                    date_to=format_date_for_api(date_to),
+                    limit=limit
+                )
+                return [Revenue.from_api(record) for record in records]
+            except ApiClientError as e:
+                logger.error(f"Erro ao buscar receitas: {e}")
+                raise
+
+        return list(self.iter_revenues(
+            category=category,
+            received=received,
+            account_id=account_id,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit
+        ))
+
+    async def get_all_revenues_async(
+        self,
+        **filters: Any
+    ) -> List[Revenue]:
+        """
+        Versão assíncrona de ``get_all_revenues``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_revenues``
+
+        Returns
+        -------
+        List[Revenue]
+            Lista de receitas
+        """
+        return await async_api_client.run_sync(
+            self.get_all_revenues, **filters
+        )
+
+    @staticmethod
+    def _get_params(
+        category: Optional[str],
+        received: Optional[bool],
+        account_id: Optional[int],
+        date_from: Optional[Union[str, date]],
+        date_to: Optional[Union[str, date]],
+        limit: Optional[int]
+    ) -> Dict[str, str]:
+        """
+        Monta os parâmetros de consulta da listagem de receitas.
+
+        Parameters
+        ----------
+        category, received, account_id, date_from, date_to, limit
+            Mesmos filtros de ``get_all_revenues``
+
+        Returns
+        -------
+        Dict[str, str]
+            Parâmetros da requisição
+        """
+        params: Dict[str, str] = {}
+
+        if category:
+            params['category'] = category
+        if received is not None:
+            params['received'] = str(received).lower()
+        if account_id:
+            params['account'] = str(account_id)
+        if date_from:
+            params['date_from'] = format_date_for_api(date_from)
+        if date_to:
+            params['date_to'] = format_date_for_api(date_to)
+        if limit:
+            params['limit'] = str(limit)
+        return params
+
+    def get_revenues_batch(
+        self,
+        category: Optional[str] = None,
+        received: Optional[bool] = None,
+        account_id: Optional[int] = None,
+        date_from: Optional[Union[str, date]] = None,
+        date_to: Optional[Union[str, date]] = None
+    ) -> TransactionBatch:
+        """
+        Obtém as receitas como lote colunar, para agregações.
+
+        Os registros não são convertidos um a um: com o espelho local
+        habilitado, o lote é montado a partir da tabela espelhada; sem
+        ele, a partir do JSON das páginas da API.
+
+        Parameters
+        ----------
+        category, received, account_id, date_from, date_to
+            Mesmos filtros de ``get_all_revenues``
+
+        Returns
+        -------
+        TransactionBatch
+            Lote com as receitas
+
         Raises
         ------
         ApiClientError
             Se houver erro na comunicação com a API
         """
         try:
-            params = {}
-
-            if category:
-                params['category'] = category
-            if received is not None:
-                params['received'] = str(received).lower()
-            if account_id:
-                params['account'] = str(account_id)
-            if date_from:
-                params['date_from'] = format_date_for_api(date_from)
-            if date_to:
-                params['date_to'] = format_date_for_api(date_to)
-            if limit:
-                params['limit'] = str(limit)
-
-            response = api_client.get(self.ENDPOINT, params=params)
-
-            # A API pode retornar uma lista direta ou um objeto com 'results'
-            if isinstance(response, dict) and 'results' in response:
-                return response['results']
-            elif isinstance(response, list):
-                return response
+            if local_ledger.is_enabled():
+                records = local_ledger.select_frame(
+                    self.ENDPOINT,
+                    equals={
+                        'category': category,
+                        'received': received,
+                        'account': account_id or None
+                    },
+                    date_from=format_date_for_api(date_from),
+                    date_to=format_date_for_api(date_to)
+                )
             else:
-                return []
+                records = list(api_client.iter_items(
+                    self.ENDPOINT,
+                    params=self._get_params(
+                        category, received, account_id, date_from, date_to,
+                        None
+                    )
+                ))
+            return TransactionBatch.from_records(
+                records, 'received', db_categories.REVENUE_CATEGORIES
+            )
+        except ApiClientError as e:
+            logger.error(f"Erro ao buscar receitas: {e}")
+            raise
 
+    def iter_revenues(
+        self,
+        category: Optional[str] = None,
+        received: Optional[bool] = None,
+        account_id: Optional[int] = None,
+        date_from: Optional[Union[str, date]] = None,
+        date_to: Optional[Union[str, date]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Revenue]:
+        """
+        Percorre as receitas sob demanda, seguindo a paginação da API.
+
+        A próxima página é buscada em segundo plano enquanto a atual
+        é consumida, sem manter todos os registros em memória.
+
+        Parameters
+        ----------
+        category, received, account_id, date_from, date_to, limit
+            Mesmos filtros de ``get_all_revenues``
+
+        Yields
+        ------
+        Revenue
+            Receitas de todas as páginas
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        params = self._get_params(
+            category, received, account_id, date_from, date_to, limit
+        )
+        try:
+            yield from map(Revenue.from_api, api_client.iter_items(
+                self.ENDPOINT, params=params, max_items=limit
+            ))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar receitas: {e}")
             raise
 
-    def get_revenue_by_id(self, revenue_id: int) -> Dict[str, Any]:
+    def search_revenues(
+        self,
+        query: str,
+        revenues: List[Revenue]
+    ) -> List[Revenue]:
+        """
+        Busca receitas pelo texto de ``SEARCH_FIELDS``.
+
+        Com o espelho local, a busca usa o índice textual do usuário,
+        construído uma única vez e atualizado a cada alteração; sem ele,
+        o índice é montado sobre as receitas informadas. Nenhum dos casos
+        consulta a API.
+
+        Parameters
+        ----------
+        query : str
+            Texto buscado
+        revenues : List[Revenue]
+            Receitas carregadas (já filtradas pela listagem)
+
+        Returns
+        -------
+        List[Revenue]
+            Receitas encontradas, da mais relevante para a menos
+        """
+        if local_ledger.is_enabled():
+            try:
+                ranked = local_ledger.query_view(
+                    self.ENDPOINT,
+                    'text_index',
+                    partial(TextIndex, fields=self.SEARCH_FIELDS),
+                    lambda index: index.search(query)
+                )
+            except ApiClientError as e:
+                logger.error(f"Erro ao buscar receitas: {e}")
+                raise
+        else:
+            ranked = TextIndex(revenues, self.SEARCH_FIELDS).search(query)
+        return order_by_ids(revenues, ranked)
+
+    def get_revenue_by_id(self, revenue_id: int) -> Revenue:
         """
         Obtém uma receita específica pelo ID.
 
@@ -104,7 +313,7 @@ class RevenuesService:
 
         Returns
         -------
-        Dict[str, Any]
+        Revenue
             Dados da receita
 
         Raises
@@ -114,12 +323,12 @@ class RevenuesService:
         """
         try:
             endpoint = f"{self.ENDPOINT}{revenue_id}/"
-            return api_client.get(endpoint)
+            return Revenue.from_api(api_client.get(endpoint))
         except ApiClientError as e:
             logger.error(f"Erro ao buscar receita {revenue_id}: {e}")
             raise
 
-    def create_revenue(self, revenue_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_revenue(self, revenue_data: Dict[str, Any]) -> Revenue:
         """
         Cria uma nova receita.
 
@@ -133,7 +342,7 @@ class RevenuesService:
 
         Returns
         -------
-        Dict[str, Any]
+        Revenue
             Dados da receita criada
 
         Raises
@@ -157,7 +366,9 @@ class RevenuesService:
         try:
             # Processa dados antes do envio
             processed_data = self._process_revenue_data(revenue_data)
-            return api_client.post(self.ENDPOINT, processed_data)
+            revenue = api_client.post(self.ENDPOINT, processed_data)
+            local_ledger.upsert(self.ENDPOINT, revenue)
+            return Revenue.from_api(revenue)
         except ApiClientError as e:
             logger.error(f"Erro ao criar receita: {e}")
             raise
@@ -165,7 +376,7 @@ class RevenuesService:
     def update_revenue(
             self,
             revenue_id: int,
-            revenue_data: Dict[str, Any]) -> Dict[str, Any]:
+            revenue_data: Dict[str, Any]) -> Revenue:
         """
         Atualiza uma receita existente.
 
@@ -178,7 +389,7 @@ class RevenuesService:
 
         Returns
         -------
-        Dict[str, Any]
+        Revenue
             Dados da receita atualizada
 
         Raises
@@ -189,7 +400,9 @@ class RevenuesService:
         try:
             processed_data = self._process_revenue_data(revenue_data)
             endpoint = f"{self.ENDPOINT}{revenue_id}/"
-            return api_client.put(endpoint, processed_data)
+            revenue = api_client.put(endpoint, processed_data)
+            local_ledger.upsert(self.ENDPOINT, revenue)
+            return Revenue.from_api(revenue)
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar receita {revenue_id}: {e}")
             raise
@@ -211,12 +424,13 @@ class RevenuesService:
         try:
             endpoint = f"{self.ENDPOINT}{revenue_id}/"
             api_client.delete(endpoint)
+            local_ledger.remove(self.ENDPOINT, revenue_id)
             logger.info(f"Receita {revenue_id} excluída com sucesso")
         except ApiClientError as e:
             logger.error(f"Erro ao excluir receita {revenue_id}: {e}")
             raise
 
-    def get_revenues_by_category(self, category: str) -> List[Dict[str, Any]]:
+    def get_revenues_by_category(self, category: str) -> List[Revenue]:
         """
         Obtém receitas filtradas por categoria.
 
@@ -227,18 +441,18 @@ class RevenuesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas da categoria
         """
         return self.get_all_revenues(category=category)
 
-    def get_pending_revenues(self) -> List[Dict[str, Any]]:
+    def get_pending_revenues(self) -> List[Revenue]:
         """
         Obtém todas as receitas não recebidas.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas não recebidas
         """
         return self.get_all_revenues(received=False)
@@ -247,7 +461,7 @@ class RevenuesService:
         self,
         start_date: Union[str, date],
         end_date: Union[str, date]
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Revenue]:
         """
         Obtém receitas em um período específico.
 
@@ -260,7 +474,7 @@ class RevenuesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas no período
         """
         return self.get_all_revenues(date_from=start_date, date_to=end_date)
@@ -268,7 +482,7 @@ class RevenuesService:
     def get_monthly_revenues(
             self,
             year: int,
-            month: int) -> List[Dict[str, Any]]:
+            month: int) -> List[Revenue]:
         """
         Obtém receitas de um mês específico.
 
@@ -281,7 +495,7 @@ class RevenuesService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas do mês
         """
         start_date = date(year, month, 1)
@@ -330,24 +544,24 @@ class RevenuesService:
 
         return total
 
-    def get_salary_revenues(self) -> List[Dict[str, Any]]:
+    def get_salary_revenues(self) -> List[Revenue]:
         """
         Obtém receitas de salário.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas de salário
         """
         return self.get_revenues_by_category("salary")
 
-    def get_cashback_revenues(self) -> List[Dict[str, Any]]:
+    def get_cashback_revenues(self) -> List[Revenue]:
         """
         Obtém receitas de cashback.
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Revenue]
             Lista de receitas de cashback
         """
         return self.get_revenues_by_category("cashback")
@@ -0,0 +1,186 @@
+"""
+Renovação proativa de tokens JWT em segundo plano.
+
+Este módulo implementa um agendador que, para cada sessão do Streamlit,
+renova o token de acesso pouco antes do vencimento, retirando a
+latência da renovação das requisições feitas pelo usuário.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import (
+    add_script_run_ctx,
+    get_script_run_ctx
+)
+
+from config.settings import auth_config
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefreshScheduler:
+    """
+    Agenda renovações de token em uma thread de fundo por sessão.
+
+    Cada thread herda o contexto do Streamlit da sessão que a iniciou,
+    para ler e atualizar os tokens em ``st.session_state``. A thread é
+    encerrada no logout, quando a sessão do navegador termina ou quando
+    a renovação deixa de ser possível (refresh token vencido).
+    """
+
+    def __init__(self):
+        """Inicializa o registro de agendamentos por sessão."""
+        self._lock = threading.Lock()
+        self._stop_events: Dict[str, threading.Event] = {}
+
+    @staticmethod
+    def _get_session_id() -> Optional[str]:
+        """
+        Obtém o identificador da sessão atual do Streamlit.
+
+        Returns
+        -------
+        Optional[str]
+            ID da sessão ou None fora de uma execução do Streamlit
+        """
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else None
+
+    @staticmethod
+    def _is_session_active(session_id: str) -> bool:
+        """
+        Verifica se a sessão do navegador ainda está ativa.
+
+        Parameters
+        ----------
+        session_id : str
+            ID da sessão do Streamlit
+
+        Returns
+        -------
+        bool
+            True se a sessão continua conectada
+        """
+        return Runtime.exists() and (
+            Runtime.instance().is_active_session(session_id)
+        )
+
+    def ensure_running(self, refresh: Callable[[], bool]) -> None:
+        """
+        Inicia o agendamento da sessão atual, se ainda não existir.
+
+        Parameters
+        ----------
+        refresh : Callable[[], bool]
+            Função que renova o token de acesso da sessão
+        """
+        session_id = self._get_session_id()
+        if session_id is None:
+            return
+
+        with self._lock:
+            if session_id in self._stop_events:
+                return
+            stop_event = threading.Event()
+            self._stop_events[session_id] = stop_event
+
+        thread = threading.Thread(
+            target=self._run,
+            args=(session_id, stop_event, refresh),
+            name=f"expenselit-token-refresh-{session_id[:8]}",
+            daemon=True
+        )
+        add_script_run_ctx(thread, get_script_run_ctx())
+        thread.start()
+        logger.debug(f"Renovação proativa iniciada para a sessão {session_id}")
+
+    def stop(self) -> None:
+        """Encerra o agendamento da sessão atual."""
+        session_id = self._get_session_id()
+        if session_id is None:
+            return
+
+        with self._lock:
+            stop_event = self._stop_events.pop(session_id, None)
+        if stop_event is not None:
+            stop_event.set()
+
+    def _get_seconds_until_refresh(self) -> Optional[float]:
+        """
+        Calcula quanto tempo aguardar até a próxima renovação.
+
+        Returns
+        -------
+        Optional[float]
+            Segundos até a renovação ou None se não houver token
+        """
+        token_expires_at: Any = st.session_state.get('token_expires_at')
+        if not st.session_state.get('is_authenticated') or not (
+            token_expires_at
+        ):
+            return None
+
+        refresh_at = token_expires_at - timedelta(
+            seconds=auth_config.PROACTIVE_REFRESH_LEAD_SECONDS
+        )
+        return max((refresh_at - datetime.now()).total_seconds(), 0.0)
+
+    def _run(
+        self,
+        session_id: str,
+        stop_event: threading.Event,
+        refresh: Callable[[], bool]
+    ) -> None:
+        """
+        Laço da thread de renovação de uma sessão.
+
+        Parameters
+        ----------
+        session_id : str
+            ID da sessão do Streamlit
+        stop_event : threading.Event
+            Evento sinalizado no logout
+        refresh : Callable[[], bool]
+            Função que renova o token de acesso da sessão
+        """
+        refresh_deadline = datetime.now() + timedelta(
+            minutes=auth_config.REFRESH_TOKEN_LIFETIME
+        )
+        try:
+            while not stop_event.is_set():
+                wait_seconds = self._get_seconds_until_refresh()
+                if wait_seconds is None or datetime.now() >= refresh_deadline:
+                    break
+
+                # Acorda periodicamente para detectar o fim da sessão
+                if stop_event.wait(min(
+                    wait_seconds, auth_config.PROACTIVE_REFRESH_POLL_SECONDS
+                )):
+                    break
+                if not self._is_session_active(session_id):
+                    break
+                if self._get_seconds_until_refresh() != 0.0:
+                    continue
+
+                try:
+                    refresh()
+                except Exception as e:
+                    logger.warning(f"Renovação proativa falhou: {e}")
+                    break
+        finally:
+            with self._lock:
+                if self._stop_events.get(session_id) is stop_event:
+                    del self._stop_events[session_id]
+            logger.debug(
+                f"Renovação proativa encerrada para a sessão {session_id}"
+            )
+
+
+# Instância global do agendador de renovação de tokens
+token_refresh_scheduler = TokenRefreshScheduler()
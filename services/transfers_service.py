@@ -7,10 +7,15 @@ gerenciamento de transferências na expenselit-api.
 
 import logging
 from datetime import date
-from typing import List, Dict, Any, Optional, Union
+from functools import partial
+from typing import Iterator, List, Dict, Any, Optional, Union
 
 from services.api_client import api_client, ApiClientError
+from services.async_api_client import async_api_client
+from services.local_ledger import local_ledger
 from utils.date_utils import format_date_for_api
+from utils.records import Transfer
+from utils.text_index import TextIndex, order_by_ids
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +30,11 @@ class TransfersService:
 
     ENDPOINT = "transfers/"
 
+    # Campos de texto considerados pela busca textual
+    SEARCH_FIELDS = (
+        'description', 'notes', 'origin_account_name', 'destiny_account_name'
+    )
+
     def get_all_transfers(
         self,
         category: Optional[str] = None,
@@ -34,7 +44,7 @@ class TransfersService:
         date_from: Optional[Union[str, date]] = None,
         date_to: Optional[Union[str, date]] = None,
         limit: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Transfer]:
         """
         Obtém todas as transferências com filtros opcionais.
 
@@ -57,7 +67,7 @@ class TransfersService:
 
         Returns
         -------
-        List[Dict[str, Any]]
+        List[Transfer]
             Lista de transferências
 
         Raises
@@ -66,47 +76,164 @@ class TransfersService:
             Se houver erro na comunicação com a API
         """
         try:
-            params = {}
-
-            if category:
-                params['category'] = category
-            if transfered is not None:
-                params['transfered'] = str(transfered).lower()
-            if origin_account_id:
-                params['origin_account'] = str(origin_account_id)
-            if destiny_account_id:
-                params['destiny_account'] = str(destiny_account_id)
-            if date_from:
-                params['date_from'] = format_date_for_api(date_from)
-            if date_to:
-                params['date_to'] = format_date_for_api(date_to)
-            if limit:
-                params['limit'] = str(limit)
-
-            logger.info(f"Buscando transferências com parâmetros: {params}")
-            response = api_client.get(self.ENDPOINT, params=params)
-
-            # Garantir que o retorno seja uma lista
-            if isinstance(response, dict):
-                # Se a resposta é um dict, pode conter 'results' ou ser um único item
-                if 'results' in response:
-                    result = response['results']
-                else:
-                    result = [response]
+            if local_ledger.is_enabled():
+                records = local_ledger.select(
+                    self.ENDPOINT,
+                    equals={
+                        'category': category,
+                        'transfered': transfered,
+                        'origin_account': origin_account_id or None,
+                        'destiny_account': destiny_account_id or None
+                    },
+                    date_from=format_date_for_api(date_from),
+                    date_to=format_date_for_api(date_to),
+                    limit=limit
+                )
+                result = [Transfer.from_api(record) for record in records]
             else:
-                result = response if isinstance(response, list) else []
+                result = list(self.iter_transfers(
+                    category=category,
+                    transfered=transfered,
+                    origin_account_id=origin_account_id,
+                    destiny_account_id=destiny_account_id,
+                    date_from=date_from,
+                    date_to=date_to,
+                    limit=limit
+                ))
 
             logger.info(f"Encontradas {len(result)} transferências")
             return result
 
-        except ApiClientError as e:
-            logger.error(f"Erro ao buscar transferências: {e}")
+        except ApiClientError:
             raise
         except Exception as e:
             logger.error(f"Erro inesperado ao buscar transferências: {e}")
             raise ApiClientError(f"Erro inesperado: {str(e)}")
 
-    def get_transfer_by_id(self, transfer_id: int) -> Dict[str, Any]:
+    async def get_all_transfers_async(
+        self,
+        **filters: Any
+    ) -> List[Transfer]:
+        """
+        Versão assíncrona de ``get_all_transfers``.
+
+        Permite aguardar várias listagens simultaneamente com
+        ``async_api_client.gather``.
+
+        Parameters
+        ----------
+        **filters : Any
+            Mesmos filtros de ``get_all_transfers``
+
+        Returns
+        -------
+        List[Transfer]
+            Lista de transferências
+        """
+        return await async_api_client.run_sync(
+            self.get_all_transfers, **filters
+        )
+
+    def iter_transfers(
+        self,
+        category: Optional[str] = None,
+        transfered: Optional[bool] = None,
+        origin_account_id: Optional[int] = None,
+        destiny_account_id: Optional[int] = None,
+        date_from: Optional[Union[str, date]] = None,
+        date_to: Optional[Union[str, date]] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Transfer]:
+        """
+        Percorre as transferências sob demanda, seguindo a paginação da API.
+
+        A próxima página é buscada em segundo plano enquanto a atual
+        é consumida, sem manter todos os registros em memória.
+
+        Parameters
+        ----------
+        category, transfered, origin_account_id, destiny_account_id
+            Mesmos filtros de ``get_all_transfers``
+        date_from, date_to, limit
+            Mesmos filtros de ``get_all_transfers``
+
+        Yields
+        ------
+        Transfer
+            Transferências de todas as páginas
+
+        Raises
+        ------
+        ApiClientError
+            Se houver erro na comunicação com a API
+        """
+        params: Dict[str, str] = {}
+
+        if category:
+            params['category'] = category
+        if transfered is not None:
+            params['transfered'] = str(transfered).lower()
+        if origin_account_id:
+            params['origin_account'] = str(origin_account_id)
+        if destiny_account_id:
+            params['destiny_account'] = str(destiny_account_id)
+        if date_from:
+            params['date_from'] = format_date_for_api(date_from)
+        if date_to:
+            params['date_to'] = format_date_for_api(date_to)
+        if limit:
+            params['limit'] = str(limit)
+
+        logger.info(f"Buscando transferências com parâmetros: {params}")
+        try:
+            yield from map(Transfer.from_api, api_client.iter_items(
+                self.ENDPOINT, params=params, max_items=limit
+            ))
+        except ApiClientError as e:
+            logger.error(f"Erro ao buscar transferências: {e}")
+            raise
+
+    def search_transfers(
+        self,
+        query: str,
+        transfers: List[Transfer]
+    ) -> List[Transfer]:
+        """
+        Busca transferências pelo texto de ``SEARCH_FIELDS``.
+
+        Com o espelho local, a busca usa o índice textual do usuário,
+        construído uma única vez e atualizado a cada alteração; sem ele,
+        o índice é montado sobre as transferências informadas. Nenhum dos casos
+        consulta a API.
+
+        Parameters
+        ----------
+        query : str
+            Texto buscado
+        transfers : List[Transfer]
+            Transferências carregadas (já filtradas pela listagem)
+
+        Returns
+        -------
+        List[Transfer]
+            Transferências encontradas, da mais relevante para a menos
+        """
+        if local_ledger.is_enabled():
+            try:
+                ranked = local_ledger.query_view(
+                    self.ENDPOINT,
+                    'text_index',
+                    partial(TextIndex, fields=self.SEARCH_FIELDS),
+                    lambda index: index.search(query)
+                )
+            except ApiClientError as e:
+                logger.error(f"Erro ao buscar transferências: {e}")
+                raise
+        else:
+            ranked = TextIndex(transfers, self.SEARCH_FIELDS).search(query)
+        return order_by_ids(transfers, ranked)
+
+    def get_transfer_by_id(self, transfer_id: int) -> Transfer:
         """
         Obtém uma transferência específica pelo ID.
 
@@ -117,7 +244,7 @@ class TransfersService:
 
         Returns
         -------
-        Dict[str, Any]
+        Transfer
             Dados da transferência
 
         Raises
@@ -129,7 +256,7 @@ class TransfersService:
             logger.info(f"Buscando transferência com ID: {transfer_id}")
             response = api_client.get(f"{self.ENDPOINT}{transfer_id}/")
             logger.info(f"Transferência encontrada: {response.get('id')}")
-            return response
+            return Transfer.from_api(response)
 
         except ApiClientError as e:
             logger.error(f"Erro ao buscar transferência {transfer_id}: {e}")
@@ -138,7 +265,7 @@ class TransfersService:
             logger.error(f"Erro inesperado ao buscar transferência: {e}")
             raise ApiClientError(f"Erro inesperado: {str(e)}")
 
-    def create_transfer(self, transfer_data: Dict[str, Any]) -> Dict[str, Any]:
+    def create_transfer(self, transfer_data: Dict[str, Any]) -> Transfer:
         """
         Cria uma nova transferência.
 
@@ -149,7 +276,7 @@ class TransfersService:
 
         Returns
         -------
-        Dict[str, Any]
+        Transfer
             Dados da transferência criada
 
         Raises
@@ -163,8 +290,9 @@ class TransfersService:
                 f"{transfer_data.get('description')}"
             )
             response = api_client.post(self.ENDPOINT, data=transfer_data)
+            local_ledger.upsert(self.ENDPOINT, response)
             logger.info(f"Transferência criada com ID: {response.get('id')}")
-            return response
+            return Transfer.from_api(response)
 
         except ApiClientError as e:
             logger.error(f"Erro ao criar transferência: {e}")
@@ -177,7 +305,7 @@ class TransfersService:
         self,
         transfer_id: int,
         transfer_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Transfer:
         """
         Atualiza uma transferência existente.
 
@@ -190,7 +318,7 @@ class TransfersService:
 
         Returns
         -------
-        Dict[str, Any]
+        Transfer
             Dados da transferência atualizada
 
         Raises
@@ -204,8 +332,9 @@ class TransfersService:
                 f"{self.ENDPOINT}{transfer_id}/",
                 data=transfer_data
             )
+            local_ledger.upsert(self.ENDPOINT, response)
             logger.info(f"Transferência {transfer_id} atualizada com sucesso")
-            return response
+            return Transfer.from_api(response)
 
         except ApiClientError as e:
             logger.error(f"Erro ao atualizar transferência {transfer_id}: {e}")
@@ -236,6 +365,7 @@ class TransfersService:
         try:
             logger.info(f"Excluindo transferência ID: {transfer_id}")
             api_client.delete(f"{self.ENDPOINT}{transfer_id}/")
+            local_ledger.remove(self.ENDPOINT, transfer_id)
             logger.info(f"Transferência {transfer_id} excluída com sucesso")
             return True
 
@@ -0,0 +1,515 @@
+"""
+Agregações vetorizadas das movimentações financeiras.
+
+Este módulo converte cada conjunto de registros da API uma única vez em
+um DataFrame tipado (valores em centavos inteiros, datas convertidas e
+categorias como códigos) e calcula, com operações vetorizadas do
+pandas, os totais e séries usados pelo dashboard.
+"""
+
+import heapq
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union
+)
+
+import numpy as np
+import pandas as pd
+
+from utils.date_utils import API_FORMAT
+
+
+# Colunas dos DataFrames de movimentações
+TRANSACTION_COLUMNS = [
+    'id', 'date', 'horary', 'description', 'category', 'account'
+]
+LOAN_COLUMNS = ['id', 'date', 'loan_type', 'account', 'payed']
+TRANSFER_COLUMNS = ['id', 'date', 'origin_account', 'destiny_account']
+
+
+def iter_transactions(
+    sources: Dict[str, Iterable[Dict[str, Any]]]
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Percorre em sequência as movimentações de vários tipos.
+
+    Parameters
+    ----------
+    sources : Dict[str, Iterable[Dict[str, Any]]]
+        Registros da API indexados pelo tipo da movimentação
+
+    Yields
+    ------
+    Tuple[str, Dict[str, Any]]
+        Tipo da movimentação e registro
+    """
+    for kind, records in sources.items():
+        for record in records:
+            yield kind, record
+
+
+def _get_timestamp_key(item: Tuple[str, Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Obtém a chave cronológica de uma movimentação.
+
+    As datas (YYYY-MM-DD) e horários (HH:MM:SS), como texto da API ou
+    já convertidos nos registros tipados, ordenam corretamente como
+    texto.
+
+    Parameters
+    ----------
+    item : Tuple[str, Dict[str, Any]]
+        Tipo da movimentação e registro
+
+    Returns
+    -------
+    Tuple[str, str]
+        Data e horário do registro
+    """
+    record = item[1]
+    return str(record.get('date') or ''), str(record.get('horary') or '')
+
+
+def top_recent_transactions(
+    sources: Dict[str, Iterable[Dict[str, Any]]],
+    k: int
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Seleciona as K movimentações mais recentes de vários tipos.
+
+    Usa um heap de tamanho K sobre a data e o horário brutos, sem
+    ordenar nem formatar todos os registros.
+
+    Parameters
+    ----------
+    sources : Dict[str, Iterable[Dict[str, Any]]]
+        Registros da API indexados pelo tipo da movimentação
+    k : int
+        Número de movimentações
+
+    Returns
+    -------
+    List[Tuple[str, Dict[str, Any]]]
+        Tipo e registro das movimentações, da mais recente para a
+        mais antiga
+
+    Examples
+    --------
+    >>> top_recent_transactions(
+    ...     {'expense': expenses, 'revenue': revenues}, k=10
+    ... )
+    """
+    return heapq.nlargest(
+        k, iter_transactions(sources), key=_get_timestamp_key
+    )
+
+
+def to_cents(values: pd.Series) -> np.ndarray:
+    """
+    Converte valores monetários da API em centavos inteiros.
+
+    Os valores decimais da API (ex.: ``"234.50"``) têm duas casas, que
+    o arredondamento para o centavo mais próximo recupera exatamente;
+    as somas em ``int64`` não acumulam erro de ponto flutuante.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Valores como string, número ou None
+
+    Returns
+    -------
+    np.ndarray
+        Valores em centavos (``int64``), com 0 para valores inválidos
+    """
+    try:
+        # Conversão direta do NumPy, bem mais rápida que a do pandas
+        numeric = values.to_numpy().astype(float)
+    except (TypeError, ValueError):
+        numeric = pd.to_numeric(values, errors='coerce').to_numpy(
+            dtype=float
+        )
+    return np.rint(np.nan_to_num(numeric) * 100).astype(np.int64)
+
+
+def cents_to_decimal(cents: Any) -> Decimal:
+    """
+    Converte centavos inteiros em valor decimal em reais.
+
+    Parameters
+    ----------
+    cents : int or np.integer
+        Valor em centavos
+
+    Returns
+    -------
+    Decimal
+        Valor em reais com duas casas decimais
+    """
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """
+    Converte datas da API (YYYY-MM-DD) em ``datetime64``.
+
+    Parameters
+    ----------
+    values : pd.Series
+        Datas como string
+
+    Returns
+    -------
+    pd.Series
+        Datas convertidas, com NaT para datas inválidas
+    """
+    return pd.to_datetime(values, format=API_FORMAT, errors='coerce')
+
+
+def select_columns(
+    records: Union[List[Dict[str, Any]], pd.DataFrame],
+    columns: List[str]
+) -> pd.DataFrame:
+    """
+    Obtém as colunas brutas de registros da API.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]] or pd.DataFrame
+        Registros da API, registros tipados (``utils.records``) ou
+        tabela do espelho local
+    columns : List[str]
+        Colunas desejadas; as ausentes ficam vazias
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas solicitadas
+    """
+    if isinstance(records, pd.DataFrame):
+        return records.reindex(columns=columns)
+    if records and not isinstance(records[0], dict):
+        # Registros tipados são lidos campo a campo, como mapeamentos
+        return pd.DataFrame(
+            {
+                column: [record.get(column) for record in records]
+                for column in columns
+            },
+            columns=columns,
+            dtype=object
+        )
+    return pd.DataFrame.from_records(records, columns=columns)
+
+
+def build_transactions_frame(
+    records: Union[List[Dict[str, Any]], pd.DataFrame],
+    status_field: str
+) -> pd.DataFrame:
+    """
+    Converte despesas ou receitas em um DataFrame tipado.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]] or pd.DataFrame
+        Registros da API ou tabela do espelho local
+    status_field : str
+        Campo booleano de efetivação (``payed`` ou ``received``)
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas ``id``, ``date`` (datetime64), ``horary``,
+        ``description``, ``category`` (category), ``account`` (Int64),
+        ``value`` (centavos em int64) e ``settled`` (bool)
+
+    Examples
+    --------
+    >>> frame = build_transactions_frame(expenses, 'payed')
+    >>> cents_to_decimal(frame.loc[frame['settled'], 'value'].sum())
+    Decimal('1234.50')
+    """
+    raw = select_columns(
+        records, TRANSACTION_COLUMNS + ['value', status_field]
+    )
+    frame = raw[TRANSACTION_COLUMNS].copy()
+    frame['date'] = parse_dates(raw['date'])
+    frame['category'] = raw['category'].fillna('others').astype('category')
+    frame['account'] = pd.to_numeric(
+        raw['account'], errors='coerce'
+    ).astype('Int64')
+    frame['value'] = to_cents(raw['value'])
+    frame['settled'] = raw[status_field].eq(True)
+    return frame
+
+
+def build_loans_frame(
+    records: Union[List[Dict[str, Any]], pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Converte empréstimos em um DataFrame tipado.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]] or pd.DataFrame
+        Registros da API ou tabela do espelho local
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas ``id``, ``date`` (datetime64), ``loan_type`` (category),
+        ``account`` (Int64), ``payed`` (bool), ``value`` e
+        ``payed_value`` (centavos em int64)
+    """
+    raw = select_columns(records, LOAN_COLUMNS + ['value', 'payed_value'])
+    frame = raw[['id']].copy()
+    frame['date'] = parse_dates(raw['date'])
+    frame['loan_type'] = raw['loan_type'].astype('category')
+    frame['account'] = pd.to_numeric(
+        raw['account'], errors='coerce'
+    ).astype('Int64')
+    frame['payed'] = raw['payed'].eq(True)
+    frame['value'] = to_cents(raw['value'])
+    frame['payed_value'] = to_cents(raw['payed_value'])
+    return frame
+
+
+def build_transfers_frame(
+    records: Union[List[Dict[str, Any]], pd.DataFrame]
+) -> pd.DataFrame:
+    """
+    Converte transferências em um DataFrame tipado.
+
+    Parameters
+    ----------
+    records : List[Dict[str, Any]] or pd.DataFrame
+        Registros da API ou tabela do espelho local
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas ``id``, ``date`` (datetime64), ``origin_account`` e
+        ``destiny_account`` (Int64), ``value`` (centavos em int64) e
+        ``settled`` (bool)
+    """
+    raw = select_columns(records, TRANSFER_COLUMNS + ['value', 'transfered'])
+    frame = raw[['id']].copy()
+    frame['date'] = parse_dates(raw['date'])
+    for column in ('origin_account', 'destiny_account'):
+        frame[column] = pd.to_numeric(
+            raw[column], errors='coerce'
+        ).astype('Int64')
+    frame['value'] = to_cents(raw['value'])
+    frame['settled'] = raw['transfered'].eq(True)
+    return frame
+
+
+def outstanding_loans_total(loans: pd.DataFrame, loan_type: str) -> Decimal:
+    """
+    Soma o saldo em aberto dos empréstimos não quitados de um tipo.
+
+    Parameters
+    ----------
+    loans : pd.DataFrame
+        DataFrame de ``build_loans_frame``
+    loan_type : str
+        Tipo do empréstimo (``given`` ou ``received``)
+
+    Returns
+    -------
+    Decimal
+        Valor pendente em reais
+    """
+    pending = loans[(loans['loan_type'] == loan_type) & ~loans['payed']]
+    return cents_to_decimal(
+        (pending['value'] - pending['payed_value']).sum()
+    )
+
+
+def label_totals(
+    totals: pd.Series,
+    labels: Optional[Dict[str, str]] = None
+) -> pd.DataFrame:
+    """
+    Prepara somas por categoria para os gráficos.
+
+    Parameters
+    ----------
+    totals : pd.Series
+        Somas em centavos indexadas pelo código da categoria
+        (``RollupCube.sums_by``)
+    labels : Dict[str, str], optional
+        Nomes de exibição por código de categoria
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas ``Categoria`` e ``Valor`` (em reais)
+    """
+    if labels:
+        # Códigos distintos com o mesmo nome de exibição são somados
+        names = [labels.get(code, code) for code in totals.index]
+        totals = totals.groupby(names).sum()
+    return pd.DataFrame({
+        'Categoria': totals.index.astype(str),
+        'Valor': totals.to_numpy() / 100
+    })
+
+
+def daily_net_flow(
+    expenses_daily: pd.Series,
+    revenues_daily: pd.Series,
+    loans: pd.DataFrame
+) -> pd.Series:
+    """
+    Calcula o fluxo líquido diário das movimentações efetivadas.
+
+    Considera despesas pagas (saída), receitas recebidas (entrada),
+    empréstimos dados (saída) e empréstimos recebidos (entrada).
+
+    Parameters
+    ----------
+    expenses_daily : pd.Series
+        Despesas pagas por dia, em centavos (``RollupCube.daily``)
+    revenues_daily : pd.Series
+        Receitas recebidas por dia, em centavos (``RollupCube.daily``)
+    loans : pd.DataFrame
+        DataFrame de empréstimos (``build_loans_frame``)
+
+    Returns
+    -------
+    pd.Series
+        Fluxo em centavos (int64) indexado pela data, em ordem
+        cronológica
+    """
+    loan_sign = loans['loan_type'].map(
+        {'given': -1, 'received': 1}
+    ).astype(float).fillna(0).to_numpy(dtype=np.int64)
+    loans_daily = pd.Series(
+        (loans['value'].to_numpy() * loan_sign)[loan_sign != 0],
+        index=pd.DatetimeIndex(
+            loans['date'].to_numpy()[loan_sign != 0], name='date'
+        ),
+        dtype=np.int64
+    )
+
+    flow = pd.concat([-expenses_daily, revenues_daily, loans_daily])
+    flow = flow[flow.index.notna()].astype(np.int64)
+    return flow.groupby(level=0).sum().sort_index()
+
+
+def cumulative_balance(flow: pd.Series) -> pd.DataFrame:
+    """
+    Calcula o saldo acumulado a partir do fluxo líquido diário.
+
+    Parameters
+    ----------
+    flow : pd.Series
+        Fluxo diário em centavos (``daily_net_flow``)
+
+    Returns
+    -------
+    pd.DataFrame
+        Colunas ``date``, ``net_flow`` e ``cumulative_balance``
+        (valores em reais, para gráficos)
+    """
+    return pd.DataFrame({
+        'date': flow.index,
+        'net_flow': flow.to_numpy() / 100,
+        'cumulative_balance': flow.cumsum().to_numpy() / 100
+    })
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Seleciona pontos de uma série pelo Largest-Triangle-Three-Buckets.
+
+    Mantém o primeiro e o último ponto e, em cada intervalo
+    intermediário, o ponto que forma o maior triângulo com o ponto
+    escolhido no intervalo anterior e a média do intervalo seguinte,
+    preservando picos e vales da série.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Eixo horizontal, em ordem crescente (números ou datetime64)
+    y : np.ndarray
+        Valores da série
+    max_points : int
+        Número máximo de pontos (mínimo 3)
+
+    Returns
+    -------
+    np.ndarray
+        Índices dos pontos selecionados, em ordem crescente
+    """
+    size = len(y)
+    if max_points >= size or max_points < 3:
+        return np.arange(size)
+
+    x = np.asarray(x)
+    x = (x.astype(np.int64) if x.dtype.kind == 'M' else x).astype(float)
+    y = np.asarray(y, dtype=float)
+
+    # Intervalos intermediários; o primeiro e o último ponto são fixos
+    edges = np.linspace(1, size - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = size - 1
+
+    previous = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start = end
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else size
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(area.argmax())
+        selected[bucket + 1] = previous
+
+    return selected
+
+
+def downsample_series(
+    data: pd.DataFrame,
+    x: str,
+    y: str,
+    max_points: int
+) -> pd.DataFrame:
+    """
+    Reduz uma série ao número máximo de pontos enviados a um gráfico.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Série ordenada pela coluna ``x``
+    x : str
+        Coluna do eixo horizontal
+    y : str
+        Coluna dos valores
+    max_points : int
+        Número máximo de pontos
+
+    Returns
+    -------
+    pd.DataFrame
+        A própria série, se couber no limite, ou os pontos escolhidos
+        pelo LTTB
+    """
+    if len(data) <= max_points:
+        return data
+    indices = lttb_indices(
+        data[x].to_numpy(), data[y].to_numpy(), max_points
+    )
+    return data.iloc[indices].reset_index(drop=True)
@@ -0,0 +1,420 @@
+"""
+Razão de saldos das contas financeiras.
+
+Este módulo calcula o saldo de cada conta a partir das movimentações
+que a afetam: despesas pagas, receitas recebidas, transferências
+efetivadas e empréstimos. Cada conta mantém sua sequência de
+lançamentos ordenada por data com as somas acumuladas, de modo que o
+saldo em qualquer data é obtido por busca binária.
+"""
+
+import threading
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregations import (
+    build_loans_frame,
+    build_transactions_frame,
+    build_transfers_frame
+)
+from utils.transaction_batch import TransactionBatch
+
+
+# Tipos de movimentação que geram lançamentos nas contas
+SOURCES = ('expense', 'revenue', 'transfer', 'loan')
+
+
+class AccountStream:
+    """
+    Lançamentos de uma conta em ordem cronológica.
+
+    Os lançamentos são identificados pelo tipo da movimentação (posição
+    em ``SOURCES``) e pelo ID do registro. As somas acumuladas são
+    recalculadas apenas quando consultadas após uma alteração.
+    """
+
+    def __init__(self):
+        """Inicializa uma sequência de lançamentos vazia."""
+        self.days = np.empty(0, dtype=np.int64)
+        self.sources = np.empty(0, dtype=np.int8)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.cents = np.empty(0, dtype=np.int64)
+        self._cumulative: Optional[np.ndarray] = None
+
+    def remove(self, source: int, ids: Optional[np.ndarray] = None) -> None:
+        """
+        Remove lançamentos de um tipo de movimentação.
+
+        Parameters
+        ----------
+        source : int
+            Posição do tipo em ``SOURCES``
+        ids : np.ndarray, optional
+            IDs dos registros; por padrão, remove todos os do tipo
+        """
+        removed = self.sources == source
+        if ids is not None:
+            removed &= np.isin(self.ids, ids)
+        if not removed.any():
+            return
+        kept = ~removed
+        self.days = self.days[kept]
+        self.sources = self.sources[kept]
+        self.ids = self.ids[kept]
+        self.cents = self.cents[kept]
+        self._cumulative = None
+
+    def insert(
+        self,
+        source: int,
+        ids: np.ndarray,
+        days: np.ndarray,
+        cents: np.ndarray
+    ) -> None:
+        """
+        Insere lançamentos mantendo a ordem cronológica.
+
+        Parameters
+        ----------
+        source : int
+            Posição do tipo em ``SOURCES``
+        ids : np.ndarray
+            IDs dos registros
+        days : np.ndarray
+            Dias dos lançamentos (dias desde 1970-01-01)
+        cents : np.ndarray
+            Valores com sinal, em centavos
+        """
+        if not len(days):
+            return
+        order = np.argsort(days, kind='stable')
+        days = days[order]
+        # Lançamentos do mesmo dia entram após os já existentes
+        positions = np.searchsorted(self.days, days, side='right')
+        self.days = np.insert(self.days, positions, days)
+        self.sources = np.insert(self.sources, positions, source)
+        self.ids = np.insert(self.ids, positions, ids[order])
+        self.cents = np.insert(self.cents, positions, cents[order])
+        self._cumulative = None
+
+    def balance(self, day: Optional[int] = None) -> int:
+        """
+        Calcula o saldo acumulado até um dia (inclusive).
+
+        Parameters
+        ----------
+        day : int, optional
+            Dia limite (dias desde 1970-01-01); por padrão, todos os
+            lançamentos
+
+        Returns
+        -------
+        int
+            Saldo em centavos
+        """
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self.cents)
+        count = len(self.days) if day is None else int(
+            np.searchsorted(self.days, day, side='right')
+        )
+        return int(self._cumulative[count - 1]) if count else 0
+
+
+class AccountBalanceLedger:
+    """
+    Saldos de todas as contas de um usuário.
+
+    O razão é carregado por tipo de movimentação (``load``) e atualizado
+    de forma incremental por ``apply``, recebendo as versões anterior e
+    atual dos registros alterados. Pode ser mantido como estrutura
+    derivada das tabelas do espelho local por meio de ``attach``.
+
+    Examples
+    --------
+    >>> ledger = AccountBalanceLedger()
+    >>> ledger.load('expense', expenses)
+    >>> ledger.load('revenue', revenues)
+    >>> ledger.balance(1, as_of='2024-01-31')
+    123450
+    """
+
+    def __init__(self):
+        """Inicializa um razão sem lançamentos."""
+        self._streams: Dict[int, AccountStream] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_postings(
+        source: str,
+        records: Union[List[Dict[str, Any]], pd.DataFrame, TransactionBatch]
+    ) -> pd.DataFrame:
+        """
+        Converte movimentações nos lançamentos que geram nas contas.
+
+        Despesas pagas e empréstimos dados debitam a conta; receitas
+        recebidas e empréstimos recebidos a creditam. Transferências
+        efetivadas debitam a origem e creditam o destino. Registros sem
+        data ou sem conta não geram lançamentos.
+
+        Parameters
+        ----------
+        source : str
+            Tipo da movimentação (um de ``SOURCES``)
+        records : List[Dict[str, Any]], pd.DataFrame or TransactionBatch
+            Registros da API, tabela do espelho local ou lote colunar
+            (despesas e receitas)
+
+        Returns
+        -------
+        pd.DataFrame
+            Colunas ``account``, ``id``, ``day`` e ``cents`` (int64)
+        """
+        if source in ('expense', 'revenue'):
+            if isinstance(records, TransactionBatch):
+                frame = records.to_frame()
+            else:
+                frame = build_transactions_frame(
+                    records, 'payed' if source == 'expense' else 'received'
+                )
+            frame = frame[frame['settled']]
+            sign = -1 if source == 'expense' else 1
+            legs = [(frame, 'account', sign)]
+        elif source == 'transfer':
+            frame = build_transfers_frame(records)
+            frame = frame[frame['settled']]
+            legs = [
+                (frame, 'origin_account', -1),
+                (frame, 'destiny_account', 1)
+            ]
+        elif source == 'loan':
+            frame = build_loans_frame(records)
+            sign = frame['loan_type'].map(
+                {'given': -1, 'received': 1}
+            ).astype(float).fillna(0).to_numpy(dtype=np.int64)
+            legs = [(frame, 'account', sign)]
+        else:
+            raise ValueError(f"Tipo de movimentação inválido: {source}")
+
+        postings = pd.concat([
+            pd.DataFrame({
+                'account': leg[column],
+                'id': pd.to_numeric(leg['id'], errors='coerce'),
+                'date': leg['date'],
+                'cents': leg['value'].to_numpy() * sign
+            })
+            for leg, column, sign in legs
+        ], ignore_index=True)
+        postings = postings[
+            postings['account'].notna()
+            & postings['id'].notna()
+            & postings['date'].notna()
+            & postings['cents'].ne(0)
+        ]
+        return pd.DataFrame({
+            'account': postings['account'].astype(np.int64),
+            'id': postings['id'].astype(np.int64),
+            'day': postings['date'].to_numpy().astype(
+                'datetime64[D]'
+            ).astype(np.int64),
+            'cents': postings['cents'].astype(np.int64)
+        })
+
+    def _post(self, source: str, postings: pd.DataFrame) -> None:
+        """
+        Insere lançamentos nas sequências das contas.
+
+        Parameters
+        ----------
+        source : str
+            Tipo da movimentação
+        postings : pd.DataFrame
+            Lançamentos de ``_get_postings``
+        """
+        code = SOURCES.index(source)
+        for account, group in postings.groupby('account', sort=False):
+            stream = self._streams.setdefault(int(account), AccountStream())
+            stream.insert(
+                code,
+                group['id'].to_numpy(),
+                group['day'].to_numpy(),
+                group['cents'].to_numpy()
+            )
+
+    def load(
+        self,
+        source: str,
+        records: Union[List[Dict[str, Any]], pd.DataFrame, TransactionBatch]
+    ) -> None:
+        """
+        Substitui todos os lançamentos de um tipo de movimentação.
+
+        Parameters
+        ----------
+        source : str
+            Tipo da movimentação (um de ``SOURCES``)
+        records : List[Dict[str, Any]], pd.DataFrame or TransactionBatch
+            Todos os registros do tipo
+        """
+        postings = self._get_postings(source, records)
+        with self._lock:
+            for stream in self._streams.values():
+                stream.remove(SOURCES.index(source))
+            self._post(source, postings)
+
+    def apply(
+        self,
+        source: str,
+        removed: pd.DataFrame,
+        added: pd.DataFrame
+    ) -> None:
+        """
+        Atualiza o razão com uma alteração das movimentações.
+
+        Parameters
+        ----------
+        source : str
+            Tipo da movimentação (um de ``SOURCES``)
+        removed : pd.DataFrame
+            Registros removidos ou versões anteriores dos alterados
+        added : pd.DataFrame
+            Registros novos ou versões atuais dos alterados
+        """
+        removed_postings = self._get_postings(source, removed)
+        added_postings = self._get_postings(source, added)
+        code = SOURCES.index(source)
+        with self._lock:
+            # As versões anteriores indicam em quais contas lançaram
+            for account, group in removed_postings.groupby('account'):
+                stream = self._streams.get(int(account))
+                if stream is not None:
+                    stream.remove(code, group['id'].to_numpy())
+            self._post(source, added_postings)
+
+    def attach(
+        self,
+        source: str,
+        frame: pd.DataFrame
+    ) -> "AccountBalanceView":
+        """
+        Carrega um tipo de movimentação a partir de uma tabela espelhada.
+
+        Parameters
+        ----------
+        source : str
+            Tipo da movimentação (um de ``SOURCES``)
+        frame : pd.DataFrame
+            Tabela do espelho local
+
+        Returns
+        -------
+        AccountBalanceView
+            Estrutura derivada a registrar na tabela
+            (``local_ledger.query_view``)
+        """
+        self.load(source, frame)
+        return AccountBalanceView(self, source)
+
+    @staticmethod
+    def _to_day(value: Union[str, date]) -> int:
+        """
+        Converte uma data em dias desde 1970-01-01.
+
+        Parameters
+        ----------
+        value : str or date
+            Data no formato YYYY-MM-DD ou objeto date
+
+        Returns
+        -------
+        int
+            Número do dia
+        """
+        return int(np.datetime64(value, 'D').astype(np.int64))
+
+    def balance(
+        self,
+        account_id: int,
+        as_of: Optional[Union[str, date]] = None
+    ) -> int:
+        """
+        Calcula o saldo de uma conta.
+
+        Parameters
+        ----------
+        account_id : int
+            ID da conta
+        as_of : str or date, optional
+            Data (inclusive) do saldo; por padrão, todos os lançamentos
+
+        Returns
+        -------
+        int
+            Saldo em centavos
+        """
+        day = None if as_of is None else self._to_day(as_of)
+        with self._lock:
+            stream = self._streams.get(int(account_id))
+            return stream.balance(day) if stream is not None else 0
+
+    def balances(
+        self,
+        as_of: Optional[Union[str, date]] = None
+    ) -> Dict[int, int]:
+        """
+        Calcula o saldo de todas as contas com lançamentos.
+
+        Parameters
+        ----------
+        as_of : str or date, optional
+            Data (inclusive) dos saldos; por padrão, todos os lançamentos
+
+        Returns
+        -------
+        Dict[int, int]
+            Saldos em centavos indexados pelo ID da conta
+        """
+        day = None if as_of is None else self._to_day(as_of)
+        with self._lock:
+            return {
+                account: stream.balance(day)
+                for account, stream in self._streams.items()
+            }
+
+
+class AccountBalanceView:
+    """
+    Ligação entre uma tabela do espelho local e o razão de saldos.
+
+    Registrada como estrutura derivada da tabela de um tipo de
+    movimentação, repassa ao razão as alterações dessa tabela.
+    """
+
+    def __init__(self, ledger: AccountBalanceLedger, source: str):
+        """
+        Inicializa a ligação.
+
+        Parameters
+        ----------
+        ledger : AccountBalanceLedger
+            Razão de saldos do usuário
+        source : str
+            Tipo da movimentação da tabela
+        """
+        self.ledger = ledger
+        self.source = source
+
+    def apply(self, removed: pd.DataFrame, added: pd.DataFrame) -> None:
+        """
+        Repassa uma alteração da tabela ao razão.
+
+        Parameters
+        ----------
+        removed : pd.DataFrame
+            Registros removidos ou versões anteriores dos alterados
+        added : pd.DataFrame
+            Registros novos ou versões atuais dos alterados
+        """
+        self.ledger.apply(self.source, removed, added)
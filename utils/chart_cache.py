@@ -0,0 +1,149 @@
+"""
+Cache de figuras Plotly da aplicação.
+
+Este módulo memoriza as figuras dos gráficos pelo conteúdo dos dados
+agregados que as originam. Quando os números não mudam entre execuções
+do script, a figura já construída é reaproveitada.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from config.settings import app_config
+
+
+logger = logging.getLogger(__name__)
+
+
+class FigureCache:
+    """
+    Cache LRU de figuras Plotly compartilhado pelo processo.
+
+    A chave combina o tipo do gráfico, uma impressão digital do conteúdo
+    do DataFrame agregado e o tema ativo. Como a chave depende apenas do
+    conteúdo, sessões com os mesmos números compartilham a figura; as
+    figuras armazenadas não devem ser alteradas pelo chamador.
+    """
+
+    def __init__(self, max_entries: int = app_config.FIGURE_CACHE_MAX_ENTRIES):
+        """
+        Inicializa o cache de figuras.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            Número máximo de figuras mantidas
+        """
+        self.max_entries = max_entries
+        self._figures: "OrderedDict[Tuple[str, str, str], go.Figure]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(data: pd.DataFrame) -> str:
+        """
+        Calcula a impressão digital do conteúdo de um DataFrame.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            Dados agregados do gráfico
+
+        Returns
+        -------
+        str
+            Hash das colunas, do índice e dos valores
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(list(data.columns)).encode('utf-8'))
+        digest.update(
+            pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes()
+        )
+        return digest.hexdigest()
+
+    @staticmethod
+    def _get_theme() -> str:
+        """
+        Obtém o tema ativo no navegador da sessão.
+
+        Returns
+        -------
+        str
+            Tipo do tema (``light``/``dark``) ou vazio se desconhecido
+        """
+        try:
+            return st.context.theme.type or ''
+        except Exception:
+            return ''
+
+    def get_or_build(
+        self,
+        kind: str,
+        data: pd.DataFrame,
+        builder: Callable[[pd.DataFrame], go.Figure],
+        theme: Optional[str] = None
+    ) -> go.Figure:
+        """
+        Obtém a figura de um gráfico, construindo-a apenas se necessário.
+
+        Parameters
+        ----------
+        kind : str
+            Identificador do gráfico (ex.: ``dashboard_expenses_pie``)
+        data : pd.DataFrame
+            Dados agregados do gráfico
+        builder : Callable[[pd.DataFrame], go.Figure]
+            Função que constrói a figura a partir dos dados
+        theme : str, optional
+            Tema da figura; por padrão, o tema ativo da sessão
+
+        Returns
+        -------
+        go.Figure
+            Figura do gráfico
+
+        Examples
+        --------
+        >>> fig = figure_cache.get_or_build(
+        ...     'dashboard_expenses_pie', df, build_expenses_pie
+        ... )
+        >>> st.plotly_chart(fig)
+        """
+        key = (
+            kind,
+            self.fingerprint(data),
+            self._get_theme() if theme is None else theme
+        )
+
+        with self._lock:
+            figure = self._figures.get(key)
+            if figure is not None:
+                self._figures.move_to_end(key)
+                return figure
+
+        figure = builder(data)
+
+        with self._lock:
+            self._figures[key] = figure
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.max_entries:
+                self._figures.popitem(last=False)
+        logger.debug(f"Figura '{kind}' construída e armazenada no cache")
+        return figure
+
+    def clear(self) -> None:
+        """Remove todas as figuras do cache."""
+        with self._lock:
+            self._figures.clear()
+
+
+# Instância global do cache de figuras
+figure_cache = FigureCache()
@@ -0,0 +1,154 @@
+"""
+Especificação de filtros das listagens.
+
+Este módulo define o filtro que as páginas montam a partir das seleções
+do usuário e que os serviços convertem em parâmetros de consulta da
+API. Campos que a API não sabe filtrar são aplicados localmente sobre
+a resposta, de modo que a página não precisa saber onde cada filtro é
+resolvido.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class FilterSpec:
+    """
+    Filtros de igualdade por campo de uma listagem.
+
+    Campos com valor None são ignorados, permitindo montar o filtro
+    diretamente a partir de seleções opcionais.
+
+    Examples
+    --------
+    >>> spec = FilterSpec(is_active=True, account_type=None)
+    >>> spec.to_params(('is_active',))
+    {'is_active': 'true'}
+    """
+
+    def __init__(self, **equals: Any):
+        """
+        Inicializa o filtro.
+
+        Parameters
+        ----------
+        **equals : Any
+            Valor exigido por campo; None para não filtrar o campo
+        """
+        self.equals: Dict[str, Any] = {
+            field: value for field, value in equals.items()
+            if value is not None
+        }
+
+    def __bool__(self) -> bool:
+        return bool(self.equals)
+
+    def __repr__(self) -> str:
+        return f"FilterSpec({self.equals!r})"
+
+    def merge(self, other: Optional["FilterSpec"]) -> "FilterSpec":
+        """
+        Combina dois filtros; os campos de ``other`` prevalecem.
+
+        Parameters
+        ----------
+        other : FilterSpec, optional
+            Filtro adicional
+
+        Returns
+        -------
+        FilterSpec
+            Novo filtro com os campos de ambos
+        """
+        if not other:
+            return self
+        return FilterSpec(**{**self.equals, **other.equals})
+
+    def to_params(self, supported: Iterable[str]) -> Dict[str, str]:
+        """
+        Converte em parâmetros da API os campos que ela filtra.
+
+        Parameters
+        ----------
+        supported : Iterable[str]
+            Campos aceitos como parâmetro pelo endpoint
+
+        Returns
+        -------
+        Dict[str, str]
+            Parâmetros de consulta; booleanos como ``true``/``false``
+        """
+        supported = set(supported)
+        params: Dict[str, str] = {}
+        for field, value in self.equals.items():
+            if field not in supported:
+                continue
+            if isinstance(value, bool):
+                params[field] = str(value).lower()
+            else:
+                params[field] = str(value)
+        return params
+
+    def local(self, supported: Iterable[str]) -> "FilterSpec":
+        """
+        Obtém os campos que a API não filtra.
+
+        Parameters
+        ----------
+        supported : Iterable[str]
+            Campos aceitos como parâmetro pelo endpoint
+
+        Returns
+        -------
+        FilterSpec
+            Filtro com os demais campos, aplicado sobre a resposta
+        """
+        supported = set(supported)
+        return FilterSpec(**{
+            field: value for field, value in self.equals.items()
+            if field not in supported
+        })
+
+    def matches(self, record: Mapping) -> bool:
+        """
+        Verifica se um registro atende a todos os campos do filtro.
+
+        Parameters
+        ----------
+        record : Mapping
+            Registro ou dicionário da API
+
+        Returns
+        -------
+        bool
+            True se todos os campos forem iguais aos do filtro
+        """
+        return all(
+            record.get(field) == value
+            for field, value in self.equals.items()
+        )
+
+    def apply(
+        self,
+        records: Iterable[Mapping],
+        supported: Iterable[str] = ()
+    ) -> List[Mapping]:
+        """
+        Aplica localmente os campos que a API não filtrou.
+
+        Parameters
+        ----------
+        records : Iterable[Mapping]
+            Registros retornados pela API
+        supported : Iterable[str], optional
+            Campos já filtrados pela API (``to_params``)
+
+        Returns
+        -------
+        List[Mapping]
+            Registros que atendem aos demais campos
+        """
+        local = self.local(supported)
+        if not local:
+            return list(records)
+        return [record for record in records if local.matches(record)]
@@ -0,0 +1,439 @@
+"""
+Registros tipados das entidades da API.
+
+Este módulo define classes compactas (com ``__slots__``) para as
+entidades retornadas pela expenselit-api. Os valores monetários são
+convertidos uma única vez em ``Decimal`` e as datas e horários em
+``date`` e ``time``, na fronteira dos serviços; as páginas recebem os
+valores já convertidos.
+
+Os registros também se comportam como mapeamentos somente leitura
+(``record['value']``, ``record.get('date')``), compatíveis com o código
+que trata as entidades como dicionários.
+"""
+
+import logging
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Campos extras compartilhados pelos registros sem campos desconhecidos
+_NO_EXTRA: Mapping = MappingProxyType({})
+
+
+def parse_decimal(value: Any) -> Optional[Decimal]:
+    """
+    Converte um valor monetário da API em ``Decimal``.
+
+    Parameters
+    ----------
+    value : Any
+        Valor como string (ex.: ``"234.50"``) ou número
+
+    Returns
+    -------
+    Decimal or None
+        Valor convertido ou None se vazio ou inválido
+    """
+    if isinstance(value, Decimal):
+        return value
+    if value is None or value == '':
+        return None
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        logger.warning(f"Valor monetário inválido: {value}")
+        return None
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """
+    Converte uma data da API (YYYY-MM-DD) em ``date``.
+
+    Parameters
+    ----------
+    value : Any
+        Data como string ou objeto date/datetime
+
+    Returns
+    -------
+    date or None
+        Data convertida ou None se vazia ou inválida
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        logger.warning(f"Data inválida: {value}")
+        return None
+
+
+def parse_time(value: Any) -> Optional[time]:
+    """
+    Converte um horário da API (HH:MM:SS) em ``time``.
+
+    Parameters
+    ----------
+    value : Any
+        Horário como string ou objeto time
+
+    Returns
+    -------
+    time or None
+        Horário convertido ou None se vazio ou inválido
+    """
+    if isinstance(value, time):
+        return value
+    if not value:
+        return None
+    try:
+        return time.fromisoformat(str(value))
+    except ValueError:
+        logger.warning(f"Horário inválido: {value}")
+        return None
+
+
+def to_api_value(value: Any) -> Any:
+    """
+    Converte um valor tipado de volta ao formato da API.
+
+    Parameters
+    ----------
+    value : Any
+        Valor de um registro ou de um formulário
+
+    Returns
+    -------
+    Any
+        ``Decimal`` como string, ``date`` como YYYY-MM-DD, ``time``
+        como HH:MM:SS e demais valores sem alteração
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, time):
+        return value.strftime('%H:%M:%S')
+    return value
+
+
+def to_api_payload(data: Any) -> Any:
+    """
+    Prepara um corpo de requisição com valores tipados para a API.
+
+    Parameters
+    ----------
+    data : Any
+        Dicionário ou registro enviado à API
+
+    Returns
+    -------
+    Any
+        Dicionário com os valores no formato da API; outros tipos
+        são retornados sem alteração
+    """
+    if isinstance(data, Mapping):
+        return {key: to_api_value(value) for key, value in data.items()}
+    return data
+
+
+class Record(Mapping):
+    """
+    Registro compacto de uma entidade da API.
+
+    Cada subclasse declara em ``FIELDS`` os campos conhecidos e a função
+    de conversão de cada um (None para manter o valor da API); os campos
+    conhecidos ocupam ``__slots__`` e os demais ficam em ``extra``.
+    Campos ausentes na resposta da API valem None como atributo e não
+    aparecem como chave.
+
+    Examples
+    --------
+    >>> expense = Expense.from_api({'id': 1, 'value': '10.50'})
+    >>> expense.value
+    Decimal('10.50')
+    >>> expense.get('date', 'N/A')
+    'N/A'
+    """
+
+    __slots__ = ('extra',)
+
+    FIELDS: Dict[str, Optional[Callable[[Any], Any]]] = {}
+
+    def __init__(self, **values: Any):
+        """
+        Inicializa o registro com valores já convertidos.
+
+        Parameters
+        ----------
+        **values : Any
+            Valores dos campos
+        """
+        self._assign(values, {})
+
+    def _assign(
+        self,
+        values: Dict[str, Any],
+        parsers: Dict[str, Optional[Callable[[Any], Any]]]
+    ) -> None:
+        """
+        Atribui os valores aos campos, convertendo-os se necessário.
+
+        Parameters
+        ----------
+        values : Dict[str, Any]
+            Valores dos campos
+        parsers : Dict[str, Optional[Callable[[Any], Any]]]
+            Funções de conversão por campo
+        """
+        fields = self.FIELDS
+        extra = None
+        for key, value in values.items():
+            if key in fields:
+                parser = parsers.get(key)
+                setattr(self, key, parser(value) if parser else value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self.extra: Mapping = extra or _NO_EXTRA
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "Record":
+        """
+        Constrói o registro a partir de uma resposta da API.
+
+        Parameters
+        ----------
+        data : Dict[str, Any]
+            Entidade como retornada pela API
+
+        Returns
+        -------
+        Record
+            Registro com os valores convertidos
+        """
+        if isinstance(data, cls):
+            return data
+        record = cls.__new__(cls)
+        record._assign(data, cls.FIELDS)
+        return record
+
+    def __getattr__(self, name: str) -> Any:
+        """Campos conhecidos ausentes valem None."""
+        if name in type(self).FIELDS:
+            return None
+        raise AttributeError(
+            f"'{type(self).__name__}' não possui o atributo '{name}'"
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            try:
+                object.__getattribute__(self, key)
+            except AttributeError:
+                continue
+            yield key
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_api(self) -> Dict[str, Any]:
+        """
+        Converte o registro de volta ao formato da API.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Campos com valores serializáveis em JSON
+        """
+        return to_api_payload(self)
+
+
+class Expense(Record):
+    """Despesa (``expenses/``)."""
+
+    FIELDS = {
+        'id': None,
+        'description': None,
+        'value': parse_decimal,
+        'date': parse_date,
+        'horary': parse_time,
+        'category': None,
+        'account': None,
+        'account_name': None,
+        'payed': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
+
+
+class Revenue(Record):
+    """Receita (``revenues/``)."""
+
+    FIELDS = {
+        'id': None,
+        'description': None,
+        'value': parse_decimal,
+        'date': parse_date,
+        'horary': parse_time,
+        'category': None,
+        'account': None,
+        'account_name': None,
+        'received': None,
+        'source': None,
+        'tax_amount': parse_decimal,
+        'net_amount': parse_decimal,
+        'notes': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
+
+
+class Transfer(Record):
+    """Transferência entre contas (``transfers/``)."""
+
+    FIELDS = {
+        'id': None,
+        'description': None,
+        'value': parse_decimal,
+        'date': parse_date,
+        'horary': parse_time,
+        'category': None,
+        'origin_account': None,
+        'origin_account_name': None,
+        'destiny_account': None,
+        'destiny_account_name': None,
+        'transfered': None,
+        'fee': parse_decimal,
+        'transaction_id': None,
+        'confirmation_code': None,
+        'notes': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
+
+
+class Loan(Record):
+    """Empréstimo (``loans/``)."""
+
+    FIELDS = {
+        'id': None,
+        'description': None,
+        'value': parse_decimal,
+        'payed_value': parse_decimal,
+        'date': parse_date,
+        'horary': parse_time,
+        'due_date': parse_date,
+        'category': None,
+        'loan_type': None,
+        'account': None,
+        'creditor': None,
+        'benefited': None,
+        'payed': None,
+        'interest_rate': parse_decimal,
+        'late_fee': parse_decimal,
+        'installments': None,
+        'notes': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
+
+
+class Account(Record):
+    """Conta financeira (``accounts/``)."""
+
+    FIELDS = {
+        'id': None,
+        'name': None,
+        'account_name': None,
+        'account_type': None,
+        'bank_code': None,
+        'agency': None,
+        'description': None,
+        'current_balance': parse_decimal,
+        'minimum_balance': parse_decimal,
+        'opening_date': parse_date,
+        'is_active': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
+
+
+class CreditCard(Record):
+    """Cartão de crédito (``credit-cards/``)."""
+
+    FIELDS = {
+        'id': None,
+        'name': None,
+        'on_card_name': None,
+        'flag': None,
+        'credit_limit': parse_decimal,
+        'max_limit': parse_decimal,
+        'closing_day': None,
+        'due_day': None,
+        'validation_date': parse_date,
+        'security_code': None,
+        'associated_account': None,
+        'is_active': None,
+        'notes': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
+
+
+class Member(Record):
+    """Membro (``members/``)."""
+
+    FIELDS = {
+        'id': None,
+        'name': None,
+        'document': None,
+        'phone': None,
+        'email': None,
+        'sex': None,
+        'user': None,
+        'is_user': None,
+        'is_creditor': None,
+        'is_benefited': None,
+        'active': None,
+        'birth_date': parse_date,
+        'monthly_income': parse_decimal,
+        'address': None,
+        'occupation': None,
+        'emergency_contact': None,
+        'notes': None,
+        'created_at': None,
+        'updated_at': None
+    }
+    __slots__ = tuple(FIELDS)
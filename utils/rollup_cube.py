@@ -0,0 +1,360 @@
+"""
+Cubo de agregação diária das movimentações financeiras.
+
+Este módulo mantém, para despesas ou receitas, as somas acumuladas
+(prefix sums) por dia, categoria, conta e status de efetivação. Qualquer
+consulta por período se resume a duas leituras das somas acumuladas,
+sem percorrer as movimentações.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.aggregations import build_transactions_frame
+from utils.transaction_batch import TransactionBatch
+
+
+class RollupCube:
+    """
+    Somas acumuladas diárias de um tipo de movimentação.
+
+    Para cada dimensão (``category`` e ``account``) e medida (todas as
+    movimentações ou apenas as efetivadas) é mantida uma matriz
+    ``(dias + 1, chaves)`` em centavos, em que a linha ``i`` soma os
+    ``i`` primeiros dias de ``days``. Apenas os dias com movimentação
+    ocupam linhas, de modo que datas distantes não ampliam as matrizes.
+    O cubo pode ser usado como estrutura
+    derivada do espelho local (``local_ledger.query_view``), sendo
+    atualizado de forma incremental por ``apply``.
+
+    Examples
+    --------
+    >>> cube = RollupCube(expenses, 'payed')
+    >>> cube.total('2024-01-01', '2024-01-31', settled=True)
+    123450
+    """
+
+    DIMENSIONS = ('category', 'account')
+
+    def __init__(
+        self,
+        records: Union[List[Dict[str, Any]], pd.DataFrame, TransactionBatch],
+        status_field: str
+    ):
+        """
+        Constrói o cubo a partir das movimentações.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]], pd.DataFrame or TransactionBatch
+            Registros da API, tabela do espelho local ou lote colunar
+        status_field : str
+            Campo booleano de efetivação (``payed`` ou ``received``)
+        """
+        self.status_field = status_field
+        # Dias com movimentação (desde 1970-01-01), em ordem crescente
+        self.days = np.empty(0, dtype=np.int64)
+        self._keys: Dict[str, List[Any]] = {
+            dimension: [] for dimension in self.DIMENSIONS
+        }
+        self._positions: Dict[str, Dict[Any, int]] = {
+            dimension: {} for dimension in self.DIMENSIONS
+        }
+        self._prefix: Dict[Tuple[str, bool], np.ndarray] = {
+            (dimension, settled): np.zeros((1, 0), dtype=np.int64)
+            for dimension in self.DIMENSIONS
+            for settled in (False, True)
+        }
+        self._count_prefix = np.zeros(1, dtype=np.int64)
+        if isinstance(records, TransactionBatch):
+            frame = records.to_frame()
+        else:
+            frame = build_transactions_frame(records, status_field)
+        self._add(frame, 1)
+
+    def apply(self, removed: pd.DataFrame, added: pd.DataFrame) -> None:
+        """
+        Atualiza o cubo com uma alteração das movimentações.
+
+        Parameters
+        ----------
+        removed : pd.DataFrame
+            Movimentações removidas ou versões anteriores das alteradas
+        added : pd.DataFrame
+            Movimentações novas ou versões atuais das alteradas
+        """
+        if not removed.empty:
+            self._add(build_transactions_frame(removed, self.status_field), -1)
+        if not added.empty:
+            self._add(build_transactions_frame(added, self.status_field), 1)
+
+    @staticmethod
+    def _to_day(value: str) -> int:
+        """
+        Converte uma data YYYY-MM-DD em dias desde 1970-01-01.
+
+        Parameters
+        ----------
+        value : str
+            Data no formato da API
+
+        Returns
+        -------
+        int
+            Número do dia
+        """
+        return int(np.datetime64(value, 'D').astype(np.int64))
+
+    def _ensure_days(self, days: np.ndarray) -> None:
+        """
+        Inclui no cubo as linhas dos dias ainda ausentes.
+
+        Parameters
+        ----------
+        days : np.ndarray
+            Dias das movimentações (desde 1970-01-01)
+        """
+        merged = np.union1d(self.days, days)
+        if len(merged) == len(self.days):
+            return
+
+        # A nova linha j soma os dias antigos anteriores a merged[j]
+        rows = np.concatenate((
+            [0], np.searchsorted(self.days, merged, side='right')
+        ))
+        for key, prefix in self._prefix.items():
+            self._prefix[key] = prefix[rows]
+        self._count_prefix = self._count_prefix[rows]
+        self.days = merged
+
+    def _get_positions(self, dimension: str, values: pd.Series) -> np.ndarray:
+        """
+        Obtém as colunas das chaves de uma dimensão, criando as novas.
+
+        Parameters
+        ----------
+        dimension : str
+            Dimensão do cubo (``category`` ou ``account``)
+        values : pd.Series
+            Chave de cada movimentação
+
+        Returns
+        -------
+        np.ndarray
+            Coluna de cada movimentação
+        """
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        # Valores ausentes (None, NaN ou NA) formam uma única chave None
+        uniques = [None if pd.isna(key) else key for key in uniques]
+        positions = self._positions[dimension]
+        keys = self._keys[dimension]
+        for key in uniques:
+            if key not in positions:
+                positions[key] = len(keys)
+                keys.append(key)
+
+        new_columns = len(keys) - self._prefix[(dimension, False)].shape[1]
+        if new_columns:
+            for settled in (False, True):
+                prefix = self._prefix[(dimension, settled)]
+                self._prefix[(dimension, settled)] = np.pad(
+                    prefix, ((0, 0), (0, new_columns))
+                )
+
+        lookup = np.array(
+            [positions[key] for key in uniques], dtype=np.int64
+        )
+        return lookup[codes]
+
+    def _add(self, frame: pd.DataFrame, sign: int) -> None:
+        """
+        Soma (ou subtrai) movimentações às somas acumuladas.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            DataFrame de ``build_transactions_frame``
+        sign : int
+            1 para incluir, -1 para remover as movimentações
+        """
+        frame = frame[frame['date'].notna()]
+        if frame.empty:
+            return
+
+        days = frame['date'].to_numpy().astype('datetime64[D]').astype(
+            np.int64
+        )
+        self._ensure_days(days)
+        rows = np.searchsorted(self.days, days)
+        values = frame['value'].to_numpy() * sign
+        settled = frame['settled'].to_numpy()
+
+        counts = np.zeros(len(self.days), dtype=np.int64)
+        np.add.at(counts, rows, sign)
+        self._count_prefix[1:] += np.cumsum(counts)
+
+        for dimension in self.DIMENSIONS:
+            columns = self._get_positions(dimension, frame[dimension])
+            for only_settled in (False, True):
+                prefix = self._prefix[(dimension, only_settled)]
+                mask = settled if only_settled else slice(None)
+                daily = np.zeros(
+                    (len(self.days), prefix.shape[1]), dtype=np.int64
+                )
+                np.add.at(daily, (rows[mask], columns[mask]), values[mask])
+                prefix[1:] += np.cumsum(daily, axis=0)
+
+    def _bounds(
+        self,
+        date_from: Optional[str],
+        date_to: Optional[str]
+    ) -> Tuple[int, int]:
+        """
+        Converte um período em linhas das somas acumuladas.
+
+        Parameters
+        ----------
+        date_from : str, optional
+            Data inicial (inclusive) no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final (inclusive) no formato YYYY-MM-DD
+
+        Returns
+        -------
+        Tuple[int, int]
+            Linhas inicial e final; a soma do período é a diferença
+            entre elas
+        """
+        low = 0
+        high = len(self.days)
+        if date_from:
+            low = int(np.searchsorted(self.days, self._to_day(date_from)))
+        if date_to:
+            high = int(np.searchsorted(
+                self.days, self._to_day(date_to), side='right'
+            ))
+        return low, max(high, low)
+
+    def count(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None
+    ) -> int:
+        """
+        Conta as movimentações do período.
+
+        Parameters
+        ----------
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
+
+        Returns
+        -------
+        int
+            Número de movimentações
+        """
+        low, high = self._bounds(date_from, date_to)
+        return int(self._count_prefix[high] - self._count_prefix[low])
+
+    def sums_by(
+        self,
+        dimension: str,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        settled: bool = False
+    ) -> pd.Series:
+        """
+        Soma os valores do período por categoria ou conta.
+
+        Parameters
+        ----------
+        dimension : str
+            Dimensão do cubo (``category`` ou ``account``)
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
+        settled : bool, optional
+            Se deve considerar apenas movimentações efetivadas
+
+        Returns
+        -------
+        pd.Series
+            Somas em centavos indexadas pela chave, sem chaves zeradas
+        """
+        low, high = self._bounds(date_from, date_to)
+        prefix = self._prefix[(dimension, settled)]
+        sums = pd.Series(
+            prefix[high] - prefix[low],
+            index=pd.Index(self._keys[dimension], dtype=object),
+            dtype=np.int64
+        )
+        return sums[sums != 0]
+
+    def total(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        settled: bool = False
+    ) -> int:
+        """
+        Soma os valores do período.
+
+        Parameters
+        ----------
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
+        settled : bool, optional
+            Se deve considerar apenas movimentações efetivadas
+
+        Returns
+        -------
+        int
+            Total em centavos
+        """
+        low, high = self._bounds(date_from, date_to)
+        prefix = self._prefix[('category', settled)]
+        return int((prefix[high] - prefix[low]).sum())
+
+    def daily(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        settled: bool = False
+    ) -> pd.Series:
+        """
+        Obtém as somas diárias do período.
+
+        Parameters
+        ----------
+        date_from : str, optional
+            Data inicial no formato YYYY-MM-DD
+        date_to : str, optional
+            Data final no formato YYYY-MM-DD
+        settled : bool, optional
+            Se deve considerar apenas movimentações efetivadas
+
+        Returns
+        -------
+        pd.Series
+            Somas em centavos indexadas pela data, apenas dos dias com
+            movimentação, em ordem cronológica
+        """
+        low, high = self._bounds(date_from, date_to)
+        totals = self._prefix[('category', settled)][low:high + 1].sum(
+            axis=1
+        )
+        counts = np.diff(self._count_prefix[low:high + 1])
+        dates = self.days[low:high].astype('datetime64[D]').astype(
+            'datetime64[ns]'
+        )
+        daily = pd.Series(
+            np.diff(totals), index=pd.DatetimeIndex(dates, name='date')
+        )
+        return daily[counts != 0]
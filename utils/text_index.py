@@ -0,0 +1,288 @@
+"""
+Índice textual das movimentações financeiras.
+
+Este módulo mantém um índice invertido de trigramas sobre os campos de
+texto das movimentações (descrição, observações, nomes das contas). Cada
+trigrama aponta para os registros que o contêm; a busca conta, por
+registro, os trigramas da consulta encontrados e ordena os registros
+por essa contagem, tolerando palavras incompletas e erros de digitação,
+sem consultar a API.
+"""
+
+import math
+import re
+import unicodedata
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+import numpy as np
+import pandas as pd
+
+from config.settings import app_config
+from utils.aggregations import select_columns
+
+
+# Palavras do texto normalizado
+_WORD_PATTERN = re.compile(r'\w+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normaliza um texto para indexação e busca.
+
+    Parameters
+    ----------
+    text : str
+        Texto original
+
+    Returns
+    -------
+    str
+        Texto em minúsculas e sem acentos
+    """
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+
+
+def get_trigrams(text: str) -> Set[str]:
+    """
+    Obtém os trigramas das palavras de um texto.
+
+    Cada palavra recebe dois espaços à esquerda e um à direita, como no
+    ``pg_trgm``, de modo que consultas de uma ou duas letras também
+    geram trigramas (ex.: ``"lu"`` gera ``"  l"``, ``" lu"`` e ``"lu "``).
+
+    Parameters
+    ----------
+    text : str
+        Texto original
+
+    Returns
+    -------
+    Set[str]
+        Trigramas distintos do texto
+    """
+    trigrams: Set[str] = set()
+    for word in _WORD_PATTERN.findall(normalize_text(text)):
+        padded = f"  {word} "
+        trigrams.update(
+            padded[start:start + 3] for start in range(len(padded) - 2)
+        )
+    return trigrams
+
+
+class TextIndex:
+    """
+    Índice invertido de trigramas sobre campos de texto dos registros.
+
+    Cada registro indexado recebe um número de documento sequencial; as
+    listas de cada trigrama guardam esses números em arrays compactos de
+    ``int32``. Registros alterados ou removidos são marcados como
+    excluídos e reindexados com um novo número, e o índice é compactado
+    quando os excluídos passam da metade dos documentos. O índice pode
+    ser usado como estrutura derivada do espelho local
+    (``local_ledger.query_view``), sendo atualizado por ``apply``.
+
+    Examples
+    --------
+    >>> index = TextIndex(expenses, ('description', 'account_name'))
+    >>> index.search('mercado')
+    [12, 7, 31]
+    """
+
+    def __init__(
+        self,
+        records: Union[List[Dict[str, Any]], pd.DataFrame],
+        fields: Iterable[str]
+    ):
+        """
+        Constrói o índice a partir dos registros.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]] or pd.DataFrame
+            Registros da API, registros tipados ou tabela do espelho local
+        fields : Iterable[str]
+            Campos de texto indexados; os ausentes são ignorados
+        """
+        self.fields = list(fields)
+        self._postings: Dict[str, array] = {}
+        # Por documento: ID do registro, nº de trigramas e se está ativo
+        self._ids = array('q')
+        self._sizes = array('i')
+        self._alive = bytearray()
+        self._documents: Dict[int, int] = {}
+        self._add_records(records)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def apply(self, removed: pd.DataFrame, added: pd.DataFrame) -> None:
+        """
+        Atualiza o índice com uma alteração dos registros.
+
+        Parameters
+        ----------
+        removed : pd.DataFrame
+            Registros removidos ou versões anteriores dos alterados
+        added : pd.DataFrame
+            Registros novos ou versões atuais dos alterados
+        """
+        if not removed.empty and 'id' in removed.columns:
+            for record_id in removed['id'].dropna():
+                self.remove(int(record_id))
+        if not added.empty:
+            self._add_records(added)
+
+    def _add_records(
+        self,
+        records: Union[List[Dict[str, Any]], pd.DataFrame]
+    ) -> None:
+        """
+        Indexa registros, substituindo as versões já indexadas.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]] or pd.DataFrame
+            Registros a indexar
+        """
+        frame = select_columns(records, ['id'] + self.fields)
+        columns = [frame[field].tolist() for field in self.fields]
+        for record_id, *values in zip(frame['id'].tolist(), *columns):
+            if pd.isna(record_id):
+                continue
+            self.add(
+                int(record_id),
+                ' '.join(str(value) for value in values if pd.notna(value))
+            )
+
+    def add(self, record_id: int, text: str) -> None:
+        """
+        Indexa (ou reindexa) o texto de um registro.
+
+        Parameters
+        ----------
+        record_id : int
+            ID do registro
+        text : str
+            Texto dos campos indexados
+        """
+        self.remove(record_id)
+        trigrams = get_trigrams(text)
+        document = len(self._ids)
+        self._ids.append(record_id)
+        self._sizes.append(len(trigrams))
+        self._alive.append(1)
+        self._documents[record_id] = document
+        for trigram in trigrams:
+            postings = self._postings.get(trigram)
+            if postings is None:
+                postings = self._postings[trigram] = array('i')
+            postings.append(document)
+
+    def remove(self, record_id: int) -> None:
+        """
+        Remove um registro do índice.
+
+        Parameters
+        ----------
+        record_id : int
+            ID do registro
+        """
+        document = self._documents.pop(record_id, None)
+        if document is None:
+            return
+        self._alive[document] = 0
+        if len(self._documents) < len(self._ids) / 2:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Descarta os documentos excluídos, renumerando os demais."""
+        alive = np.frombuffer(self._alive, dtype=np.bool_)
+        numbers = (np.cumsum(alive) - 1).astype(np.int32)
+
+        postings: Dict[str, array] = {}
+        for trigram, documents in self._postings.items():
+            current = np.frombuffer(documents, dtype=np.int32)
+            kept = current[alive[current]]
+            if kept.size:
+                postings[trigram] = array('i', numbers[kept].tobytes())
+
+        self._postings = postings
+        self._ids = array(
+            'q', np.frombuffer(self._ids, dtype=np.int64)[alive].tobytes()
+        )
+        self._sizes = array(
+            'i', np.frombuffer(self._sizes, dtype=np.int32)[alive].tobytes()
+        )
+        self._alive = bytearray(b'\x01' * len(self._ids))
+        self._documents = {
+            record_id: document
+            for document, record_id in enumerate(self._ids)
+        }
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Busca os registros mais parecidos com a consulta.
+
+        Um registro é retornado quando contém ao menos a fração
+        ``app_config.SEARCH_MIN_SCORE`` dos trigramas da consulta. Os
+        registros são ordenados pelo número de trigramas encontrados e,
+        no empate, pelo texto mais curto e pela ordem de indexação.
+
+        Parameters
+        ----------
+        query : str
+            Texto buscado
+        limit : int, optional
+            Número máximo de resultados
+
+        Returns
+        -------
+        List[int]
+            IDs dos registros, do mais relevante para o menos
+        """
+        trigrams = get_trigrams(query)
+        documents = [
+            np.frombuffer(self._postings[trigram], dtype=np.int32)
+            for trigram in trigrams if trigram in self._postings
+        ]
+        if not documents:
+            return []
+
+        counts = np.bincount(
+            np.concatenate(documents), minlength=len(self._ids)
+        )
+        counts[~np.frombuffer(self._alive, dtype=np.bool_)] = 0
+        minimum = max(
+            math.ceil(len(trigrams) * app_config.SEARCH_MIN_SCORE), 1
+        )
+        matches = np.flatnonzero(counts >= minimum)
+
+        sizes = np.frombuffer(self._sizes, dtype=np.int32)
+        order = np.lexsort((matches, sizes[matches], -counts[matches]))
+        ids = np.frombuffer(self._ids, dtype=np.int64)
+        return ids[matches[order][:limit]].tolist()
+
+
+def order_by_ids(records: List[Any], ids: List[int]) -> List[Any]:
+    """
+    Seleciona registros na ordem de uma lista de IDs.
+
+    Parameters
+    ----------
+    records : List[Any]
+        Registros carregados
+    ids : List[int]
+        IDs desejados, na ordem de exibição (ex.: de ``search``)
+
+    Returns
+    -------
+    List[Any]
+        Registros cujos IDs constam da lista, na mesma ordem; IDs sem
+        registro correspondente são ignorados
+    """
+    by_id = {record['id']: record for record in records}
+    return [by_id[record_id] for record_id in ids if record_id in by_id]
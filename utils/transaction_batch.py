@@ -0,0 +1,331 @@
+"""
+Lote colunar de movimentações financeiras.
+
+Este módulo armazena despesas ou receitas em arrays do NumPy, uma coluna
+por campo: centavos em ``int64``, datas em ``datetime64``, categorias
+como códigos inteiros das categorias de ``db_categories`` e contas em
+inteiros com máscara de ausência. O lote ocupa uma fração da memória de
+uma lista de dicionários e é exposto ao pandas e ao pyarrow sem cópia
+das colunas numéricas.
+"""
+
+from datetime import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from utils.aggregations import (
+    TRANSACTION_COLUMNS,
+    cents_to_decimal,
+    parse_dates,
+    select_columns,
+    to_cents
+)
+
+
+class TransactionBatch:
+    """
+    Movimentações de um tipo (despesas ou receitas) em colunas NumPy.
+
+    Attributes
+    ----------
+    ids : np.ndarray
+        IDs dos registros (``int64``)
+    dates : np.ndarray
+        Datas (``datetime64[ns]``, NaT se ausente)
+    horaries : np.ndarray
+        Horários desde a meia-noite (``timedelta64[s]``, NaT se ausente)
+    descriptions : np.ndarray
+        Descrições (``object``)
+    category_codes : np.ndarray
+        Posição da categoria em ``categories`` (``int8`` ou ``int16``)
+    categories : List[str]
+        Códigos de categoria da API; as de ``db_categories`` primeiro
+    accounts : np.ndarray
+        IDs das contas (``int64``, 0 se ausente)
+    account_mask : np.ndarray
+        True onde a conta está ausente
+    values : np.ndarray
+        Valores em centavos (``int64``)
+    settled : np.ndarray
+        Status de efetivação (``bool``)
+    status_field : str
+        Campo de efetivação na API (``payed`` ou ``received``)
+
+    Examples
+    --------
+    >>> batch = TransactionBatch.from_records(
+    ...     expenses, 'payed', db_categories.EXPENSE_CATEGORIES
+    ... )
+    >>> batch.to_frame().groupby('category', observed=True)['value'].sum()
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        dates: np.ndarray,
+        horaries: np.ndarray,
+        descriptions: np.ndarray,
+        category_codes: np.ndarray,
+        categories: List[str],
+        accounts: np.ndarray,
+        account_mask: np.ndarray,
+        values: np.ndarray,
+        settled: np.ndarray,
+        status_field: str
+    ):
+        """
+        Inicializa o lote com colunas já convertidas.
+
+        Parameters
+        ----------
+        ids, dates, horaries, descriptions, category_codes, categories,
+        accounts, account_mask, values, settled, status_field
+            Colunas do lote, descritas nos atributos da classe
+        """
+        self.ids = ids
+        self.dates = dates
+        self.horaries = horaries
+        self.descriptions = descriptions
+        self.category_codes = category_codes
+        self.categories = categories
+        self.accounts = accounts
+        self.account_mask = account_mask
+        self.values = values
+        self.settled = settled
+        self.status_field = status_field
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Union[List[Dict[str, Any]], pd.DataFrame],
+        status_field: str,
+        categories: Iterable[str] = ()
+    ) -> "TransactionBatch":
+        """
+        Constrói o lote a partir de registros da API.
+
+        Parameters
+        ----------
+        records : List[Dict[str, Any]] or pd.DataFrame
+            JSON da API, registros tipados ou tabela do espelho local
+        status_field : str
+            Campo booleano de efetivação (``payed`` ou ``received``)
+        categories : Iterable[str], optional
+            Códigos de categoria conhecidos (ex.: as chaves de
+            ``db_categories.EXPENSE_CATEGORIES``); categorias fora da
+            lista recebem códigos adicionais
+
+        Returns
+        -------
+        TransactionBatch
+            Lote com as movimentações
+        """
+        raw = select_columns(
+            records, TRANSACTION_COLUMNS + ['value', status_field]
+        )
+
+        # Categorias ausentes são tratadas como "others", como na API
+        category = raw['category'].fillna('others')
+        known = list(categories)
+        known_set = set(known)
+        categories = known + sorted(
+            str(code) for code in category.unique() if code not in known_set
+        )
+        # O tipo dos códigos (int8/int16) é o escolhido pelo pandas, o
+        # que permite expor a coluna categórica sem cópia
+        category_codes = pd.Categorical(category, categories=categories).codes
+
+        accounts = pd.to_numeric(raw['account'], errors='coerce')
+        horaries = pd.to_timedelta(
+            raw['horary'].map(str, na_action='ignore'), errors='coerce'
+        )
+
+        return cls(
+            ids=pd.to_numeric(raw['id'], errors='coerce').fillna(0).to_numpy(
+                dtype=np.int64
+            ),
+            dates=parse_dates(raw['date']).to_numpy(dtype='datetime64[ns]'),
+            horaries=horaries.to_numpy().astype('timedelta64[s]'),
+            descriptions=raw['description'].to_numpy(dtype=object),
+            category_codes=category_codes,
+            categories=categories,
+            accounts=accounts.fillna(0).to_numpy(dtype=np.int64),
+            account_mask=accounts.isna().to_numpy(),
+            values=to_cents(raw['value']),
+            settled=raw[status_field].eq(True).to_numpy(),
+            status_field=status_field
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pelas colunas numéricas, em bytes."""
+        return sum(
+            column.nbytes for column in (
+                self.ids, self.dates, self.horaries, self.category_codes,
+                self.accounts, self.account_mask, self.values, self.settled
+            )
+        )
+
+    def filter(self, mask: np.ndarray) -> "TransactionBatch":
+        """
+        Seleciona as movimentações de uma máscara booleana.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            True para as movimentações mantidas
+
+        Returns
+        -------
+        TransactionBatch
+            Novo lote com as movimentações selecionadas
+        """
+        return TransactionBatch(
+            ids=self.ids[mask],
+            dates=self.dates[mask],
+            horaries=self.horaries[mask],
+            descriptions=self.descriptions[mask],
+            category_codes=self.category_codes[mask],
+            categories=self.categories,
+            accounts=self.accounts[mask],
+            account_mask=self.account_mask[mask],
+            values=self.values[mask],
+            settled=self.settled[mask],
+            status_field=self.status_field
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Expõe o lote como DataFrame, sem copiar as colunas.
+
+        As colunas seguem ``build_transactions_frame``, de modo que o
+        DataFrame pode substituí-lo nas agregações.
+
+        Returns
+        -------
+        pd.DataFrame
+            Colunas ``id``, ``date``, ``horary``, ``description``,
+            ``category`` (category), ``account`` (Int64), ``value``
+            (centavos) e ``settled``; o DataFrame compartilha memória
+            com o lote e não deve ser alterado
+        """
+        return pd.DataFrame(
+            {
+                'id': self.ids,
+                'date': self.dates,
+                'horary': self.horaries,
+                'description': self.descriptions,
+                'category': pd.Categorical.from_codes(
+                    self.category_codes,
+                    dtype=pd.CategoricalDtype(self.categories),
+                    validate=False
+                ),
+                'account': pd.arrays.IntegerArray(
+                    self.accounts, self.account_mask
+                ),
+                'value': self.values,
+                'settled': self.settled
+            },
+            copy=False
+        )
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Expõe o lote como tabela do pyarrow.
+
+        As colunas numéricas sem valores ausentes (IDs, valores e
+        códigos de categoria) compartilham memória com o lote.
+
+        Returns
+        -------
+        pa.Table
+            Tabela com as colunas de ``to_frame``; a categoria é uma
+            coluna de dicionário
+        """
+        return pa.table({
+            'id': pa.array(self.ids),
+            'date': pa.array(self.dates, from_pandas=True),
+            'horary': pa.array(self.horaries, from_pandas=True),
+            'description': pa.array(
+                self.descriptions, type=pa.string(), from_pandas=True
+            ),
+            'category': pa.DictionaryArray.from_arrays(
+                pa.array(self.category_codes),
+                pa.array(self.categories, type=pa.string())
+            ),
+            'account': pa.array(self.accounts, mask=self.account_mask),
+            'value': pa.array(self.values),
+            'settled': pa.array(self.settled)
+        })
+
+    def top_recent(self, k: int) -> np.ndarray:
+        """
+        Obtém as posições das k movimentações mais recentes.
+
+        Parameters
+        ----------
+        k : int
+            Número de movimentações
+
+        Returns
+        -------
+        np.ndarray
+            Posições no lote, da mais recente para a mais antiga;
+            movimentações sem data ficam por último
+        """
+        # Datas e horários ausentes ordenam antes de qualquer valor
+        dates = self.dates.view(np.int64)
+        horaries = self.horaries.view(np.int64)
+        order = np.lexsort((horaries, dates))[::-1]
+        return order[:k]
+
+    def to_records(
+        self,
+        positions: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Converte movimentações do lote em dicionários tipados.
+
+        Parameters
+        ----------
+        positions : np.ndarray, optional
+            Posições convertidas; por padrão, todas
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Registros com ``value`` em Decimal, ``date`` em date,
+            ``horary`` em time e o campo de efetivação
+        """
+        if positions is None:
+            positions = np.arange(len(self))
+        records = []
+        for position in positions:
+            date_value = self.dates[position]
+            horary = self.horaries[position]
+            seconds = (
+                None if np.isnat(horary) else int(horary.astype(np.int64))
+            )
+            records.append({
+                'id': int(self.ids[position]),
+                'date': None if np.isnat(date_value) else (
+                    date_value.astype('datetime64[D]').item()
+                ),
+                'horary': None if seconds is None else time(
+                    seconds // 3600, seconds // 60 % 60, seconds % 60
+                ),
+                'description': self.descriptions[position],
+                'category': self.categories[self.category_codes[position]],
+                'account': None if self.account_mask[position] else int(
+                    self.accounts[position]
+                ),
+                'value': cents_to_decimal(self.values[position]),
+                self.status_field: bool(self.settled[position])
+            })
+        return records
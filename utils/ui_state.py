@@ -0,0 +1,169 @@
+"""
+Estado de interface por registro das páginas de listagem.
+
+Este módulo centraliza as marcações de interface de cada registro
+(popup de ações aberto, edição ou exclusão em andamento), antes
+gravadas diretamente no ``st.session_state`` com chaves como
+``edit_expense_{id}``. As marcações ficam agrupadas por página, são
+limitadas em quantidade e descartadas quando o registro sai da área
+visível da listagem ou quando o usuário muda de página.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Optional, Tuple
+
+import streamlit as st
+
+from config.settings import app_config
+
+
+# Chave do session_state com as marcações de todas as páginas
+SESSION_KEY = 'ui_state'
+
+
+class RecordUIState:
+    """
+    Marcações de interface dos registros de uma página.
+
+    Cada marcação é identificada pelo nome (ex.: ``edit``) e pelo ID do
+    registro e guarda apenas um booleano; os dados do registro vêm da
+    listagem. As marcações mais antigas são descartadas quando o limite
+    ``app_config.UI_STATE_MAX_ENTRIES`` é atingido.
+
+    Examples
+    --------
+    >>> state = ui_state.scope('expenses')
+    >>> state.set('edit', 42)
+    >>> state.is_set('edit', 42)
+    True
+    >>> state.clear('edit', 42)
+    """
+
+    def __init__(self, name: str):
+        """
+        Inicializa o estado da página.
+
+        Parameters
+        ----------
+        name : str
+            Nome da página (escopo das marcações)
+        """
+        self.name = name
+
+    def _entries(self) -> "OrderedDict[Tuple[str, int], bool]":
+        """
+        Obtém as marcações da página, da mais antiga para a mais recente.
+
+        Returns
+        -------
+        OrderedDict[Tuple[str, int], bool]
+            Marcações indexadas por nome e ID do registro
+        """
+        scopes = st.session_state.setdefault(SESSION_KEY, {})
+        return scopes.setdefault(self.name, OrderedDict())
+
+    def is_set(self, flag: str, record_id: int) -> bool:
+        """
+        Verifica se uma marcação está ativa.
+
+        Parameters
+        ----------
+        flag : str
+            Nome da marcação (ex.: ``actions``, ``edit``, ``delete``)
+        record_id : int
+            ID do registro
+
+        Returns
+        -------
+        bool
+            True se a marcação estiver ativa
+        """
+        return self._entries().get((flag, record_id), False)
+
+    def set(self, flag: str, record_id: int) -> None:
+        """
+        Ativa uma marcação, descartando as mais antigas além do limite.
+
+        Parameters
+        ----------
+        flag : str
+            Nome da marcação
+        record_id : int
+            ID do registro
+        """
+        entries = self._entries()
+        entries[(flag, record_id)] = True
+        entries.move_to_end((flag, record_id))
+        while len(entries) > app_config.UI_STATE_MAX_ENTRIES:
+            entries.popitem(last=False)
+
+    def clear(self, flag: str, record_id: int) -> None:
+        """
+        Desativa uma marcação.
+
+        Parameters
+        ----------
+        flag : str
+            Nome da marcação
+        record_id : int
+            ID do registro
+        """
+        self._entries().pop((flag, record_id), None)
+
+    def retain(self, record_ids: Iterable[int]) -> None:
+        """
+        Descarta as marcações de registros fora da área visível.
+
+        Parameters
+        ----------
+        record_ids : Iterable[int]
+            IDs dos registros exibidos
+        """
+        entries = self._entries()
+        visible = set(record_ids)
+        for key in [key for key in entries if key[1] not in visible]:
+            del entries[key]
+
+
+class UIStateManager:
+    """
+    Gerenciador das marcações de interface das páginas.
+
+    Apenas a página em exibição mantém marcações: ao mudar de página
+    (``activate``), as das demais são descartadas.
+    """
+
+    def scope(self, name: str) -> RecordUIState:
+        """
+        Obtém o estado de interface de uma página.
+
+        Parameters
+        ----------
+        name : str
+            Nome da página
+
+        Returns
+        -------
+        RecordUIState
+            Marcações da página
+        """
+        return RecordUIState(name)
+
+    def activate(self, name: Optional[str]) -> None:
+        """
+        Registra a página em exibição, descartando as marcações das demais.
+
+        Parameters
+        ----------
+        name : str, optional
+            Nome da página exibida; None para páginas sem marcações
+        """
+        scopes = st.session_state.get(SESSION_KEY)
+        if not scopes:
+            return
+        for scope in [scope for scope in scopes if scope != name]:
+            del scopes[scope]
+
+
+# Instância global do gerenciador
+ui_state = UIStateManager()
@@ -5,11 +5,16 @@ Este módulo padroniza mensagens, estilos e componentes visuais
 seguindo melhores práticas de UX/UI para o ExpenseLit.
 """
 
+import math
 import streamlit as st
 import time
-from datetime import datetime
+from streamlit.errors import StreamlitAPIException
+from datetime import date, datetime
 from typing import Any, Dict, Optional, List, Callable
-from config.settings import db_categories
+from config.settings import app_config, db_categories
+from utils.records import parse_date
+from utils.text_index import get_trigrams
+from utils.ui_state import RecordUIState
 
 
 class MessageStandards:
@@ -1060,6 +1065,239 @@ class UIComponents:
 
         return actions_performed
 
+    @staticmethod
+    def render_search_box(key: str, placeholder: str) -> str:
+        """
+        Renderiza a caixa de busca textual de uma listagem.
+
+        Alterar a busca volta a listagem à primeira página. Textos sem
+        letras ou números (ex.: ``"-"``) não formam trigramas e valem
+        como busca vazia, mantendo a listagem completa.
+
+        Parameters
+        ----------
+        key : str
+            Prefixo das chaves da listagem (o de ``render_windowed_list``)
+        placeholder : str
+            Texto de exemplo exibido na caixa vazia
+
+        Returns
+        -------
+        str
+            Texto buscado, sem espaços nas extremidades, ou string vazia
+            se não houver termos a buscar
+        """
+        query = st.text_input(
+            "🔍 Buscar",
+            placeholder=placeholder,
+            key=f"{key}_search",
+            on_change=UIComponents._reset_page,
+            args=(f"{key}_page",)
+        )
+        return query.strip() if get_trigrams(query) else ''
+
+    @staticmethod
+    def render_windowed_list(
+        records: List[Any],
+        key: str,
+        render_item: Callable[[Any], None],
+        date_field: Optional[str] = None,
+        state: Optional[RecordUIState] = None
+    ) -> None:
+        """
+        Renderiza uma listagem paginada, com widgets apenas da página atual.
+
+        Os controles de tamanho da página, página atual e (com
+        ``date_field``) salto para uma data ficam acima da listagem; a
+        posição é mantida no session_state entre execuções.
+
+        Cada registro é renderizado como fragmento: suas ações reexecutam
+        apenas o próprio registro (``rerun_fragment``), com os dados já
+        carregados. Alterações feitas nessas ações são informadas por
+        ``replace_list_record`` e valem até a próxima execução completa,
+        que recarrega a lista. Exclusões mudam a contagem e a paginação
+        e devem reexecutar a página inteira (``st.rerun()``).
+
+        Parameters
+        ----------
+        records : List[Any]
+            Registros da listagem, na ordem de exibição
+        key : str
+            Prefixo das chaves do session_state (ex.: ``expenses``)
+        render_item : Callable[[Any], None]
+            Função que renderiza um registro
+        date_field : str, optional
+            Campo de data usado pelo salto para uma data; sem ele, o
+            controle não é exibido
+        state : RecordUIState, optional
+            Marcações de interface da página; as dos registros fora da
+            página atual são descartadas
+        """
+        size_key = f"{key}_page_size"
+        page_key = f"{key}_page"
+        # A lista recebida já reflete as alterações feitas nos registros
+        st.session_state.pop(f"{key}_changes", None)
+
+        sizes = sorted(
+            set(app_config.LIST_PAGE_SIZES) | {app_config.LIST_PAGE_SIZE}
+        )
+        page_size = st.session_state.get(size_key, app_config.LIST_PAGE_SIZE)
+        pages = max(math.ceil(len(records) / page_size), 1)
+        # A listagem pode ter diminuído desde a última execução
+        if st.session_state.get(page_key, 1) > pages:
+            st.session_state[page_key] = pages
+
+        columns = st.columns([3, 1, 1, 2] if date_field else [3, 1, 1])
+        with columns[1]:
+            st.selectbox(
+                "Por página",
+                options=sizes,
+                index=sizes.index(app_config.LIST_PAGE_SIZE),
+                key=size_key,
+                on_change=UIComponents._reset_page,
+                args=(page_key,)
+            )
+        with columns[2]:
+            page = st.number_input(
+                "Página",
+                min_value=1,
+                max_value=pages,
+                step=1,
+                key=page_key
+            )
+        if date_field:
+            with columns[3]:
+                st.date_input(
+                    "📅 Ir para a data",
+                    value=None,
+                    format="DD/MM/YYYY",
+                    key=f"{key}_jump_date",
+                    on_change=UIComponents._jump_to_date,
+                    args=(records, key, date_field)
+                )
+
+        start = (page - 1) * page_size
+        visible = records[start:start + page_size]
+        with columns[0]:
+            st.caption(
+                f"Exibindo {start + 1}–{start + len(visible)} "
+                f"de {len(records)} registros"
+                if visible else "Nenhum registro"
+            )
+
+        if state is not None:
+            state.retain(record['id'] for record in visible)
+        for record in visible:
+            UIComponents._render_window_row(render_item, key, record)
+
+    @staticmethod
+    @st.fragment
+    def _render_window_row(
+        render_item: Callable[[Any], None],
+        key: str,
+        record: Any
+    ) -> None:
+        """
+        Renderiza um registro da listagem como fragmento.
+
+        Parameters
+        ----------
+        render_item : Callable[[Any], None]
+            Função que renderiza um registro
+        key : str
+            Prefixo das chaves do session_state
+        record : Any
+            Registro carregado com a listagem
+        """
+        changes = st.session_state.get(f"{key}_changes", {})
+        render_item(changes.get(record['id'], record))
+
+    @staticmethod
+    def rerun_fragment() -> None:
+        """
+        Reexecuta apenas o fragmento em que a interação ocorreu.
+
+        Se a interação for processada em uma execução completa da página
+        (ex.: junto com a alteração de um filtro), reexecuta a página.
+        """
+        try:
+            st.rerun(scope="fragment")
+        except StreamlitAPIException:
+            st.rerun()
+
+    @staticmethod
+    def replace_list_record(key: str, record: Any) -> None:
+        """
+        Substitui um registro exibido na listagem após uma alteração.
+
+        Parameters
+        ----------
+        key : str
+            Prefixo das chaves da listagem (o de ``render_windowed_list``)
+        record : Any
+            Versão atual do registro, como retornada pela API
+        """
+        st.session_state.setdefault(f"{key}_changes", {})[record['id']] = (
+            record
+        )
+
+    @staticmethod
+    def _reset_page(page_key: str) -> None:
+        """
+        Volta a listagem à primeira página (callback do tamanho e da busca).
+
+        Parameters
+        ----------
+        page_key : str
+            Chave da página atual no session_state
+        """
+        st.session_state[page_key] = 1
+
+    @staticmethod
+    def _jump_to_date(
+        records: List[Any],
+        key: str,
+        date_field: str
+    ) -> None:
+        """
+        Leva a listagem à página da data escolhida (callback do salto).
+
+        A listagem pode estar em ordem crescente ou decrescente de data;
+        a página escolhida é a do primeiro registro que alcança a data
+        nessa ordem.
+
+        Parameters
+        ----------
+        records : List[Any]
+            Registros da listagem, na ordem de exibição
+        key : str
+            Prefixo das chaves do session_state
+        date_field : str
+            Campo de data dos registros
+        """
+        target: Optional[date] = st.session_state.get(f"{key}_jump_date")
+        if target is None or not records:
+            return
+
+        dates = [parse_date(record.get(date_field)) for record in records]
+        known = [value for value in dates if value is not None]
+        if not known:
+            return
+        descending = known[0] >= known[-1]
+
+        position = len(records) - 1
+        for index, value in enumerate(dates):
+            if value is not None and (
+                value <= target if descending else value >= target
+            ):
+                position = index
+                break
+
+        page_size = st.session_state.get(
+            f"{key}_page_size", app_config.LIST_PAGE_SIZE
+        )
+        st.session_state[f"{key}_page"] = position // page_size + 1
+
 
 class ValidationMessages:
     """Mensagens de validação padronizadas."""